@@ -0,0 +1,509 @@
+#!/usr/bin/env python
+
+import asyncio
+import csv
+import datetime as dt
+import gc
+import io
+import os
+import sys
+import time
+import types
+import tracemalloc
+import timefix as tm
+
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def timeit(fn: Callable[[], Any], repeat: int = 3) -> float:
+
+    ##* best of, in seconds
+    best: float
+    best = float("inf")
+
+    for _ in range(repeat):
+
+        t: float
+        t = time.perf_counter()
+
+        fn()
+
+        best = min(best, time.perf_counter() - t)
+
+    return best
+
+def report(name: str, n: int, results: Dict[str, float]) -> None:
+
+    base: float
+    base = list(results.values())[0]
+
+    print(f"{name} ({n} items)")
+
+    for key, value in results.items():
+
+        print(f"    {key:<24} {value * 1e9 / n:>10.1f} ns/item {base / value:>8.2f}x")
+
+def sizeof(objects: List[Any], counts: Dict[str, List[int]]) -> int:
+
+    ##* getsizeof walked through containers and instance dicts, shared objects once
+    ##* the tz loader, classes, modules and functions are shared by every object, not retained by one
+    seen: set
+    seen = set()
+
+    stack: List[Any]
+    stack = list(objects)
+
+    total: int
+    total = 0
+
+    while stack:
+
+        value: Any
+        value = stack.pop()
+
+        if id(value) in seen or isinstance(value, (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, tm.CSVTimeZoneLoaderType)):
+
+            continue
+
+        seen.add(id(value))
+
+        size: int
+        size = sys.getsizeof(value)
+
+        total += size
+
+        count: List[int]
+        count = counts.setdefault(type(value).__name__, [ 0, 0 ])
+        count[0] += 1
+        count[1] += size
+
+        if isinstance(value, dict):
+
+            stack.extend(value.keys())
+            stack.extend(value.values())
+
+        elif isinstance(value, (list, tuple, set, frozenset)):
+
+            stack.extend(value)
+
+        elif hasattr(value, "__dict__"):
+
+            stack.append(vars(value))
+
+    return total
+
+def profile(fn: Callable[[], Any], n: int) -> Dict[str, Any]:
+
+    ##* warm the memos first, they are paid once and not per operation
+    for _ in range(3):
+
+        fn()
+
+    results: List[Any]
+    results = [ None ] * n
+
+    gc.collect()
+    tracemalloc.start()
+
+    ##* transient high water of a single operation
+    t: int
+    t = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+
+    fn()
+
+    peak: int
+    peak = tracemalloc.get_traced_memory()[1] - t
+
+    before: tracemalloc.Snapshot
+    before = tracemalloc.take_snapshot()
+
+    t = tracemalloc.get_traced_memory()[0]
+
+    for i in range(n):
+
+        results[i] = fn()
+
+    retained: int
+    retained = tracemalloc.get_traced_memory()[0] - t
+
+    after: tracemalloc.Snapshot
+    after = tracemalloc.take_snapshot()
+
+    tracemalloc.stop()
+
+    ##* net live blocks left behind, tracemalloc has no count of blocks allocated then freed
+    ##* throwaways show in the peak only, the snapshots themselves are filtered out
+    blocks: int
+    blocks = sum(stat.count_diff for stat in after.filter_traces([ tracemalloc.Filter(False, tracemalloc.__file__) ]).compare_to(before.filter_traces([ tracemalloc.Filter(False, tracemalloc.__file__) ]), "filename"))
+
+    counts: Dict[str, List[int]]
+    counts = {}
+
+    return {
+        "retained": retained / n,
+        "blocks": blocks / n,
+        "peak": peak,
+        "size": sizeof(results, counts) / n,
+        "types": counts,
+    }
+
+def report_memory(name: str, n: int, cases: Dict[str, Callable[[], Any]]) -> None:
+
+    """report_memory(name, n, {implementation: fn}) -> side by side, ratios against the first"""
+
+    results: Dict[str, Dict[str, Any]]
+    results = { key: profile(fn, n) for key, fn in cases.items() }
+
+    base: float
+    base = list(results.values())[0]["retained"]
+
+    print(f"{name} ({n} items), per operation")
+    print(f"    {'':<24} {'traced':>10} {'net blocks':>10} {'peak':>10} {'getsizeof':>10} {'vs first':>9}")
+
+    for key, value in results.items():
+
+        ##* nothing retained, no ratio to give
+        ratio: str
+        ratio = f"{base / value['retained']:>8.2f}x" if value['retained'] >= 1 else f"{'-':>9}"
+
+        print(f"    {key:<24} {value['retained']:>8.1f} B {value['blocks']:>10.2f} {value['peak']:>8} B {value['size']:>8.1f} B {ratio}")
+
+    ##* retained objects by type, count and bytes per operation
+    names: List[str]
+    names = sorted({ t for value in results.values() for t in value["types"] }, key=lambda t: -max(value["types"].get(t, [ 0, 0 ])[1] for value in results.values()))
+
+    print(f"    {'type':<24} " + " ".join(f"{key[:22]:>22}" for key in results))
+
+    for t in names:
+
+        ##* small ints and the like, shared through the caches
+        if all(value["types"].get(t, [ 0, 0 ])[1] < n / 10 for value in results.values()):
+
+            continue
+
+        cells: List[str]
+        cells = []
+
+        for value in results.values():
+
+            count: Tuple[int, int]
+            count = value["types"].get(t, [ 0, 0 ])
+
+            cells.append(f"{count[0] / n:>8.2f} x {count[1] / n:>9.1f} B")
+
+        print(f"    {t[:24]:<24} " + " ".join(cells))
+
+def bench_memory(n: int = 10000) -> None:
+
+    context: str
+    context = "2024-01-02 03:04:05"
+
+    d: tm.DateTimeType
+    d = tm.TimeFix.create_dt(context, tzname="WIB")
+
+    day: tm.DurationType
+    day = tm.Duration(days=1)
+
+    report_memory("create_dt", n, {
+        "create_dt": lambda: tm.TimeFix.create_dt(context, tzname="WIB"),
+        "create_lazy_dt": lambda: tm.TimeFix.create_lazy_dt(context, tzname="WIB"),
+    })
+
+    ##* a throwaway DateTime through __class__() and init() on every call
+    report_memory("shift one day", n, {
+        "enhance_tm_auto": lambda: d.enhance_tm_auto(days=1),
+        "+ Duration": lambda: d + day,
+    })
+
+    ##* a simulated clock stepping 1 ms
+    e: tm.DateTimeType
+    e = d.copy()
+
+    acc: tm.AccumulatorType
+    acc = tm.TimeFix.create_accumulator(d, step=1000)
+
+    report_memory("step 1 ms", n, {
+        "enhance_tm_ms (copy)": lambda: d.enhance_tm_ms(1),
+        "advance_ms (in place)": lambda: e.advance_ms(1),
+        "Accumulator.advance": lambda: acc.advance(),
+    })
+
+    report("step 1 ms", n, {
+        "enhance_tm_ms (copy)": timeit(lambda: [ d.enhance_tm_ms(1) for _ in range(n) ]),
+        "advance_ms (in place)": timeit(lambda: [ e.advance_ms(1) for _ in range(n) ]),
+        "Accumulator.advance": timeit(lambda: [ acc.advance() for _ in range(n) ]),
+    })
+
+    ##* to_str formats the fields it is given, the real ones here
+    fields: Tuple[int, ...]
+    fields = (d.get_year(), d.get_month(), d.get_day(), d.get_hours(), d.get_minutes(), d.get_seconds())
+
+    report_memory("to text", n, {
+        "to_str(fields)": lambda: d.to_str(*fields),
+        "str (compiled)": lambda: str(d),
+    })
+
+def bench_parser(n: int = 100000) -> None:
+
+    cases: List[Any]
+    cases = [
+        ("clf", "07/Jul/2002:10:00:00 +0700", "%d/%b/%Y:%H:%M:%S %z"),
+        ("rfc2822", "Sun, 07 Jul 2002 10:00:00 +0700", "%a, %d %b %Y %H:%M:%S %z"),
+        ("syslog", "Jul  7 10:00:00", "%b %d %H:%M:%S"),
+    ]
+
+    for name, context, strptime_pattern in cases:
+
+        values: List[str]
+        values = [ context ] * n
+
+        parser: tm.ParserType
+        parser = tm.TimeFix.compile_parser(name, years=2002)
+
+        report(f"parse {name}", n, {
+            "strptime": timeit(lambda: [ dt.datetime.strptime(value, strptime_pattern) for value in values ]),
+            "parse_many": timeit(lambda: parser.parse_many(values)),
+            "parse_instant": timeit(lambda: [ parser.parse_instant(value) for value in values ]),
+            "parse": timeit(lambda: [ parser.parse(value) for value in values ]),
+        })
+
+def legacy_get_td(rows: List[Dict[str, str]], tzname: str) -> str:
+
+    ##* the list of dicts scan CSVTimeZoneLoader used before columns
+    for row in rows:
+
+        if row["tzname"].lower() == tzname.lower():
+
+            return row["timedelta"] + "," + row["tzname"]
+
+    return ""
+
+def bench_tz_table(n: int = 100000) -> None:
+
+    data: str
+
+    ##* next to this file, wherever it is run from
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "_tz.csv"), "r") as f:
+
+        data = f.read()
+
+    ##* memory, retained after building
+    tracemalloc.start()
+
+    t: int
+    t = tracemalloc.get_traced_memory()[0]
+
+    rows: List[Dict[str, str]]
+    rows = [ row for row in csv.DictReader(io.StringIO(data), fieldnames=["country_code","tzname","tzinfo","timedelta"]) ]
+
+    legacy: int
+    legacy = tracemalloc.get_traced_memory()[0] - t
+
+    t = tracemalloc.get_traced_memory()[0]
+
+    ctz: tm.CSVTimeZoneLoaderType
+    ctz = tm.CSVTimeZoneLoader(tzfile=io.StringIO(data))
+
+    columns: int
+    columns = tracemalloc.get_traced_memory()[0] - t
+
+    tracemalloc.stop()
+
+    print(f"tz table ({len(rows)} rows)")
+    print(f"    {'list of dicts':<24} {legacy:>10} bytes")
+    print(f"    {'columns + index':<24} {columns:>10} bytes {legacy / columns:>8.2f}x")
+
+    names: List[str]
+    names = [ "CEST", "WIB", "PDT", "XXX" ]
+
+    for name in names:
+
+        report(f"get_td tzname={name}", n, {
+            "list of dicts scan": timeit(lambda: [ legacy_get_td(rows, name) for _ in range(n) ]),
+            "columns + index find": timeit(lambda: [ ctz.TZ_TABLE.find(["tzname"], [name]) for _ in range(n) ]),
+            "get_td": timeit(lambda: [ ctz.get_td(tzname=name) for _ in range(n) ]),
+        })
+
+def bench_to_dt_many(n: int = 1000000) -> None:
+
+    zones: List[str]
+    zones = [ "+0700,WIB", "+0900,JST", "-0400,EDT", "+0530,IST", "+0000,UTC", "+0200,CEST" ]
+
+    ##* mixed source zones, one target zone per user
+    values: List[tm.DateTimeType]
+    values = [ tm.TimeFix.from_instant(1700000000000000 + i * 37000000, zones[i % len(zones)]) for i in range(n) ]
+
+    targets: List[str]
+    targets = [ zones[i * 7 % 5] for i in range(n) ]
+
+    if tm.TimeFix.to_dt_many(values[:1000], targets[:1000]) != [ value.to_dt(target) for value, target in zip(values[:1000], targets[:1000]) ]:
+
+        raise AssertionError("to_dt_many differs from to_dt")
+
+    report("to_dt mixed zones", n, {
+        "to_dt": timeit(lambda: [ value.to_dt(target) for value, target in zip(values, targets) ], repeat=1),
+        "to_dt_many": timeit(lambda: tm.TimeFix.to_dt_many(values, targets), repeat=1),
+    })
+
+def bench_precision(n: int = 200000) -> None:
+
+    ##* same instants, microsecond vs nanosecond ticks
+    instants: List[int]
+    instants = [ 1700000000000000 + i * 37000001 for i in range(n) ]
+
+    us: tm.DateTimeColumnType
+    us = tm.TimeFix.create_column(instants, "+0700,WIB")
+
+    ns: tm.DateTimeColumnType
+    ns = tm.TimeFix.create_column([ value * 1000 + 123 for value in instants ], "+0700,WIB", precision="ns")
+
+    report("column fields", n, {
+        "us": timeit(us.fields),
+        "ns": timeit(ns.fields),
+    })
+
+    report("column shift_days", n, {
+        "us": timeit(lambda: us.shift_days(1)),
+        "ns": timeit(lambda: ns.shift_days(1)),
+    })
+
+    d: tm.DateTimeType
+    d = tm.TimeFix.from_instant(instants[0], "+0700,WIB")
+
+    e: tm.DateTimeType
+    e = tm.TimeFix.from_instant(instants[0] * 1000 + 123, "+0700,WIB", precision="ns")
+
+    def advance(step: Callable[[int], Any], by: int) -> None:
+
+        for _ in range(n):
+
+            step(by)
+
+    report("DateTime advance", n, {
+        "advance_us(1)": timeit(lambda: advance(d.advance_us, 1)),
+        "advance_ns(1000)": timeit(lambda: advance(e.advance_ns, 1000)),
+        "advance_ns(1)": timeit(lambda: advance(e.advance_ns, 1)),
+    })
+
+    report("Accumulator advance", n, {
+        "us": timeit(lambda: advance(tm.TimeFix.create_accumulator(d, 1).advance, 1)),
+        "ns": timeit(lambda: advance(tm.TimeFix.create_accumulator(e, 1, precision="ns").advance, 1)),
+    })
+
+async def stall(work: Any, tick: float = 0.001) -> float:
+
+    ##* longest the loop went without running a 1ms ticker, in seconds
+    loop: asyncio.AbstractEventLoop
+    loop = asyncio.get_running_loop()
+
+    worst: float
+    worst = 0.0
+
+    done: asyncio.Event
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+
+        nonlocal worst
+
+        last: float
+        last = loop.time()
+
+        while not done.is_set():
+
+            await asyncio.sleep(tick)
+
+            now: float
+            now = loop.time()
+
+            worst = max(worst, now - last - tick)
+            last = now
+
+    task: asyncio.Task
+    task = loop.create_task(ticker())
+
+    await asyncio.sleep(tick * 2)
+    await work()
+
+    done.set()
+    await task
+
+    return worst
+
+def bench_stream(n: int = 200000, target: float = 0.020) -> None:
+
+    records: List[Dict[str, Any]]
+    records = [ { "id": i, "ts": "2002-07-07T10:00:00.123456+0700", "at": 1026010800 + i } for i in range(n) ]
+
+    async def source() -> Any:
+
+        for record in records:
+
+            yield dict(record)
+
+    async def inline() -> None:
+
+        ##* one DateTime per value, on the loop, a batch at a time
+        batch: List[Dict[str, Any]]
+        batch = []
+
+        async for record in source():
+
+            batch.append(record)
+
+            if len(batch) >= 4096:
+
+                for item in batch:
+
+                    item["ts"] = tm.TimeFix.to_str(tm.TimeFix.create_dt(item["ts"]))
+
+                batch = []
+
+                await asyncio.sleep(0)
+
+    async def streamed() -> None:
+
+        normalizer: tm.StreamNormalizerType
+        normalizer = tm.TimeFix.create_stream(["ts", "at"], parser="%Y-%m-%dT%H:%M:%S.%f%z")
+
+        async for _ in normalizer.run(source()):
+
+            pass
+
+    print(f"stream ({n} records), event loop stall, target {target * 1000:.0f} ms")
+
+    for name, work in (("inline create_dt", inline), ("StreamNormalizer", streamed)):
+
+        t: float
+        t = time.perf_counter()
+
+        worst: float
+        worst = asyncio.run(stall(work))
+
+        t = time.perf_counter() - t
+
+        print(f"    {name:<24} {t * 1e9 / n:>10.1f} ns/item {worst * 1000:>8.2f} ms stall {'ok' if worst < target else 'over'}")
+
+def bench_oracle(n: int = 20000) -> None:
+
+    ##* correctness first, timings of the same run after
+    for result in tm.Oracle().run(samples=n):
+
+        print(result)
+
+
+if str(__name__).upper() in ("__MAIN__",):
+
+    ##* python bench.py memory, allocations only
+    if sys.argv[1:] == [ "memory" ]:
+
+        bench_memory()
+        sys.exit(0)
+
+    bench_parser()
+    bench_tz_table()
+    bench_to_dt_many()
+    bench_precision()
+    bench_stream()
+    bench_oracle()
@@ -1,4 +1,21 @@
 #!/usr/bin/env python
 
 from .singletons import *
-from .timefix import *
\ No newline at end of file
+from .kernel import *
+from .scope import *
+from .abbreviations import *
+from .accumulator import *
+from .clock import *
+from .formatter import *
+from .parser import *
+from .columns import *
+from .index import *
+from .interval import *
+from .business import *
+from .schedule import *
+from .storage import *
+from .stream import *
+from .worldclock import *
+from .parallel import *
+from .timefix import *
+from .oracle import *
@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+
+import sys
+
+from .oracle import Oracle
+
+##* python -m timefix [samples] [check ...], every check against stdlib
+if str(__name__).upper() in ("__MAIN__",):
+
+    n: int
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    for report in Oracle().run(names=sys.argv[2:] or None, samples=n):
+
+        print(report)
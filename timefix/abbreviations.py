@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+from typing import Any, Dict, Iterable, List, Tuple, TypeVar, Union
+from .singletons import AbbreviationIndexInitError, AbbreviationIndexType, CSVTimeZoneTableType
+
+
+AbbreviationIndex: Any
+AbbreviationIndex = TypeVar('AbbreviationIndex', bound='AbbreviationIndex')
+
+class AbbreviationIndex(AbbreviationIndexType):
+
+    ##* "CST" is china and the americas, "IST" india and ireland, the table keeps every row
+    ##* hints are country codes "IN" or regions "Europe", matched against each candidate row
+
+    TABLE: CSVTimeZoneTableType
+
+    ##* regions tried in order when no hint picks a row, then the first row like get_td
+    PREFER: Tuple[str, ...]
+
+    ##* (lowered tzname, lowered hint) -> (td_str, still ambiguous), built once
+    RESOLVED: Dict[Tuple[str, str], Tuple[str, bool]]
+
+    ##* lowered tzname -> lookups left with more than one offset to pick from
+    AMBIGUOUS: Dict[str, int]
+
+    def __init__(self: AbbreviationIndex, table: CSVTimeZoneTableType, prefer: Iterable[str] = ()) -> None:
+
+        self.TABLE = table
+        self.PREFER = tuple(region.lower() for region in prefer)
+        self.RESOLVED = {}
+        self.AMBIGUOUS = {}
+
+        for tzname, rows in table.INDEX["tzname"].items():
+
+            ##* rows without an offset cannot be resolved to anything
+            rows = tuple(i for i in rows if table.TIMEDELTA[i] and table.TZNAME[i])
+
+            if not tzname or not rows:
+
+                continue
+
+            ##* hint -> matching rows, in table order
+            hints: Dict[str, List[int]]
+            hints = {}
+
+            for i in rows:
+
+                hints.setdefault(table.COUNTRY_CODE[i].lower(), []).append(i)
+
+                region: str
+                region = table.TZINFO[i].split("/", 1)[0].lower()
+
+                if region:
+
+                    hints.setdefault(region, []).append(i)
+
+            for hint, matches in hints.items():
+
+                self.RESOLVED[(tzname, hint)] = self.pick(matches)
+
+            self.RESOLVED[(tzname, "")] = self.pick(rows)
+
+    def __repr__(self: AbbreviationIndex) -> str:
+
+        return f"<AbbreviationIndex bound keys({len(self.RESOLVED)}) prefer({self.PREFER}) at {hex(id(self))}>"
+
+    def td(self: AbbreviationIndex, i: int) -> str:
+
+        return self.TABLE.TIMEDELTA[i] + "," + self.TABLE.TZNAME[i]
+
+    def pick(self: AbbreviationIndex, rows: Iterable[int]) -> Tuple[str, bool]:
+
+        rows = list(rows)
+
+        first: int
+        first = rows[0]
+
+        for region in self.PREFER:
+
+            found: Union[int, None]
+            found = next((i for i in rows if self.TABLE.TZINFO[i].lower().startswith(region)), None)
+
+            if found is not None:
+
+                first = found
+                break
+
+        return (self.td(first), len(set(self.TABLE.TIMEDELTA[i] for i in rows)) > 1)
+
+    def candidates(self: AbbreviationIndex, tzname: str) -> List[Tuple[str, str, str]]:
+
+        """candidates(\"CST\") -> every (country_code, tzinfo, td_str) with that name, in table order"""
+
+        table: CSVTimeZoneTableType
+        table = self.TABLE
+
+        return [ (table.COUNTRY_CODE[i], table.TZINFO[i], self.td(i)) for i in table.INDEX["tzname"].get(tzname.lower(), ()) if table.TIMEDELTA[i] ]
+
+    def offsets(self: AbbreviationIndex, tzname: str) -> List[str]:
+
+        """offsets(\"CST\") -> [\"-0600,CST\", \"+0800,CST\"], distinct, in table order"""
+
+        return list(dict.fromkeys(td_str for _, _, td_str in self.candidates(tzname)))
+
+    def is_ambiguous(self: AbbreviationIndex, tzname: str) -> bool:
+
+        return len(self.offsets(tzname)) > 1
+
+    def resolve(self: AbbreviationIndex, tzname: str, hint: str = "") -> str:
+
+        """resolve(\"CST\", \"CN\" | \"America\" | \"\") -> td_str, an unknown hint falls back to no hint"""
+
+        key: str
+        key = tzname.lower()
+
+        found: Union[Tuple[str, bool], None]
+        found = self.RESOLVED.get((key, hint.lower())) if hint else None
+
+        if found is None:
+
+            found = self.RESOLVED.get((key, ""))
+
+            if found is None:
+
+                raise AbbreviationIndexInitError(f"No timezone found for {tzname}.")
+
+        if found[1]:
+
+            self.AMBIGUOUS[key] = self.AMBIGUOUS.get(key, 0) + 1
+
+        return found[0]
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+from typing import Any, Callable, Tuple, TypeVar, Union
+from .kernel import CalendarKernel
+from .singletons import AccumulatorInitError, AccumulatorType, DateTimeType, DurationType
+
+
+Accumulator: Any
+Accumulator = TypeVar('Accumulator', bound='Accumulator')
+
+class Accumulator(AccumulatorType):
+
+    ##* a running instant for tight loops, plain ints until a DateTime is asked for
+    ##* advance changes the accumulator, value builds a new DateTime, write moves one in place
+
+    ##* ticks since epoch in PRECISION
+    INSTANT: int
+    TIMEDELTA: str
+    PRECISION: str
+
+    ##* seconds east of UTC, for fields
+    OFFSET: int
+
+    ##* ticks added by each advance()
+    STEP: int
+
+    def __init__(self: Accumulator, start: Union[int, DateTimeType] = 0, step: Union[int, DurationType] = 1, td_str: str = "", precision: str = "us", create: Union[Callable[[int, str], DateTimeType], None] = None) -> None:
+
+        if precision not in CalendarKernel.TICKS:
+
+            raise AccumulatorInitError(f"Invalid precision {precision}")
+
+        self.PRECISION = precision
+
+        if isinstance(start, DateTimeType):
+
+            self.INSTANT = start.get_instant_ns() if precision == "ns" else start.get_instant()
+            self.TIMEDELTA = td_str or start.TIMEDELTA
+
+        else:
+
+            self.INSTANT = start
+            self.TIMEDELTA = td_str or "+0000,UTC"
+
+        self.STEP = self.ticks(step)
+        self.OFFSET = CalendarKernel.offset(self.TIMEDELTA)
+
+        self.__create = create
+
+    def __repr__(self: Accumulator) -> str:
+
+        return f"<Accumulator bound instant({self.INSTANT}) step({self.STEP}) precision(\"{self.PRECISION}\") at {hex(id(self))}>"
+
+    def __int__(self: Accumulator) -> int:
+
+        return self.INSTANT
+
+    def __iadd__(self: Accumulator, step: Union[int, DurationType]) -> AccumulatorType:
+
+        self.INSTANT += self.ticks(step)
+
+        return self
+
+    def ticks(self: Accumulator, step: Union[int, DurationType]) -> int:
+
+        """ticks(ticks | Duration) -> ticks in PRECISION"""
+
+        if isinstance(step, DurationType):
+
+            ##* months have no fixed length
+            if step.MONTHS:
+
+                raise AccumulatorInitError(f"Months can not be accumulated, use shift_months.")
+
+            ##* floored to the tick, a microsecond accumulator drops NANOSECONDS
+            return step.get_nanoseconds() * CalendarKernel.TICKS[self.PRECISION] // 1000000000
+
+        return step
+
+    def advance(self: Accumulator, n: int = 1) -> int:
+
+        """advance(n steps) -> the new instant"""
+
+        self.INSTANT += self.STEP * n
+
+        return self.INSTANT
+
+    def fields(self: Accumulator) -> Tuple[int, ...]:
+
+        """fields() -> (years, month, days, hours, minutes, seconds, fraction, weekday, yearday) local in TIMEDELTA"""
+
+        return CalendarKernel.fields(self.INSTANT, self.OFFSET, CalendarKernel.TICKS[self.PRECISION])
+
+    def value(self: Accumulator) -> DateTimeType:
+
+        """value() -> a new DateTime at the instant, in TIMEDELTA"""
+
+        if self.__create is None:
+
+            raise AccumulatorInitError(f"No create given.")
+
+        return self.__create(self.INSTANT, self.TIMEDELTA)
+
+    def write(self: Accumulator, d: DateTimeType) -> DateTimeType:
+
+        """write(DateTime) -> the same DateTime, moved in place to the instant"""
+
+        if self.PRECISION == "ns":
+
+            return d.advance_ns(self.INSTANT - d.get_instant_ns())
+
+        return d.advance_us(self.INSTANT - d.get_instant())
@@ -0,0 +1,357 @@
+#!/usr/bin/env python
+
+import array
+import bisect
+import csv
+import datetime as dt
+import io
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar, Union
+from .kernel import CalendarKernel
+from .singletons import BusinessCalendarInitError, BusinessCalendarType, DateTimeColumnType, DateTimeType
+
+
+BusinessCalendar: Any
+BusinessCalendar = TypeVar('BusinessCalendar', bound='BusinessCalendar')
+
+class BusinessCalendar(BusinessCalendarType):
+
+    ##* days are counted from 1970-01-01 like the kernel
+    ##* each year is compiled once, a bitmap of business days and prefix counts over it
+
+    COUNTRY_CODE: str
+
+    ##* weekdays(0, 6) off, monday is zero
+    WEEKEND: Tuple[int, ...]
+
+    HOLIDAYS: Dict[int, str]
+
+    def __init__(self: BusinessCalendar, country_code: str = "", holidays: Union[Dict[Any, str], Iterable[Any]] = (), weekend: Iterable[int] = (5, 6)) -> None:
+
+        self.COUNTRY_CODE = country_code.upper()
+        self.WEEKEND = tuple(sorted(set(weekend)))
+
+        if any(w < 0 or w > 6 for w in self.WEEKEND) or len(self.WEEKEND) > 6:
+
+            raise BusinessCalendarInitError(f"Invalid weekend {self.WEEKEND}")
+
+        names: Dict[Any, str]
+        names = holidays if isinstance(holidays, dict) else { holiday: "" for holiday in holidays }
+
+        self.HOLIDAYS = { self.day(holiday): name for holiday, name in names.items() }
+
+        ##* first compiled year, then per year (first day, bitmap, prefix counts), and business days before each year
+        self.__lo = 0
+        self.__years = []
+        self.__bases = []
+
+        ##* first day of each compiled year, and the day past the last one
+        self.__starts = []
+        self.__stop = 0
+
+    def __repr__(self: BusinessCalendar) -> str:
+
+        return f"<BusinessCalendar bound country_code(\"{self.COUNTRY_CODE}\") holidays({len(self.HOLIDAYS)}) weekend({self.WEEKEND}) at {hex(id(self))}>"
+
+    @classmethod
+    def from_csv(cls: BusinessCalendar, tzfile: Union[str, io.TextIOWrapper, io.StringIO], weekend: Iterable[int] = (5, 6)) -> Dict[str, BusinessCalendarType]:
+
+        """from_csv(\"country_code,YYYY-MM-DD[,name]\" rows) -> country_code -> BusinessCalendar"""
+
+        stream: Any
+        stream = open(tzfile, "r", newline="") if isinstance(tzfile, str) else tzfile
+
+        countries: Dict[str, Dict[int, str]]
+        countries = {}
+
+        try:
+
+            for row in csv.reader(stream):
+
+                if not row or row[0].startswith("#"):
+
+                    continue
+
+                if len(row) < 2:
+
+                    raise BusinessCalendarInitError(f"Invalid holiday row {row}")
+
+                countries.setdefault(row[0].strip().upper(), {})[cls.day(row[1].strip())] = row[2].strip() if len(row) > 2 else ""
+
+        finally:
+
+            if isinstance(tzfile, str):
+
+                stream.close()
+
+        return { country_code: cls(country_code=country_code, holidays=holidays, weekend=weekend) for country_code, holidays in countries.items() }
+
+    @classmethod
+    def day(cls: BusinessCalendar, value: Any) -> int:
+
+        """day(days since epoch | \"YYYY-MM-DD\" | dt.date | DateTime) -> days since epoch, local"""
+
+        if isinstance(value, int):
+
+            return value
+
+        if isinstance(value, str):
+
+            Y: int
+            m: int
+            d: int
+
+            try:
+
+                Y, m, d = int(value[:4]), int(value[5:7]), int(value[8:10])
+
+            except ValueError:
+
+                raise BusinessCalendarInitError(f"Invalid date {value}")
+
+            ##* days_from_civil rolls 2024-02-30 over into march, reject it here
+            if len(value) != 10 or value[4] != "-" or value[7] != "-" or not 1 <= m <= 12 or not 1 <= d <= CalendarKernel.days_in_month(Y, m):
+
+                raise BusinessCalendarInitError(f"Invalid date {value}")
+
+            return CalendarKernel.days_from_civil(Y, m, d)
+
+        if isinstance(value, DateTimeType):
+
+            value = value.DATETIME
+
+        if isinstance(value, dt.date):
+
+            return CalendarKernel.days_from_civil(value.year, value.month, value.day)
+
+        raise BusinessCalendarInitError(f"Invalid date {value!r}")
+
+    def compile(self: BusinessCalendar, years: int) -> Tuple[int, bytearray, array.array]:
+
+        z: int
+        z = CalendarKernel.days_from_civil(years, 1, 1)
+
+        n: int
+        n = 366 if CalendarKernel.is_leap(years) else 365
+
+        w: int
+        w = CalendarKernel.weekday(z)
+
+        WEEKEND: Tuple[int, ...]
+        WEEKEND = self.WEEKEND
+
+        HOLIDAYS: Dict[int, str]
+        HOLIDAYS = self.HOLIDAYS
+
+        bitmap: bytearray
+        bitmap = bytearray((w + i) % 7 not in WEEKEND and z + i not in HOLIDAYS for i in range(n))
+
+        ##* prefix[i] is business days before day i of the year
+        prefix: array.array
+        prefix = array.array("l", [ 0 ]) * (n + 1)
+
+        k: int
+        k = 0
+
+        for i in range(n):
+
+            k += bitmap[i]
+            prefix[i + 1] = k
+
+        return (z, bitmap, prefix)
+
+    def year(self: BusinessCalendar, years: int) -> int:
+
+        """year(years) -> slot of the compiled year, compiling the years in between on the way"""
+
+        if not self.__years:
+
+            self.__lo = years
+            self.__years.append(self.compile(years))
+            self.__bases.append(0)
+            self.__starts.append(self.__years[0][0])
+
+        while years < self.__lo:
+
+            self.__lo -= 1
+
+            compiled: Tuple[int, bytearray, array.array]
+            compiled = self.compile(self.__lo)
+
+            self.__years.insert(0, compiled)
+            self.__bases.insert(0, self.__bases[0] - compiled[2][-1])
+            self.__starts.insert(0, compiled[0])
+
+        while years >= self.__lo + len(self.__years):
+
+            last: Tuple[int, bytearray, array.array]
+            last = self.__years[-1]
+
+            self.__bases.append(self.__bases[-1] + last[2][-1])
+            self.__years.append(self.compile(self.__lo + len(self.__years)))
+            self.__starts.append(self.__years[-1][0])
+
+        self.__stop = self.__starts[-1] + len(self.__years[-1][1])
+
+        return years - self.__lo
+
+    def rank(self: BusinessCalendar, z: int) -> int:
+
+        """rank(day) -> business days before it, from an arbitrary origin, only differences matter"""
+
+        if not self.__starts or z < self.__starts[0] or z >= self.__stop:
+
+            self.year(CalendarKernel.civil_from_days(z)[0])
+
+        ##* compiled years are contiguous, no civil date needed
+        k: int
+        k = bisect.bisect_right(self.__starts, z) - 1
+
+        return self.__bases[k] + self.__years[k][2][z - self.__starts[k]]
+
+    def unrank(self: BusinessCalendar, r: int) -> int:
+
+        """unrank(rank) -> the business day with that rank"""
+
+        while r < self.__bases[0]:
+
+            self.year(self.__lo - 1)
+
+        while r >= self.__bases[-1] + self.__years[-1][2][-1]:
+
+            self.year(self.__lo + len(self.__years))
+
+        k: int
+        k = bisect.bisect_right(self.__bases, r) - 1
+
+        z: int
+        prefix: array.array
+        z, _, prefix = self.__years[k]
+
+        return z + bisect.bisect_right(prefix, r - self.__bases[k]) - 1
+
+    def is_business(self: BusinessCalendar, value: Any) -> bool:
+
+        z: int
+        z = self.day(value)
+
+        k: int
+        k = self.year(CalendarKernel.civil_from_days(z)[0])
+
+        return bool(self.__years[k][1][z - self.__years[k][0]])
+
+    def shift(self: BusinessCalendar, z: int, n: int) -> int:
+
+        ##* n > 0 the n-th business day after, n < 0 before, n == 0 rolls forward
+        if n > 0:
+
+            return self.unrank(self.rank(z + 1) + n - 1)
+
+        return self.unrank(self.rank(z) + n)
+
+    def add(self: BusinessCalendar, value: Any, n: int) -> Any:
+
+        """add(day | \"YYYY-MM-DD\" | dt.date | DateTime, business days) -> same kind, time of day kept"""
+
+        z: int
+        z = self.day(value)
+
+        k: int
+        k = self.shift(z, n)
+
+        if isinstance(value, int):
+
+            return k
+
+        if isinstance(value, str):
+
+            Y: int
+            m: int
+            d: int
+            Y, m, d = CalendarKernel.civil_from_days(k)
+
+            return CalendarKernel.DIGITS4[Y] + "-" + CalendarKernel.DIGITS2[m] + "-" + CalendarKernel.DIGITS2[d]
+
+        if isinstance(value, DateTimeType):
+
+            out: DateTimeType
+            out = value.copy()
+            out.DATETIME = value.DATETIME + dt.timedelta(days=k - z)
+
+            return out
+
+        return value + dt.timedelta(days=k - z)
+
+    def sub(self: BusinessCalendar, value: Any, n: int) -> Any:
+
+        return self.add(value, -n)
+
+    def count(self: BusinessCalendar, start: Any, stop: Any) -> int:
+
+        """count(start, stop) -> business days, start <= day < stop, negative if stop is before start"""
+
+        return self.rank(self.day(stop)) - self.rank(self.day(start))
+
+    def add_many(self: BusinessCalendar, values: Union[DateTimeColumnType, Iterable[int]], n: Union[int, Iterable[int]]) -> Union[DateTimeColumnType, array.array]:
+
+        """add_many(DateTimeColumn or days, business days, one or per row) -> DateTimeColumn(time of day kept) or days"""
+
+        days: array.array
+        days = values.days() if isinstance(values, DateTimeColumnType) else array.array("q", values)
+
+        counts: List[int]
+        counts = [ n ] * len(days) if isinstance(n, int) else list(n)
+
+        if len(counts) != len(days):
+
+            raise BusinessCalendarInitError(f"Got {len(counts)} counts for {len(days)} rows.")
+
+        shift: Callable[[int, int], int]
+        shift = self.shift
+
+        ##* the same (day, n) repeats a lot in date columns
+        cache: Dict[Tuple[int, int], int]
+        cache = {}
+
+        out: array.array
+        out = array.array("q", bytes(8 * len(days)))
+
+        for i, (z, k) in enumerate(zip(days, counts)):
+
+            key: Tuple[int, int]
+            key = (z, k)
+
+            found: Union[int, None]
+            found = cache.get(key)
+
+            if found is None:
+
+                found = shift(z, k)
+                cache[key] = found
+
+            out[i] = found
+
+        if isinstance(values, DateTimeColumnType):
+
+            return values.shift_days([ k - z for z, k in zip(days, out) ])
+
+        return out
+
+    def count_many(self: BusinessCalendar, start: Union[DateTimeColumnType, Iterable[int]], stop: Union[DateTimeColumnType, Iterable[int]]) -> array.array:
+
+        """count_many(starts, stops) -> business days per row, start <= day < stop"""
+
+        a: array.array
+        a = start.days() if isinstance(start, DateTimeColumnType) else array.array("q", start)
+
+        b: array.array
+        b = stop.days() if isinstance(stop, DateTimeColumnType) else array.array("q", stop)
+
+        if len(a) != len(b):
+
+            raise BusinessCalendarInitError(f"Columns have different lengths.")
+
+        rank: Callable[[int], int]
+        rank = self.rank
+
+        return array.array("q", [ rank(y) - rank(x) for x, y in zip(a, b) ])
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+import time
+
+from typing import Any, Callable, List, Tuple, TypeVar
+from .kernel import CalendarKernel
+from .singletons import ClockInitError, ClockType, DateTimeType, FormatterType
+
+
+Clock: Any
+Clock = TypeVar('Clock', bound='Clock')
+
+class Clock(ClockType):
+
+    SOURCES: List[str]
+    SOURCES = [ "wall", "monotonic" ]
+
+    TIMEDELTA: str
+
+    GRANULARITY: int
+    SOURCE: str
+
+    def __init__(self: Clock, td_str: str, create: Callable[[int, str], DateTimeType], formatter: FormatterType, granularity: int = 1000000, source: str = "wall") -> None:
+
+        if source not in self.SOURCES:
+
+            raise ClockInitError(f"Invalid clock source {source}")
+
+        if granularity < 1:
+
+            raise ClockInitError(f"Invalid clock granularity {granularity}")
+
+        ##* resolved once, for the lifetime of the clock
+        self.TIMEDELTA = td_str
+        self.GRANULARITY = granularity
+        self.SOURCE = source
+
+        self.__create = create
+        self.__formatter = formatter
+        self.__tail = "Z" if td_str.split(",", 1)[-1] == "UTC" else ""
+
+        ##* monotonic ticks, anchored on the wall clock once
+        self.__wall = time.time_ns() // 1000
+        self.__mono = time.monotonic_ns() // 1000
+
+        ##* (second, prefix), (granule, text), (granule, DateTime)
+        self.__second = (None, "")
+        self.__text = (None, "")
+        self.__dt = (None, None)
+
+    def __repr__(self: Clock) -> str:
+
+        return f"<Clock bound timedelta(\"{self.TIMEDELTA}\") granularity({self.GRANULARITY}) source(\"{self.SOURCE}\") at {hex(id(self))}>"
+
+    def now_instant(self: Clock) -> int:
+
+        """instant(microseconds since epoch), truncated to the granularity"""
+
+        t: int
+
+        if self.SOURCE == "wall":
+
+            t = time.time_ns() // 1000
+
+        else:
+
+            t = self.__wall + time.monotonic_ns() // 1000 - self.__mono
+
+        return t - t % self.GRANULARITY
+
+    def now(self: Clock) -> DateTimeType:
+
+        t: int
+        t = self.now_instant()
+
+        cache: Tuple[Any, Any]
+        cache = self.__dt
+
+        if cache[0] != t:
+
+            cache = (t, self.__create(t, self.TIMEDELTA))
+            self.__dt = cache
+
+        ##* callers may mutate it, hand out a copy
+        return cache[1].copy()
+
+    def now_str(self: Clock) -> str:
+
+        """like to_str, \"2002-07-07T10:00:00.123Z\""""
+
+        t: int
+        t = self.now_instant()
+
+        cache: Tuple[Any, str]
+        cache = self.__text
+
+        if cache[0] == t:
+
+            return cache[1]
+
+        S: int
+        f: int
+        S, f = divmod(t, 1000000)
+
+        second: Tuple[Any, str]
+        second = self.__second
+
+        if second[0] != S:
+
+            second = (S, self.__formatter.format_instant(S * 1000000, self.TIMEDELTA))
+            self.__second = second
+
+        D3: List[str]
+        D3 = CalendarKernel.DIGITS3
+
+        context: str
+        context = second[1]
+
+        if f:
+
+            context = context + "." + D3[f // 1000] + D3[f % 1000] if f % 1000 else context + "." + D3[f // 1000]
+
+        context = context + self.__tail
+
+        self.__text = (t, context)
+
+        return context
@@ -0,0 +1,349 @@
+#!/usr/bin/env python
+
+import array
+import itertools
+import math
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, TypeVar, Union
+from .kernel import CalendarKernel
+from .singletons import DateTimeColumnType, DateTimeInitError, DateTimeType, FormatterType
+
+
+DateTimeColumn: Any
+DateTimeColumn = TypeVar('DateTimeColumn', bound='DateTimeColumn')
+
+class DateTimeColumn(DateTimeColumnType):
+
+    ##* instants(ticks since epoch), one zone for the whole column
+    INSTANTS: array.array
+
+    TIMEDELTA: str
+
+    ##* "us" or "ns", int64 nanoseconds cover 1678 to 2262
+    PRECISION: str
+
+    def __init__(self: DateTimeColumn, instants: Iterable[int], td_str: str = "+0000,UTC", create: Union[Callable[[int, str], DateTimeType], None] = None, precision: str = "us") -> None:
+
+        if precision not in CalendarKernel.TICKS:
+
+            raise DateTimeInitError(f"Invalid precision {precision}")
+
+        self.INSTANTS = instants if isinstance(instants, array.array) and instants.typecode == "q" else array.array("q", instants)
+        self.TIMEDELTA = td_str
+        self.PRECISION = precision
+
+        self.__create = create
+        self.__ticks = CalendarKernel.TICKS[precision]
+
+    @classmethod
+    def from_epoch(cls: DateTimeColumn, values: Any, unit: str = "s", td_str: str = "+0000,UTC", create: Union[Callable[[int, str], DateTimeType], None] = None, precision: str = "us") -> DateTimeColumn:
+
+        """from_epoch(array.array, memoryview, numpy array or iterable of epoch numbers in unit)"""
+
+        if unit not in CalendarKernel.UNITS:
+
+            raise DateTimeInitError(f"Invalid unit {unit}")
+
+        if precision not in CalendarKernel.TICKS:
+
+            raise DateTimeInitError(f"Invalid precision {precision}")
+
+        mul: int
+        div: int
+        mul, div = CalendarKernel.UNITS[unit]
+
+        ##* units are to microseconds, rescale to the ticks asked for
+        mul = mul * CalendarKernel.TICKS[precision] // 1000000
+
+        g: int
+        g = math.gcd(mul, div)
+
+        mul, div = mul // g, div // g
+
+        out: array.array
+        out = array.array("q")
+
+        ##* numpy, scaled in one vectorised step, never imported here
+        if hasattr(values, "dtype") and hasattr(values, "astype"):
+
+            kind: str
+            kind = values.dtype.kind
+
+            if kind == "f":
+
+                values = (values * mul / div).round()
+
+            elif kind in ("i", "u"):
+
+                values = values.astype("int64") * mul // div if mul != 1 or div != 1 else values
+
+            elif kind == "M":
+
+                ##* datetime64 carries its own unit
+                values = values.astype(f"datetime64[{precision}]")
+
+            else:
+
+                raise DateTimeInitError(f"Invalid epoch dtype {values.dtype}")
+
+            out.frombytes(values.astype("int64").tobytes())
+
+            return cls(instants=out, td_str=td_str, create=create, precision=precision)
+
+        view: Union[memoryview, None]
+        view = memoryview(values) if isinstance(values, (array.array, memoryview, bytes, bytearray)) else None
+
+        if view is not None and view.ndim != 1:
+
+            raise DateTimeInitError(f"Invalid epoch buffer with {view.ndim} dimensions")
+
+        ##* int64 microseconds, a straight copy of the buffer
+        if view is not None and mul == div == 1 and view.format in ("q", "l") and view.itemsize == 8 and view.c_contiguous:
+
+            out.frombytes(view.cast("B"))
+
+            return cls(instants=out, td_str=td_str, create=create, precision=precision)
+
+        if view is None:
+
+            ##* plain iterables may mix ints and floats
+            out.extend([ value * mul // div if isinstance(value, int) else round(value * mul / div) for value in values ])
+
+        elif view.format in ("f", "d"):
+
+            out.extend([ round(value * mul / div) for value in view ])
+
+        elif mul == div == 1:
+
+            out.extend(view)
+
+        elif div == 1:
+
+            out.extend([ value * mul for value in view ])
+
+        else:
+
+            ##* floors, negatives included
+            out.extend([ value // div for value in view ])
+
+        return cls(instants=out, td_str=td_str, create=create, precision=precision)
+
+    def __repr__(self: DateTimeColumn) -> str:
+
+        return f"<DateTimeColumn bound rows({len(self)}) timedelta(\"{self.TIMEDELTA}\") at {hex(id(self))}>"
+
+    def __len__(self: DateTimeColumn) -> int:
+
+        return len(self.INSTANTS)
+
+    def __getitem__(self: DateTimeColumn, i: Union[int, slice]) -> Any:
+
+        if isinstance(i, slice):
+
+            return DateTimeColumn(instants=self.INSTANTS[i], td_str=self.TIMEDELTA, create=self.__create, precision=self.PRECISION)
+
+        ##* materialized only on access
+        if self.__create is None:
+
+            return self.INSTANTS[i]
+
+        return self.__create(self.INSTANTS[i], self.TIMEDELTA)
+
+    def __iter__(self: DateTimeColumn) -> Iterator[Any]:
+
+        for i in range(len(self)):
+
+            yield self[i]
+
+    def get_instant(self: DateTimeColumn, i: int) -> int:
+
+        return self.INSTANTS[i]
+
+    def fields(self: DateTimeColumn) -> Tuple[array.array, ...]:
+
+        """fields(years, month, days, hours, minutes, seconds, fraction(ticks)) as columns"""
+
+        T: int
+        T = self.__ticks
+
+        U: int
+        U = 86400 * T
+
+        o: int
+        o = CalendarKernel.offset(self.TIMEDELTA) * T
+
+        columns: Tuple[array.array, ...]
+        columns = tuple(array.array("q") for _ in range(7))
+
+        Y: array.array
+        m: array.array
+        d: array.array
+        H: array.array
+        M: array.array
+        S: array.array
+        f: array.array
+        Y, m, d, H, M, S, f = columns
+
+        ##* consecutive instants mostly share the same day
+        z0: Any
+        z0 = None
+
+        civil: Tuple[int, int, int]
+        civil = (0, 0, 0)
+
+        for instant in self.INSTANTS:
+
+            z: int
+            t: int
+            z, t = divmod(instant + o, U)
+
+            if z != z0:
+
+                civil = CalendarKernel.civil_from_days(z)
+                z0 = z
+
+            s: int
+            s, us = divmod(t, T)
+
+            Y.append(civil[0])
+            m.append(civil[1])
+            d.append(civil[2])
+            H.append(s // 3600)
+            M.append(s // 60 % 60)
+            S.append(s % 60)
+            f.append(us)
+
+        return columns
+
+    def to_str(self: DateTimeColumn, formatter: FormatterType) -> List[str]:
+
+        self.check(formatter)
+
+        format_instant: Callable[..., str]
+        format_instant = formatter.format_instant
+
+        td_str: str
+        td_str = self.TIMEDELTA
+
+        return [ format_instant(instant, td_str) for instant in self.INSTANTS ]
+
+    def format_many(self: DateTimeColumn, formatter: FormatterType, sep: str = "\n", out: Union[bytearray, None] = None) -> bytearray:
+
+        self.check(formatter)
+
+        return formatter.format_many(self.INSTANTS, td_str=self.TIMEDELTA, sep=sep, out=out)
+
+    def shift_months(self: DateTimeColumn, months: Union[int, Iterable[int]], policy: str = "clamp") -> DateTimeColumn:
+
+        """shift_months(months, one for all or one per row) on the local calendar, time of day kept"""
+
+        if policy not in CalendarKernel.POLICIES:
+
+            raise DateTimeInitError(f"Invalid shift policy {policy}")
+
+        o: int
+        o = CalendarKernel.offset(self.TIMEDELTA) * self.__ticks
+
+        U: int
+        U = 86400 * self.__ticks
+
+        civil_from_days: Callable[[int], Tuple[int, int, int]]
+        civil_from_days = CalendarKernel.civil_from_days
+
+        days_from_civil: Callable[[int, int, int], int]
+        days_from_civil = CalendarKernel.days_from_civil
+
+        shift: Callable[..., Tuple[int, int, int]]
+        shift = CalendarKernel.shift_months
+
+        out: array.array
+        out = array.array("q", bytes(8 * len(self.INSTANTS)))
+
+        ##* materialized so a longer months is caught too, zip would stop at the shorter
+        steps: Iterable[int]
+        steps = itertools.repeat(months, len(self.INSTANTS)) if isinstance(months, int) else list(months)
+
+        if not isinstance(months, int) and len(steps) != len(self.INSTANTS):
+
+            raise DateTimeInitError(f"Invalid months length {len(steps)}, expected {len(self.INSTANTS)}")
+
+        ##* billing runs hold few distinct (day, months) pairs
+        cache: Dict[Tuple[int, int], int]
+        cache = {}
+
+        i: int
+
+        for i, (instant, n) in enumerate(zip(self.INSTANTS, steps)):
+
+            z: int
+            t: int
+            z, t = divmod(instant + o, U)
+
+            key: Tuple[int, int]
+            key = (z, n)
+
+            shifted: Any
+            shifted = cache.get(key)
+
+            if shifted is None:
+
+                Y: int
+                m: int
+                d: int
+                Y, m, d = civil_from_days(z)
+
+                shifted = days_from_civil(*shift(Y, m, d, n, policy)) * U
+                cache[key] = shifted
+
+            out[i] = shifted + t - o
+
+        return DateTimeColumn(instants=out, td_str=self.TIMEDELTA, create=self.__create, precision=self.PRECISION)
+
+    def shift_years(self: DateTimeColumn, years: Union[int, Iterable[int]], policy: str = "clamp") -> DateTimeColumn:
+
+        return self.shift_months(years * 12 if isinstance(years, int) else [ n * 12 for n in years ], policy)
+
+    def days(self: DateTimeColumn) -> array.array:
+
+        """days(since epoch) of each row on the local calendar"""
+
+        o: int
+        o = CalendarKernel.offset(self.TIMEDELTA) * self.__ticks
+
+        U: int
+        U = 86400 * self.__ticks
+
+        return array.array("q", [ (instant + o) // U for instant in self.INSTANTS ])
+
+    def shift_days(self: DateTimeColumn, days: Union[int, Iterable[int]]) -> DateTimeColumn:
+
+        """shift_days(days, one for all or one per row), time of day kept"""
+
+        U: int
+        U = 86400 * self.__ticks
+
+        out: array.array
+
+        if isinstance(days, int):
+
+            out = array.array("q", [ instant + days * U for instant in self.INSTANTS ])
+
+        else:
+
+            ##* materialized so a longer days is caught too, zip would stop at the shorter
+            steps: List[int]
+            steps = list(days)
+
+            if len(steps) != len(self.INSTANTS):
+
+                raise DateTimeInitError(f"Invalid days length {len(steps)}, expected {len(self.INSTANTS)}")
+
+            out = array.array("q", [ instant + n * U for instant, n in zip(self.INSTANTS, steps) ])
+
+        return DateTimeColumn(instants=out, td_str=self.TIMEDELTA, create=self.__create, precision=self.PRECISION)
+
+    def check(self: DateTimeColumn, formatter: FormatterType) -> None:
+
+        if formatter.PRECISION != self.PRECISION:
+
+            raise DateTimeInitError(f"Formatter precision {formatter.PRECISION} does not match column precision {self.PRECISION}")
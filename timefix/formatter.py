@@ -0,0 +1,409 @@
+#!/usr/bin/env python
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar, Union
+from .kernel import CalendarKernel
+from .scope import CURRENT_ZONE
+from .singletons import CSVTimeZoneLoaderType, DateTimeType, FormatterInitError, FormatterType, ZoneScopeType
+
+
+Formatter: Any
+Formatter = TypeVar('Formatter', bound='Formatter')
+
+class Formatter(FormatterType):
+
+    ##* %Y %m %d %H %M %S     zero padded fields
+    ##* %e                    space padded day
+    ##* %f %6f %3f %9f        microseconds, milliseconds, nanoseconds
+    ##* %.f                   ".sss", ".ssssss", ".sssssssss" or nothing, like to_str
+    ##* %z %:z                +0700, +07:00
+    ##* %Z %#Z                tzname, "Z" only for UTC like to_str
+    ##* %b %B %a %A           month/weekday names
+    ##* %j %%                 yearday, percent sign
+
+    PRESETS: Dict[str, str]
+    PRESETS = {
+        "iso": "%Y-%m-%dT%H:%M:%S%#Z",
+        "iso_fraction": "%Y-%m-%dT%H:%M:%S%.f%#Z",
+        "iso_ms": "%Y-%m-%dT%H:%M:%S.%3f%#Z",
+        "iso_us": "%Y-%m-%dT%H:%M:%S.%6f%#Z",
+        "iso_ns": "%Y-%m-%dT%H:%M:%S.%9f%#Z",
+        "iso_offset": "%Y-%m-%dT%H:%M:%S%:z",
+        "iso_offset_ms": "%Y-%m-%dT%H:%M:%S.%3f%:z",
+        "iso_offset_us": "%Y-%m-%dT%H:%M:%S.%6f%:z",
+        "iso_offset_ns": "%Y-%m-%dT%H:%M:%S.%9f%:z",
+        "date": "%Y-%m-%d",
+        "time": "%H:%M:%S",
+        "clf": "%d/%b/%Y:%H:%M:%S %z",
+        "rfc2822": "%a, %d %b %Y %H:%M:%S %z",
+        "syslog": "%b %e %H:%M:%S",
+    }
+
+    ##* directive -> (expression, width)
+    DIRECTIVES: Dict[str, Tuple[str, int]]
+    DIRECTIVES = {
+        "Y": ("(D4[Y] if 0 <= Y < 10000 else str(Y).zfill(4))", 4),
+        "m": ("D2[m]", 2),
+        "d": ("D2[d]", 2),
+        "e": ("(D2[d] if d > 9 else \" \" + str(d))", 2),
+        "H": ("D2[H]", 2),
+        "M": ("D2[M]", 2),
+        "S": ("D2[S]", 2),
+        "f": ("D3[f // 1000] + D3[f % 1000]", 6),
+        "6f": ("D3[f // 1000] + D3[f % 1000]", 6),
+        "3f": ("D3[f // 1000]", 3),
+        "9f": ("D3[f // 1000] + D3[f % 1000] + D3[x]", 9),
+        ".f": ("((\".\" + D3[f // 1000] + D3[f % 1000] + D3[x]) if x else (\".\" + D3[f // 1000] + D3[f % 1000]) if f % 1000 else (\".\" + D3[f // 1000]) if f else \"\")", 10),
+        "z": ("(Z4[o] if o in Z4 else zone(o, False))", 5),
+        ":z": ("(Z5[o] if o in Z5 else zone(o, True))", 6),
+        "Z": ("n", 0),
+        "#Z": ("(\"Z\" if n == \"UTC\" else \"\")", 1),
+        "b": ("MN[m - 1]", 3),
+        "B": ("MF[m - 1]", 9),
+        "a": ("WN[w]", 3),
+        "A": ("WF[w]", 9),
+        "j": ("D3[j]", 3),
+    }
+
+    ##* shared offset strings, built on first use
+    ZONES: Dict[bool, Dict[int, str]]
+    ZONES = {}
+
+    PATTERN: str
+    WIDTH: int
+
+    ##* output depends on the zone name, not only the offset
+    NAMED: bool
+
+    ##* "us" or "ns", what format_instant reads its instants as
+    PRECISION: str
+
+    CTZ: Union[CSVTimeZoneLoaderType, None]
+
+    def __init__(self: Formatter, pattern: str, ctz: Union[CSVTimeZoneLoaderType, None] = None, month_names: Union[List[str], None] = None, month_fullnames: Union[List[str], None] = None, weekday_names: Union[List[str], None] = None, weekday_fullnames: Union[List[str], None] = None, precision: str = "us") -> None:
+
+        if precision not in CalendarKernel.TICKS:
+
+            raise FormatterInitError(f"Invalid precision {precision}")
+
+        self.PATTERN = self.PRESETS.get(pattern, pattern)
+        self.PRECISION = precision
+        self.CTZ = ctz
+
+        tokens: List[str]
+        tokens = self.tokenize(self.PATTERN)
+
+        names: Dict[str, Union[List[str], None]]
+        names = { "b": month_names, "B": month_fullnames, "a": weekday_names, "A": weekday_fullnames }
+
+        parts: List[str]
+        parts = []
+
+        self.WIDTH = 0
+        self.NAMED = False
+
+        self.__need_weekday = False
+        self.__need_yearday = False
+
+        for token in tokens:
+
+            if not token.startswith("%"):
+
+                parts.append(repr(token))
+                self.WIDTH += len(token)
+                continue
+
+            key: str
+            key = token[1:]
+
+            if key in names and names[key] is None:
+
+                raise FormatterInitError(f"No names given for {token}")
+
+            expression: str
+            width: int
+            expression, width = self.DIRECTIVES[key]
+
+            if key in ("Z", "#Z"):
+
+                self.NAMED = True
+
+            if key == "Z":
+
+                width = max([ len(name) for name in ctz.TZ_TABLE.INDEX["tzname"] ] + [ 3 ]) if ctz is not None else 8
+
+            if key in ("a", "A"):
+
+                self.__need_weekday = True
+
+            if key == "j":
+
+                self.__need_yearday = True
+
+            parts.append(expression)
+            self.WIDTH += width
+
+        scope: Dict[str, Any]
+        scope = {
+            "D2": CalendarKernel.DIGITS2,
+            "D3": CalendarKernel.DIGITS3,
+            "D4": CalendarKernel.DIGITS4,
+            "Z4": self.zones(False),
+            "Z5": self.zones(True),
+            "zone": self.zone,
+            "MN": [ name.title() for name in month_names or [] ],
+            "MF": [ name.title() for name in month_fullnames or [] ],
+            "WN": [ name.title() for name in weekday_names or [] ],
+            "WF": [ name.title() for name in weekday_fullnames or [] ],
+        }
+
+        ##* specialised once, per pattern
+        source: str
+        source = "def build(Y, m, d, H, M, S, f, w, j, o, n, x=0):\n    return \"\".join((" + ", ".join(parts) + ("," if len(parts) == 1 else "") + "))\n"
+
+        exec(source, scope)
+
+        self.__build = scope["build"]
+        self.__day = (None, 0, 0, 0, 0, 0)
+        self.__ns = precision == "ns"
+
+    def __repr__(self: Formatter) -> str:
+
+        return f"<Formatter bound pattern(\"{self.PATTERN}\") at {hex(id(self))}>"
+
+    def __call__(self: Formatter, value: Union[DateTimeType, int], td_str: str = "+0000,UTC") -> str:
+
+        if isinstance(value, DateTimeType):
+
+            return self.format(value)
+
+        return self.format_instant(value, td_str=td_str)
+
+    def tokenize(self: Formatter, pattern: str) -> List[str]:
+
+        tokens: List[str]
+        tokens = []
+
+        literal: str
+        literal = ""
+
+        i: int
+        i = 0
+
+        n: int
+        n = len(pattern)
+
+        while i < n:
+
+            c: str
+            c = pattern[i]
+
+            if c != "%":
+
+                literal += c
+                i += 1
+                continue
+
+            ##* longest directive first, %:z %#Z %3f %.f before %z %Z %f
+            for k in (3, 2, 1):
+
+                key: str
+                key = pattern[i + 1:i + 1 + k]
+
+                if len(key) == k and (key in self.DIRECTIVES or key == "%"):
+
+                    break
+
+            else:
+
+                raise FormatterInitError(f"Invalid directive at {i} in {pattern}")
+
+            if key == "%":
+
+                literal += "%"
+
+            else:
+
+                if literal:
+
+                    tokens.append(literal)
+                    literal = ""
+
+                tokens.append("%" + key)
+
+            i += 1 + len(key)
+
+        if literal:
+
+            tokens.append(literal)
+
+        return tokens
+
+    def zones(self: Formatter, colon: bool) -> Dict[int, str]:
+
+        if colon not in self.ZONES:
+
+            ##* every whole minute offset within a day
+            self.ZONES[colon] = { o: self.zone(o, colon) for o in range(-86340, 86400, 60) }
+
+        return self.ZONES[colon]
+
+    def zone(self: Formatter, o: int, colon: bool) -> str:
+
+        sign: str
+        sign = "-" if o < 0 else "+"
+
+        H: int
+        M: int
+        H, M = divmod(abs(o) // 60, 60)
+
+        return sign + CalendarKernel.DIGITS2[H] + (":" if colon else "") + CalendarKernel.DIGITS2[M]
+
+    def format(self: Formatter, d: DateTimeType) -> str:
+
+        scope: Union[ZoneScopeType, None]
+        scope = CURRENT_ZONE.get()
+
+        if scope is not None and scope.TIMEDELTA != d.TIMEDELTA:
+
+            ##* seen from the scope zone
+            return self.format_ticks(d.get_instant(), d.NANOSECONDS, scope.OFFSET, scope.TZ_NAME)
+
+        DATETIME: Any
+        DATETIME = d.DATETIME
+
+        o: int
+
+        if DATETIME.tzinfo is not None:
+
+            o = DATETIME.utcoffset() // CalendarKernel.ONE_SECOND
+
+        else:
+
+            o = CalendarKernel.offset(d.TIMEDELTA)
+
+        Y: int
+        m: int
+        Y = DATETIME.year
+        m = DATETIME.month
+
+        return self.__build(
+            Y,
+            m,
+            DATETIME.day,
+            DATETIME.hour,
+            DATETIME.minute,
+            DATETIME.second,
+            DATETIME.microsecond,
+            DATETIME.weekday() if self.__need_weekday else 0,
+            CalendarKernel.yearday(Y, m, DATETIME.day) if self.__need_yearday else 0,
+            o,
+            d.TZ_NAME,
+            d.NANOSECONDS
+        )
+
+    def format_instant(self: Formatter, instant: int, td_str: str = "") -> str:
+
+        """format_instant(instant, td_str, defaults to the current zone scope or UTC)"""
+
+        if not td_str:
+
+            td_str = self.scope_zone()
+
+        o: int
+        o = CalendarKernel.offset(td_str)
+
+        n: str
+        n = td_str.split(",", 1)[1] if "," in td_str else ""
+
+        x: int
+        x = 0
+
+        if self.__ns:
+
+            instant, x = divmod(instant, 1000)
+
+        return self.format_ticks(instant, x, o, n)
+
+    def format_ticks(self: Formatter, instant: int, x: int, o: int, n: str) -> str:
+
+        ##* instant(microseconds), nanoseconds below it, offset(seconds), tzname
+        z: int
+        t: int
+        z, t = divmod(instant + o * 1000000, CalendarKernel.US_PER_DAY)
+
+        ##* consecutive instants mostly share the same day
+        day: Tuple[Any, ...]
+        day = self.__day
+
+        if day[0] != z:
+
+            Y: int
+            m: int
+            d: int
+            Y, m, d = CalendarKernel.civil_from_days(z)
+
+            day = (z, Y, m, d, (z + 3) % 7, CalendarKernel.yearday(Y, m, d))
+
+            self.__day = day
+
+        S: int
+        f: int
+        S, f = divmod(t, 1000000)
+
+        return self.__build(day[1], day[2], day[3], S // 3600, S // 60 % 60, S % 60, f, day[4], day[5], o, n, x)
+
+    def format_fields(self: Formatter, fields: Tuple[int, ...], o: int = 0, n: str = "", x: int = 0) -> str:
+
+        """format_fields(CalendarKernel.fields(...) in microseconds, offset(seconds), tzname, nanoseconds below the microsecond)"""
+
+        return self.__build(*fields[:9], o, n, x)
+
+    def scope_zone(self: Formatter) -> str:
+
+        scope: Union[ZoneScopeType, None]
+        scope = CURRENT_ZONE.get()
+
+        return "+0000,UTC" if scope is None else scope.TIMEDELTA
+
+    def format_many(self: Formatter, values: Iterable[Union[DateTimeType, int]], td_str: str = "", sep: str = "\n", out: Union[bytearray, None] = None) -> bytearray:
+
+        if not td_str:
+
+            td_str = self.scope_zone()
+
+        seps: bytes
+        seps = sep.encode("utf-8")
+
+        size: int
+        size = len(values) * (self.WIDTH + len(seps)) if hasattr(values, "__len__") else 0
+
+        ##* one preallocated buffer, grows only if a value is wider than expected
+        ##* out keeps what it holds, the values are appended after it
+        buf: bytearray
+        buf = out if out is not None else bytearray()
+
+        pos: int
+        pos = len(buf)
+
+        buf.extend(bytes(size))
+
+        fmt: Callable[[Any], str]
+        fmt = self.format
+
+        fmi: Callable[..., str]
+        fmi = self.format_instant
+
+        for value in values:
+
+            data: bytes
+            data = ((fmt(value) if isinstance(value, DateTimeType) else fmi(value, td_str)) + sep).encode("utf-8")
+
+            k: int
+            k = len(data)
+
+            buf[pos:pos + k] = data
+            pos += k
+
+        del buf[pos:]
+
+        return buf
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+
+import array
+import bisect
+import datetime as dt
+import time
+
+from typing import Any, Callable, Iterable, Tuple, TypeVar, Union
+from .columns import DateTimeColumn
+from .kernel import CalendarKernel
+from .singletons import DateTimeColumnType, DateTimeInitError, DateTimeType, TimeIndexType
+
+
+TimeIndex: Any
+TimeIndex = TypeVar('TimeIndex', bound='TimeIndex')
+
+class TimeIndex(TimeIndexType):
+
+    ##* instants(ticks since epoch), always sorted
+    KEYS: array.array
+
+    ##* row id of each key, in the order they were added
+    ROWS: array.array
+
+    TIMEDELTA: str
+    PRECISION: str
+
+    def __init__(self: TimeIndex, instants: Iterable[Any] = (), td_str: str = "+0000,UTC", create: Union[Callable[[int, str], DateTimeType], None] = None, parse: Union[Callable[[str], dt.datetime], None] = None, precision: str = "us") -> None:
+
+        if precision not in CalendarKernel.TICKS:
+
+            raise DateTimeInitError(f"Invalid precision {precision}")
+
+        self.TIMEDELTA = td_str
+        self.PRECISION = precision
+
+        self.KEYS = array.array("q")
+        self.ROWS = array.array("q")
+
+        self.__create = create
+        self.__parse = parse
+        self.__ticks = CalendarKernel.TICKS[precision]
+        self.__offset = CalendarKernel.offset(td_str)
+
+        self.extend(instants)
+
+    def __repr__(self: TimeIndex) -> str:
+
+        return f"<TimeIndex bound rows({len(self)}) timedelta(\"{self.TIMEDELTA}\") at {hex(id(self))}>"
+
+    def __len__(self: TimeIndex) -> int:
+
+        return len(self.KEYS)
+
+    def __getitem__(self: TimeIndex, i: int) -> Any:
+
+        ##* by position in time order, materialized only on access
+        if self.__create is None:
+
+            return self.KEYS[i]
+
+        return self.__create(self.KEYS[i], self.TIMEDELTA)
+
+    def key(self: TimeIndex, value: Any) -> int:
+
+        """key(instant | DateTime | str | dt.datetime | (years, month, days, ...)) -> instant(ticks)"""
+
+        if isinstance(value, int):
+
+            return value
+
+        if isinstance(value, DateTimeType):
+
+            return value.get_instant_ns() if self.PRECISION == "ns" else value.get_instant()
+
+        if isinstance(value, tuple):
+
+            ##* local calendar fields in the index zone
+            return CalendarKernel.instant(*value[:6], microseconds=value[6] if len(value) > 6 else 0, offset=self.__offset, ticks=self.__ticks)
+
+        if isinstance(value, str):
+
+            if len(value) in (5, 8) and value[2] == ":":
+
+                ##* "09:00" or "09:00:00", today in the index zone
+                return self.today() + CalendarKernel.instant(1970, 1, 1, int(value[:2]), int(value[3:5]), int(value[6:8]) if len(value) == 8 else 0, ticks=self.__ticks)
+
+            if self.__parse is None:
+
+                raise DateTimeInitError("No parser given.")
+
+            ##* str_to_dt leaves "...Z" naive, it still means UTC
+            zulu: bool
+            zulu = value.endswith("Z")
+
+            value = self.__parse(value)
+
+            if zulu and value.tzinfo is None:
+
+                value = value.replace(tzinfo=dt.timezone.utc)
+
+        if isinstance(value, dt.datetime):
+
+            offset: int
+            offset = self.__offset if value.tzinfo is None else value.utcoffset() // CalendarKernel.ONE_SECOND
+
+            return CalendarKernel.instant(value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond * (self.__ticks // 1000000), offset, self.__ticks)
+
+        raise DateTimeInitError(f"Invalid bound {value!r}")
+
+    def today(self: TimeIndex) -> int:
+
+        """today(instant of local midnight in the index zone)"""
+
+        T: int
+        T = self.__ticks
+
+        o: int
+        o = self.__offset * T
+
+        return (time.time_ns() * T // 1000000000 + o) // (86400 * T) * (86400 * T) - o
+
+    def append(self: TimeIndex, value: Any, row: int = -1) -> int:
+
+        """append(value, row id, defaults to the count so far) -> position"""
+
+        instant: int
+        instant = self.key(value)
+
+        KEYS: array.array
+        KEYS = self.KEYS
+
+        if row < 0:
+
+            row = len(KEYS)
+
+        ##* in order, the common case, is a plain append
+        if not KEYS or KEYS[-1] <= instant:
+
+            KEYS.append(instant)
+            self.ROWS.append(row)
+
+            return len(KEYS) - 1
+
+        ##* late arrivals, after equal keys so ties keep arrival order
+        i: int
+        i = bisect.bisect_right(KEYS, instant)
+
+        KEYS.insert(i, instant)
+        self.ROWS.insert(i, row)
+
+        return i
+
+    def extend(self: TimeIndex, values: Iterable[Any]) -> None:
+
+        for value in values:
+
+            self.append(value)
+
+    def between(self: TimeIndex, start: Any = None, stop: Any = None) -> slice:
+
+        """between(start, stop) -> slice of positions, start <= instant < stop, None is open"""
+
+        lo: int
+        lo = 0 if start is None else bisect.bisect_left(self.KEYS, self.key(start))
+
+        hi: int
+        hi = len(self.KEYS) if stop is None else bisect.bisect_left(self.KEYS, self.key(stop))
+
+        return slice(lo, max(lo, hi))
+
+    def count(self: TimeIndex, start: Any = None, stop: Any = None) -> int:
+
+        s: slice
+        s = self.between(start, stop)
+
+        return s.stop - s.start
+
+    def rows(self: TimeIndex, start: Any = None, stop: Any = None) -> memoryview:
+
+        """rows(start, stop) -> row ids in time order, a view, release it before the next insert"""
+
+        return memoryview(self.ROWS)[self.between(start, stop)]
+
+    def instants(self: TimeIndex, start: Any = None, stop: Any = None) -> memoryview:
+
+        """instants(start, stop) -> sorted instants, a view, release it before the next insert"""
+
+        return memoryview(self.KEYS)[self.between(start, stop)]
+
+    def select(self: TimeIndex, start: Any = None, stop: Any = None) -> DateTimeColumnType:
+
+        """select(start, stop) -> DateTimeColumn, copied, for fields() and formatting"""
+
+        return DateTimeColumn(instants=self.KEYS[self.between(start, stop)], td_str=self.TIMEDELTA, create=self.__create, precision=self.PRECISION)
+
+    def bounds(self: TimeIndex) -> Tuple[int, int]:
+
+        if not self.KEYS:
+
+            raise DateTimeInitError("Empty index.")
+
+        return (self.KEYS[0], self.KEYS[-1])
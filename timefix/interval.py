@@ -0,0 +1,363 @@
+#!/usr/bin/env python
+
+import array
+import bisect
+
+from typing import Any, Iterable, Iterator, List, Tuple, TypeVar, Union
+from .singletons import DateTimeType, IntervalIndexType, IntervalInitError, IntervalType
+
+
+Interval: Any
+Interval = TypeVar('Interval', bound='Interval')
+
+class Interval(IntervalType):
+
+    ##* half open, START <= instant < STOP, instants in any one unit
+
+    START: int
+    STOP: int
+
+    def __init__(self: Interval, start: Union[int, DateTimeType], stop: Union[int, DateTimeType]) -> None:
+
+        ##* DateTimes from any zone, compared as instants
+        self.START = start.get_instant() if isinstance(start, DateTimeType) else start
+        self.STOP = stop.get_instant() if isinstance(stop, DateTimeType) else stop
+
+        if self.STOP < self.START:
+
+            raise IntervalInitError(f"Interval ends before it starts, {self.START} > {self.STOP}")
+
+    def __repr__(self: Interval) -> str:
+
+        return f"<Interval bound start({self.START}) stop({self.STOP}) at {hex(id(self))}>"
+
+    def __hash__(self: Interval) -> int:
+
+        return hash((self.START, self.STOP))
+
+    def __eq__(self: Interval, other: Any) -> bool:
+
+        if not isinstance(other, IntervalType):
+
+            return NotImplemented
+
+        return self.START == other.START and self.STOP == other.STOP
+
+    def __lt__(self: Interval, other: Any) -> bool:
+
+        if not isinstance(other, IntervalType):
+
+            return NotImplemented
+
+        return (self.START, self.STOP) < (other.START, other.STOP)
+
+    def __contains__(self: Interval, value: Any) -> bool:
+
+        if isinstance(value, IntervalType):
+
+            return self.START <= value.START and value.STOP <= self.STOP
+
+        if isinstance(value, DateTimeType):
+
+            value = value.get_instant()
+
+        return self.START <= value < self.STOP
+
+    def __and__(self: Interval, other: IntervalType) -> Union[IntervalType, None]:
+
+        return self.intersection(other)
+
+    def __or__(self: Interval, other: IntervalType) -> Union[IntervalType, None]:
+
+        return self.union(other)
+
+    def length(self: Interval) -> int:
+
+        return self.STOP - self.START
+
+    def overlaps(self: Interval, other: IntervalType) -> bool:
+
+        return self.START < other.STOP and other.START < self.STOP
+
+    def intersection(self: Interval, other: IntervalType) -> Union[IntervalType, None]:
+
+        """intersection(other) -> Interval, None if they do not overlap"""
+
+        start: int
+        start = max(self.START, other.START)
+
+        stop: int
+        stop = min(self.STOP, other.STOP)
+
+        return Interval(start, stop) if start < stop else None
+
+    def union(self: Interval, other: IntervalType) -> Union[IntervalType, None]:
+
+        """union(other) -> Interval, None if a gap is left between them"""
+
+        if self.STOP < other.START or other.STOP < self.START:
+
+            return None
+
+        return Interval(min(self.START, other.START), max(self.STOP, other.STOP))
+
+    def gap(self: Interval, other: IntervalType) -> Union[IntervalType, None]:
+
+        """gap(other) -> Interval between them, None if they overlap or touch"""
+
+        if self.STOP < other.START:
+
+            return Interval(self.STOP, other.START)
+
+        if other.STOP < self.START:
+
+            return Interval(other.STOP, self.START)
+
+        return None
+
+    @classmethod
+    def coalesce(cls: Interval, intervals: Iterable[Union[IntervalType, Tuple[int, int]]], adjacent: bool = True) -> Iterator[IntervalType]:
+
+        """coalesce(intervals sorted by start) -> merged Intervals, lazily, touching ones too if adjacent"""
+
+        start: Union[int, None]
+        start = None
+
+        stop: int
+        stop = 0
+
+        for value in intervals:
+
+            a: int
+            b: int
+            a, b = (value.START, value.STOP) if isinstance(value, IntervalType) else value
+
+            if start is None:
+
+                start, stop = a, b
+                continue
+
+            if a < start:
+
+                raise IntervalInitError(f"Intervals are not sorted by start, {a} after {start}")
+
+            if a < stop or adjacent and a == stop:
+
+                stop = max(stop, b)
+                continue
+
+            yield cls(start, stop)
+
+            start, stop = a, b
+
+        if start is not None:
+
+            yield cls(start, stop)
+
+
+IntervalIndex: Any
+IntervalIndex = TypeVar('IntervalIndex', bound='IntervalIndex')
+
+class IntervalIndex(IntervalIndexType):
+
+    ##* built once, rows sorted by start
+    STARTS: array.array
+    STOPS: array.array
+
+    ##* row id of each interval, in the order given
+    ROWS: array.array
+
+    ##* every stop sorted on its own, for counts
+    ENDS: array.array
+
+    def __init__(self: IntervalIndex, intervals: Iterable[Union[IntervalType, Tuple[int, int]]] = ()) -> None:
+
+        pairs: List[Tuple[int, int, int]]
+        pairs = []
+
+        for i, value in enumerate(intervals):
+
+            a: int
+            b: int
+            a, b = (value.START, value.STOP) if isinstance(value, IntervalType) else value
+
+            if b < a:
+
+                raise IntervalInitError(f"Interval ends before it starts, {a} > {b}")
+
+            pairs.append((a, b, i))
+
+        pairs.sort()
+
+        self.STARTS = array.array("q", [ pair[0] for pair in pairs ])
+        self.STOPS = array.array("q", [ pair[1] for pair in pairs ])
+        self.ROWS = array.array("q", [ pair[2] for pair in pairs ])
+        self.ENDS = array.array("q", sorted(self.STOPS))
+
+        ##* max stop under each node, leaves at size + i, an interval tree over the sorted starts
+        size: int
+        size = 1
+
+        while size < len(pairs):
+
+            size *= 2
+
+        tree: array.array
+        tree = array.array("q", [ -(1 << 63) ]) * (2 * size)
+
+        tree[size:size + len(pairs)] = self.STOPS
+
+        for k in range(size - 1, 0, -1):
+
+            tree[k] = max(tree[2 * k], tree[2 * k + 1])
+
+        self.__size = size
+        self.__tree = tree
+
+    def __repr__(self: IntervalIndex) -> str:
+
+        return f"<IntervalIndex bound rows({len(self)}) at {hex(id(self))}>"
+
+    def __len__(self: IntervalIndex) -> int:
+
+        return len(self.STARTS)
+
+    def __getitem__(self: IntervalIndex, i: int) -> IntervalType:
+
+        ##* by position in start order
+        return Interval(self.STARTS[i], self.STOPS[i])
+
+    def positions(self: IntervalIndex, start: int, stop: int) -> List[int]:
+
+        """positions(start, stop) -> positions, in start order, of the intervals overlapping [start, stop)"""
+
+        ##* only those starting before stop can overlap
+        hi: int
+        hi = bisect.bisect_left(self.STARTS, stop)
+
+        out: List[int]
+        out = []
+
+        ##* an empty or reversed window overlaps nothing
+        if not hi or stop <= start:
+
+            return out
+
+        tree: array.array
+        tree = self.__tree
+
+        size: int
+        size = self.__size
+
+        STOPS: array.array
+        STOPS = self.STOPS
+
+        ##* (node, first position, past the last position), subtrees ending by start are skipped
+        stack: List[Tuple[int, int, int]]
+        stack = [ (1, 0, size) ]
+
+        while stack:
+
+            k: int
+            lo: int
+            end: int
+            k, lo, end = stack.pop()
+
+            if lo >= hi or tree[k] <= start:
+
+                continue
+
+            ##* small subtrees are cheaper to scan than to descend
+            if end - lo <= 32:
+
+                out.extend([ i for i in range(lo, min(end, hi)) if STOPS[i] > start ])
+                continue
+
+            mid: int
+            mid = (lo + end) // 2
+
+            stack.append((2 * k + 1, mid, end))
+            stack.append((2 * k, lo, mid))
+
+        return out
+
+    def overlap(self: IntervalIndex, start: Any, stop: Any) -> array.array:
+
+        """overlap(start, stop) -> row ids of the intervals overlapping [start, stop)"""
+
+        ROWS: array.array
+        ROWS = self.ROWS
+
+        return array.array("q", [ ROWS[i] for i in self.positions(self.key(start), self.key(stop)) ])
+
+    def stab(self: IntervalIndex, instant: Any) -> array.array:
+
+        """stab(instant) -> row ids of the intervals holding it"""
+
+        instant = self.key(instant)
+
+        return self.overlap(instant, instant + 1)
+
+    def count(self: IntervalIndex, start: Any, stop: Any) -> int:
+
+        """count(start, stop) -> intervals overlapping [start, stop), from the sorted endpoints"""
+
+        start = self.key(start)
+        stop = self.key(stop)
+
+        if stop <= start:
+
+            return 0
+
+        ##* started before stop, minus those already over by start
+        return bisect.bisect_left(self.STARTS, stop) - bisect.bisect_right(self.ENDS, start)
+
+    def count_many(self: IntervalIndex, windows: Iterable[Union[IntervalType, Tuple[int, int]]]) -> array.array:
+
+        """count_many(windows) -> overlap count per window"""
+
+        STARTS: array.array
+        STARTS = self.STARTS
+
+        ENDS: array.array
+        ENDS = self.ENDS
+
+        out: array.array
+        out = array.array("q")
+
+        for window in windows:
+
+            a: int
+            b: int
+            a, b = (window.START, window.STOP) if isinstance(window, IntervalType) else window
+
+            out.append(bisect.bisect_left(STARTS, b) - bisect.bisect_right(ENDS, a) if a < b else 0)
+
+        return out
+
+    def overlap_many(self: IntervalIndex, windows: Iterable[Union[IntervalType, Tuple[int, int]]]) -> List[array.array]:
+
+        """overlap_many(windows) -> row ids per window"""
+
+        out: List[array.array]
+        out = []
+
+        for window in windows:
+
+            a: int
+            b: int
+            a, b = (window.START, window.STOP) if isinstance(window, IntervalType) else window
+
+            out.append(self.overlap(a, b))
+
+        return out
+
+    def coalesce(self: IntervalIndex, adjacent: bool = True) -> List[IntervalType]:
+
+        """coalesce() -> the union of every interval, as disjoint Intervals"""
+
+        return list(Interval.coalesce(zip(self.STARTS, self.STOPS), adjacent=adjacent))
+
+    def key(self: IntervalIndex, value: Any) -> int:
+
+        return value.get_instant() if isinstance(value, DateTimeType) else value
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+
+import datetime as dt
+
+from typing import Any, Dict, List, Tuple, TypeVar
+from .singletons import CalendarKernelType, DateTimeInitError
+
+
+CalendarKernel: Any
+CalendarKernel = TypeVar('CalendarKernel', bound='CalendarKernel')
+
+class CalendarKernel(CalendarKernelType):
+
+    ##* proleptic gregorian, days counted from 1970-01-01
+
+    DIGITS2: List[str]
+    DIGITS2 = [ str(i).zfill(2) for i in range(100) ]
+
+    DIGITS3: List[str]
+    DIGITS3 = [ str(i).zfill(3) for i in range(1000) ]
+
+    DIGITS4: List[str]
+    DIGITS4 = [ str(i).zfill(4) for i in range(10000) ]
+
+    ##* days before month, non leap year
+    YEARDAYS: List[int]
+    YEARDAYS = [ 0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334 ]
+
+    MONTHDAYS: List[int]
+    MONTHDAYS = [ 0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31 ]
+
+    US_PER_DAY: int
+    US_PER_DAY = 86400000000
+
+    ONE_SECOND: dt.timedelta
+    ONE_SECOND = dt.timedelta(seconds=1)
+
+    OFFSETS: Dict[str, int]
+    OFFSETS = {}
+
+    ##* precision -> ticks per second, instants are ticks since epoch
+    TICKS: Dict[str, int]
+    TICKS = { "us": 1000000, "ns": 1000000000 }
+
+    ##* epoch unit -> (multiply, divide) to microseconds
+    UNITS: Dict[str, Tuple[int, int]]
+    UNITS = { "s": (1000000, 1), "ms": (1000, 1), "us": (1, 1), "ns": (1, 1000) }
+
+    ##* end of month, 31 jan + 1 month is 28/29 feb (clamp) or 2/3 mar (overflow)
+    POLICIES: List[str]
+    POLICIES = [ "clamp", "overflow" ]
+
+    @classmethod
+    def is_leap(cls: CalendarKernel, years: int) -> bool:
+
+        return not years % 4 and (years % 100 != 0 or not years % 400)
+
+    @classmethod
+    def days_in_month(cls: CalendarKernel, years: int, month: int) -> int:
+
+        if month == 2 and cls.is_leap(years):
+
+            return 29
+
+        return cls.MONTHDAYS[month]
+
+    @classmethod
+    def days_from_civil(cls: CalendarKernel, years: int, month: int, days: int) -> int:
+
+        years -= month <= 2
+
+        era: int
+        era = years // 400
+
+        yoe: int
+        yoe = years - era * 400
+
+        doy: int
+        doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + days - 1
+
+        doe: int
+        doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+
+        return era * 146097 + doe - 719468
+
+    @classmethod
+    def civil_from_days(cls: CalendarKernel, z: int) -> Tuple[int, int, int]:
+
+        z += 719468
+
+        era: int
+        era = z // 146097
+
+        doe: int
+        doe = z - era * 146097
+
+        yoe: int
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+
+        doy: int
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+
+        mp: int
+        mp = (5 * doy + 2) // 153
+
+        days: int
+        days = doy - (153 * mp + 2) // 5 + 1
+
+        month: int
+        month = mp + 3 if mp < 10 else mp - 9
+
+        return (yoe + era * 400 + (month <= 2), month, days)
+
+    @classmethod
+    def weekday(cls: CalendarKernel, z: int) -> int:
+
+        """weekday(0, 6), monday is zero"""
+
+        ##* 1970-01-01 is thursday
+        return (z + 3) % 7
+
+    @classmethod
+    def yearday(cls: CalendarKernel, years: int, month: int, days: int) -> int:
+
+        """yearday(1, 366)"""
+
+        return cls.YEARDAYS[month] + days + (month > 2 and cls.is_leap(years))
+
+    @classmethod
+    def offset(cls: CalendarKernel, td_str: str) -> int:
+
+        """offset(seconds) from \"+0700\" or \"+0700,WIB\""""
+
+        seconds: Any
+        seconds = cls.OFFSETS.get(td_str)
+
+        if seconds is not None:
+
+            return seconds
+
+        sign: int
+        sign = -1 if td_str.startswith("-") else 1
+
+        digits: str
+        digits = td_str.split(",", 1)[0].lstrip("+-").replace(":", "")
+
+        if len(digits) != 4 or not digits.isdigit():
+
+            raise DateTimeInitError(f"Invalid timezone string {td_str}")
+
+        seconds = sign * (int(digits[:2]) * 3600 + int(digits[2:]) * 60)
+
+        cls.OFFSETS[td_str] = seconds
+
+        return seconds
+
+    @classmethod
+    def instant(cls: CalendarKernel, years: int, month: int, days: int, hours: int = 0, minutes: int = 0, seconds: int = 0, microseconds: int = 0, offset: int = 0, ticks: int = 1000000) -> int:
+
+        """instant(ticks since epoch) from local fields and offset(seconds), the fraction is in ticks too"""
+
+        return ((cls.days_from_civil(years, month, days) * 86400 + hours * 3600 + minutes * 60 + seconds - offset) * ticks) + microseconds
+
+    @classmethod
+    def fields(cls: CalendarKernel, instant: int, offset: int = 0, ticks: int = 1000000) -> Tuple[int, ...]:
+
+        """fields(years, month, days, hours, minutes, seconds, fraction(ticks), weekday, yearday)"""
+
+        z: int
+        t: int
+        z, t = divmod(instant + offset * ticks, 86400 * ticks)
+
+        Y: int
+        m: int
+        d: int
+        Y, m, d = cls.civil_from_days(z)
+
+        S: int
+        f: int
+        S, f = divmod(t, ticks)
+
+        H: int
+        M: int
+        H, S = divmod(S, 3600)
+        M, S = divmod(S, 60)
+
+        return (Y, m, d, H, M, S, f, (z + 3) % 7, cls.YEARDAYS[m] + d + (m > 2 and cls.is_leap(Y)))
+
+    @classmethod
+    def shift_months(cls: CalendarKernel, years: int, month: int, days: int, months: int, policy: str = "clamp") -> Tuple[int, int, int]:
+
+        """shift_months(years, month, days) by months, end of month by policy"""
+
+        m: int
+        m = month - 1 + months
+
+        years += m // 12
+        month = m % 12 + 1
+
+        n: int
+        n = 29 if month == 2 and cls.is_leap(years) else cls.MONTHDAYS[month]
+
+        if days <= n:
+
+            return (years, month, days)
+
+        if policy == "clamp":
+
+            return (years, month, n)
+
+        if policy == "overflow":
+
+            ##* at most 3 days past, never beyond the next month
+            return (years + (month == 12), month % 12 + 1, days - n)
+
+        raise DateTimeInitError(f"Invalid shift policy {policy}")
+
+    @classmethod
+    def shift_instant(cls: CalendarKernel, instant: int, months: int, offset: int = 0, policy: str = "clamp", ticks: int = 1000000) -> int:
+
+        """shift_instant(ticks since epoch) by months on the local calendar, time of day kept"""
+
+        o: int
+        o = offset * ticks
+
+        U: int
+        U = 86400 * ticks
+
+        z: int
+        t: int
+        z, t = divmod(instant + o, U)
+
+        return cls.days_from_civil(*cls.shift_months(*cls.civil_from_days(z), months, policy)) * U + t - o
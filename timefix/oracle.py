@@ -0,0 +1,437 @@
+#!/usr/bin/env python
+
+import datetime as dt
+import random
+import time
+
+from typing import Any, Callable, Dict, List, Tuple, TypeVar, Union
+from .kernel import CalendarKernel
+from .singletons import DateTimeType, OracleCheckType, OracleInitError, OracleReportType, OracleType
+from .timefix import Duration, TimeFix
+
+
+OracleCheck: Any
+OracleCheck = TypeVar('OracleCheck', bound='OracleCheck')
+
+class OracleCheck(OracleCheckType):
+
+    NAME: str
+
+    ##* simplest input, reproducers shrink towards it
+    MINIMAL: Tuple[Any, ...]
+
+    def __init__(self: OracleCheck, name: str, generate: Callable[[random.Random], Tuple[Any, ...]], candidate: Callable[..., Any], stdlib: Callable[..., Any], slow: Union[Callable[..., Any], None], minimal: Tuple[Any, ...]) -> None:
+
+        self.NAME = name
+        self.MINIMAL = minimal
+
+        self.generate = generate
+        self.candidate = candidate
+        self.stdlib = stdlib
+        self.slow = slow
+
+    def __repr__(self: OracleCheck) -> str:
+
+        return f"<OracleCheck bound name(\"{self.NAME}\") at {hex(id(self))}>"
+
+    def call(self: OracleCheck, fn: Callable[..., Any], value: Tuple[Any, ...]) -> Any:
+
+        ##* exceptions are results too, compared by type
+        try:
+
+            return fn(*value)
+
+        except Exception as e:
+
+            return e.__class__
+
+    def differs(self: OracleCheck, value: Tuple[Any, ...], reference: Callable[..., Any]) -> bool:
+
+        expected: Any
+        expected = self.call(reference, value)
+
+        ##* the reference rejects it, not a valid input
+        if isinstance(expected, type) and issubclass(expected, Exception):
+
+            return False
+
+        return self.call(self.candidate, value) != expected
+
+    def shrink(self: OracleCheck, value: Tuple[Any, ...], reference: Callable[..., Any]) -> Tuple[Any, ...]:
+
+        current: List[Any]
+        current = list(value)
+
+        changed: bool
+        changed = True
+
+        while changed:
+
+            changed = False
+
+            for i in range(len(current)):
+
+                target: Any
+                target = self.MINIMAL[i]
+
+                while current[i] != target:
+
+                    ##* straight to minimal, else halfway towards it
+                    step: Any
+                    step = target if not isinstance(current[i], int) else current[i] + (target - current[i]) // 2 if abs(target - current[i]) > 1 else target
+
+                    trial: List[Any]
+                    trial = list(current)
+                    trial[i] = target
+
+                    if self.differs(tuple(trial), reference):
+
+                        current = trial
+                        changed = True
+                        break
+
+                    trial[i] = step
+
+                    if step != current[i] and self.differs(tuple(trial), reference):
+
+                        current = trial
+                        changed = True
+                        continue
+
+                    break
+
+        return tuple(current)
+
+
+OracleReport: Any
+OracleReport = TypeVar('OracleReport', bound='OracleReport')
+
+class OracleReport(OracleReportType):
+
+    NAME: str
+    SAMPLES: int
+
+    ##* reference -> mismatch count
+    MISMATCHES: Dict[str, int]
+
+    ##* reference -> [(minimal input, candidate, expected)]
+    REPRODUCERS: Dict[str, List[Tuple[Any, ...]]]
+
+    ##* implementation -> ns per call
+    TIMINGS: Dict[str, float]
+
+    def __init__(self: OracleReport, name: str, samples: int) -> None:
+
+        self.NAME = name
+        self.SAMPLES = samples
+        self.MISMATCHES = {}
+        self.REPRODUCERS = {}
+        self.TIMINGS = {}
+
+    def __repr__(self: OracleReport) -> str:
+
+        return f"<OracleReport bound name(\"{self.NAME}\") samples({self.SAMPLES}) mismatches({self.MISMATCHES}) at {hex(id(self))}>"
+
+    def __str__(self: OracleReport) -> str:
+
+        lines: List[str]
+        lines = [ f"{self.NAME} ({self.SAMPLES} samples) {'PASS' if self.passed() else 'FAIL'}" ]
+
+        for key, value in self.MISMATCHES.items():
+
+            lines.append(f"    mismatches vs {key:<8} {value}")
+
+            for reproducer in self.REPRODUCERS.get(key, []):
+
+                lines.append(f"        {reproducer[0]!r}: got {reproducer[1]!r}, expected {reproducer[2]!r}")
+
+        for key, value in self.TIMINGS.items():
+
+            lines.append(f"    {key:<20} {value:>10.1f} ns/call")
+
+        return "\n".join(lines)
+
+    def passed(self: OracleReport, against: str = "stdlib") -> bool:
+
+        return self.MISMATCHES.get(against, 0) == 0
+
+
+Oracle: Any
+Oracle = TypeVar('Oracle', bound='Oracle')
+
+class Oracle(OracleType):
+
+    ##* candidate (accelerated) vs stdlib (trusted) vs slow (current DateTime)
+
+    CHECKS: Dict[str, OracleCheckType]
+
+    def __init__(self: Oracle, reproducers: int = 3) -> None:
+
+        self.REPRODUCERS = reproducers
+
+        d: DateTimeType
+        d = TimeFix.create_dt("1970-01-01T00:00:00Z")
+
+        parser: Any
+        parser = TimeFix.compile_parser("iso_fraction")
+
+        parser_ns: Any
+        parser_ns = TimeFix.compile_parser("iso_fraction", precision="ns")
+
+        checks: List[OracleCheckType]
+        checks = [
+            OracleCheck(
+                name="get_weekday",
+                generate=self.random_date,
+                candidate=lambda Y, m, D: CalendarKernel.weekday(CalendarKernel.days_from_civil(Y, m, D)),
+                stdlib=lambda Y, m, D: dt.date(Y, m, D).weekday(),
+                slow=lambda Y, m, D: d.get_weekday(years=Y, month=m, days=D),
+                minimal=(1970, 1, 1)
+            ),
+            OracleCheck(
+                name="get_yearday",
+                generate=self.random_date,
+                candidate=CalendarKernel.yearday,
+                stdlib=lambda Y, m, D: dt.date(Y, m, D).timetuple().tm_yday,
+                slow=lambda Y, m, D: d.get_yearday(years=Y, month=m, days=D),
+                minimal=(1970, 1, 1)
+            ),
+            OracleCheck(
+                name="get_mon",
+                generate=lambda rng: self.random_date(rng)[:2],
+                candidate=CalendarKernel.days_in_month,
+                stdlib=lambda Y, m: ((dt.date(Y + (m == 12), m % 12 + 1, 1)) - dt.date(Y, m, 1)).days,
+                slow=lambda Y, m: d.get_mon(years=Y, month=m),
+                minimal=(1970, 1)
+            ),
+            OracleCheck(
+                name="date_fix",
+                generate=self.random_shift,
+                candidate=lambda Y, m, D, H, M, S, f, sec: CalendarKernel.fields(CalendarKernel.instant(Y, m, D, H, M, S, f) + sec * 1000000)[:7],
+                stdlib=lambda Y, m, D, H, M, S, f, sec: self.unpack(dt.datetime(Y, m, D, H, M, S, f) + dt.timedelta(seconds=sec)),
+                slow=lambda Y, m, D, H, M, S, f, sec: self.unfix(d.date_fix(years=Y, month=m, days=D, hours=H, minutes=M, seconds=S + sec, milliseconds=f // 1000, microseconds=f % 1000)),
+                minimal=(1970, 1, 1, 0, 0, 0, 0, 0)
+            ),
+            OracleCheck(
+                name="enhance_tm_auto",
+                generate=self.random_shift,
+                candidate=lambda Y, m, D, H, M, S, f, sec: self.unpack((self.create(Y, m, D, H, M, S, f) + Duration(sec=sec)).DATETIME),
+                stdlib=lambda Y, m, D, H, M, S, f, sec: self.unpack(dt.datetime(Y, m, D, H, M, S, f) + dt.timedelta(seconds=sec)),
+                slow=lambda Y, m, D, H, M, S, f, sec: self.unpack(self.create(Y, m, D, H, M, S, f).enhance_tm_auto(sec=sec).DATETIME),
+                minimal=(1970, 1, 1, 0, 0, 0, 0, 0)
+            ),
+            OracleCheck(
+                name="advance_sec",
+                generate=self.random_shift,
+                candidate=lambda Y, m, D, H, M, S, f, sec: self.unpack(self.create(Y, m, D, H, M, S, f).advance_sec(sec).DATETIME),
+                stdlib=lambda Y, m, D, H, M, S, f, sec: self.unpack(dt.datetime(Y, m, D, H, M, S, f) + dt.timedelta(seconds=sec)),
+                slow=lambda Y, m, D, H, M, S, f, sec: self.unpack(self.create(Y, m, D, H, M, S, f).enhance_tm_auto(sec=sec).DATETIME),
+                minimal=(1970, 1, 1, 0, 0, 0, 0, 0)
+            ),
+            OracleCheck(
+                name="enhance_tm_sec",
+                generate=self.random_shift,
+                candidate=lambda Y, m, D, H, M, S, f, sec: self.unpack(self.create(Y, m, D, H, M, S, f).enhance_tm_sec(sec).DATETIME),
+                stdlib=lambda Y, m, D, H, M, S, f, sec: self.unpack(dt.datetime(Y, m, D, H, M, S, f) + dt.timedelta(seconds=sec)),
+                slow=lambda Y, m, D, H, M, S, f, sec: self.unpack(self.create(Y, m, D, H, M, S, f).enhance_tm_auto(sec=sec).DATETIME),
+                minimal=(1970, 1, 1, 0, 0, 0, 0, 0)
+            ),
+            OracleCheck(
+                name="shift_months",
+                generate=lambda rng: self.random_shift(rng)[:7] + (rng.randint(-240, 240),),
+                candidate=lambda Y, m, D, H, M, S, f, n: CalendarKernel.fields(CalendarKernel.shift_instant(CalendarKernel.instant(Y, m, D, H, M, S, f), n))[:7],
+                stdlib=lambda Y, m, D, H, M, S, f, n: self.unpack(self.add_months(dt.datetime(Y, m, D, H, M, S, f), n)),
+                slow=lambda Y, m, D, H, M, S, f, n: self.unpack(self.create(Y, m, D, H, M, S, f).enhance_tm_auto(month=n).DATETIME),
+                minimal=(1970, 1, 1, 0, 0, 0, 0, 0)
+            ),
+            OracleCheck(
+                name="str_to_dt",
+                generate=self.random_string,
+                candidate=lambda context: parser.parse_fields(context)[:7],
+                stdlib=lambda context: self.unpack(dt.datetime.fromisoformat(context)),
+                slow=lambda context: self.unpack(d.str_to_dt(context)),
+                minimal=("1970-01-01T00:00:00",)
+            ),
+            OracleCheck(
+                name="parse_ns",
+                generate=lambda rng: (self.random_string(rng)[0][:19] + "." + str(rng.randint(0, 999999999)).zfill(9) + "Z",),
+                candidate=lambda context: parser_ns.parse_instant(context)[0],
+                stdlib=lambda context: (dt.datetime.fromisoformat(context[:26] + "+00:00") - dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)) // dt.timedelta(microseconds=1) * 1000 + int(context[26:29]),
+                slow=lambda context: TimeFix.create_dt(context).get_instant_ns(),
+                minimal=("1970-01-01T00:00:00.000000000Z",)
+            ),
+            OracleCheck(
+                name="from_instant",
+                generate=self.random_instant,
+                candidate=lambda instant, hours: self.unpack(TimeFix.from_instant(instant, self.zone(hours)).DATETIME),
+                stdlib=lambda instant, hours: self.unpack(dt.datetime.fromtimestamp(0, self.zoneinfo(hours)) + dt.timedelta(microseconds=instant)),
+                slow=None,
+                minimal=(0, 0)
+            ),
+        ]
+
+        self.CHECKS = { check.NAME: check for check in checks }
+
+    def unpack(self: Oracle, d: dt.datetime) -> Tuple[int, ...]:
+
+        return (d.year, d.month, d.day, d.hour, d.minute, d.second, d.microsecond)
+
+    def unfix(self: Oracle, fields: Tuple[int, ...]) -> Tuple[int, ...]:
+
+        return fields[:6] + (fields[6] * 1000 + fields[7],)
+
+    def add_months(self: Oracle, d: dt.datetime, months: int) -> dt.datetime:
+
+        ##* clamp, by stepping back from the first of the next month
+        first: dt.date
+        first = dt.date(d.year + (d.month - 1 + months) // 12, (d.month - 1 + months) % 12 + 1, 1)
+
+        last: dt.date
+        last = dt.date(first.year + (first.month == 12), first.month % 12 + 1, 1) - dt.timedelta(days=1)
+
+        return d.replace(year=first.year, month=first.month, day=min(d.day, last.day))
+
+    def create(self: Oracle, Y: int, m: int, D: int, H: int, M: int, S: int, f: int) -> DateTimeType:
+
+        return TimeFix.from_instant(CalendarKernel.instant(Y, m, D, H, M, S, f))
+
+    def zone(self: Oracle, hours: int) -> str:
+
+        sign: str
+        sign = "-" if hours < 0 else "+"
+
+        return sign + CalendarKernel.DIGITS2[abs(hours)] + "00," + sign + CalendarKernel.DIGITS2[abs(hours)]
+
+    def zoneinfo(self: Oracle, hours: int) -> dt.tzinfo:
+
+        try:
+
+            import zoneinfo
+
+            ##* posix sign, Etc/GMT-7 is +07:00
+            return zoneinfo.ZoneInfo(f"Etc/GMT{-hours:+d}" if hours else "Etc/UTC")
+
+        except Exception:
+
+            return dt.timezone(dt.timedelta(hours=hours))
+
+    def random_date(self: Oracle, rng: random.Random) -> Tuple[int, int, int]:
+
+        Y: int
+        m: int
+        Y, m = rng.randint(1, 9999), rng.randint(1, 12)
+
+        return (Y, m, rng.randint(1, CalendarKernel.days_in_month(Y, m)))
+
+    def random_shift(self: Oracle, rng: random.Random) -> Tuple[int, ...]:
+
+        ##* stays within a few years of 1900..2100, mktime needs it
+        Y: int
+        m: int
+        D: int
+        Y, m, D = self.random_date(rng)
+        Y = 1900 + Y % 200
+
+        D = min(D, CalendarKernel.days_in_month(Y, m))
+
+        return (Y, m, D, rng.randint(0, 23), rng.randint(0, 59), rng.randint(0, 59), rng.choice((0, rng.randint(0, 999999))), rng.randint(-10 ** rng.randint(0, 8), 10 ** rng.randint(0, 8)))
+
+    def random_string(self: Oracle, rng: random.Random) -> Tuple[str]:
+
+        Y: int
+        m: int
+        D: int
+        Y, m, D = self.random_date(rng)
+        Y = max(Y, 1000)
+
+        D = min(D, CalendarKernel.days_in_month(Y, m))
+
+        context: str
+        context = f"{Y}-{CalendarKernel.DIGITS2[m]}-{CalendarKernel.DIGITS2[D]}T{CalendarKernel.DIGITS2[rng.randint(0, 23)]}:{CalendarKernel.DIGITS2[rng.randint(0, 59)]}:{CalendarKernel.DIGITS2[rng.randint(0, 59)]}"
+        context += rng.choice(("", "." + CalendarKernel.DIGITS3[rng.randint(0, 999)], "." + str(rng.randint(0, 999999)).zfill(6)))
+        context += rng.choice(("", "Z"))
+
+        return (context,)
+
+    def random_instant(self: Oracle, rng: random.Random) -> Tuple[int, int]:
+
+        return (rng.randint(-2208988800000000, 4102444800000000), rng.randint(-12, 14))
+
+    def run(self: Oracle, names: Union[List[str], None] = None, samples: int = 100000, seed: int = 0) -> List[OracleReportType]:
+
+        reports: List[OracleReportType]
+        reports = []
+
+        for name in names or list(self.CHECKS):
+
+            if name not in self.CHECKS:
+
+                raise OracleInitError(f"Invalid check {name}")
+
+            check: OracleCheckType
+            check = self.CHECKS[name]
+
+            rng: random.Random
+            rng = random.Random(seed)
+
+            values: List[Tuple[Any, ...]]
+            values = [ check.generate(rng) for _ in range(samples) ]
+
+            report: OracleReportType
+            report = OracleReport(name=name, samples=samples)
+
+            references: Dict[str, Callable[..., Any]]
+            references = { "stdlib": check.stdlib }
+
+            if check.slow is not None:
+
+                references["slow"] = check.slow
+
+            for key, reference in references.items():
+
+                found: List[Tuple[Any, ...]]
+                found = [ value for value in values if check.differs(value, reference) ]
+
+                report.MISMATCHES[key] = len(found)
+                report.REPRODUCERS[key] = []
+
+                seen: set
+                seen = set()
+
+                for value in found:
+
+                    if len(report.REPRODUCERS[key]) >= self.REPRODUCERS:
+
+                        break
+
+                    minimal: Tuple[Any, ...]
+                    minimal = check.shrink(value, reference)
+
+                    if minimal in seen:
+
+                        continue
+
+                    seen.add(minimal)
+                    report.REPRODUCERS[key].append((minimal, check.call(check.candidate, minimal), check.call(reference, minimal)))
+
+            ##* same inputs, same run
+            for key, fn in [ ("candidate", check.candidate) ] + list(references.items()):
+
+                t: float
+                t = time.perf_counter()
+
+                for value in values:
+
+                    check.call(fn, value)
+
+                report.TIMINGS[key] = (time.perf_counter() - t) * 1e9 / max(1, samples)
+
+            reports.append(report)
+
+        return reports
+
+    def gate(self: Oracle, name: str, samples: int = 100000, seed: int = 0) -> bool:
+
+        """gate(name) -> True when the candidate matches stdlib on every sample"""
+
+        return self.run(names=[ name ], samples=samples, seed=seed)[0].passed()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+
+import array
+
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Tuple, TypeVar, Union
+from .kernel import CalendarKernel
+from .singletons import DateTimeColumnType, ParallelInitError, ParallelResultType, ParallelWorkerType
+
+
+ParallelResult: Any
+ParallelResult = TypeVar('ParallelResult', bound='ParallelResult')
+
+class ParallelResult(ParallelResultType):
+
+    ##* DateTimeColumn for "instant", list of str for "str"
+    VALUES: Union[DateTimeColumnType, List[str]]
+
+    ##* 1 valid, 0 the chunk failed
+    VALID: bytearray
+
+    ##* (start, stop, error)
+    ERRORS: List[Tuple[int, int, str]]
+
+    def __init__(self: ParallelResult, values: Union[DateTimeColumnType, List[str]], valid: bytearray, errors: List[Tuple[int, int, str]]) -> None:
+
+        self.VALUES = values
+        self.VALID = valid
+        self.ERRORS = errors
+
+    def __repr__(self: ParallelResult) -> str:
+
+        return f"<ParallelResult bound rows({len(self.VALID)}) errors({len(self.ERRORS)}) at {hex(id(self))}>"
+
+    def __len__(self: ParallelResult) -> int:
+
+        return len(self.VALID)
+
+
+ParallelWorker: Any
+ParallelWorker = TypeVar('ParallelWorker', bound='ParallelWorker')
+
+class ParallelWorker(ParallelWorkerType):
+
+    ##* per process state, set once by init()
+
+    UNITS: Dict[str, Tuple[int, int]]
+    UNITS = CalendarKernel.UNITS
+
+    OPTIONS: Dict[str, Any]
+    OPTIONS = {}
+
+    @classmethod
+    def init(cls: ParallelWorker, options: Dict[str, Any]) -> None:
+
+        ##* imported here, timefix.py imports this module
+        from .timefix import CSVTimeZoneLoaderRegistry, TimeFix
+
+        if options["tzfile"]:
+
+            TimeFix.CTZ = CSVTimeZoneLoaderRegistry.get(path=options["tzfile"])
+
+        cls.OPTIONS = dict(options)
+        cls.OPTIONS["create_dt"] = TimeFix.create_dt
+        cls.OPTIONS["parser"] = TimeFix.compile_parser(options["parser"]) if options["parser"] else None
+        cls.OPTIONS["formatter"] = TimeFix.compile_format(options["pattern"]) if options["op"] == "str" else None
+
+    @classmethod
+    def instant(cls: ParallelWorker, value: Any) -> int:
+
+        if isinstance(value, str):
+
+            if cls.OPTIONS["parser"] is not None:
+
+                return cls.OPTIONS["parser"].parse_instant(value)[0]
+
+            return cls.OPTIONS["create_dt"](value).get_instant()
+
+        mul: int
+        div: int
+        mul, div = cls.UNITS[cls.OPTIONS["unit"]]
+
+        if isinstance(value, float):
+
+            return round(value * mul / div)
+
+        return value * mul // div
+
+    @classmethod
+    def run(cls: ParallelWorker, job: Tuple[int, List[Any]]) -> Tuple[int, int, str]:
+
+        start: int
+        values: List[Any]
+        start, values = job
+
+        shm: shared_memory.SharedMemory
+        shm = shared_memory.SharedMemory(name=cls.OPTIONS["shm"])
+
+        try:
+
+            if cls.OPTIONS["op"] == "instant":
+
+                column: array.array
+                column = array.array("q", [ cls.instant(value) for value in values ])
+
+                ##* cast only once the chunk is known good
+                out: memoryview
+                out = shm.buf.cast("q")
+                out[start:start + len(values)] = column
+                out.release()
+
+            else:
+
+                width: int
+                width = cls.OPTIONS["width"]
+
+                formatter: Any
+                formatter = cls.OPTIONS["formatter"]
+
+                td_str: str
+                td_str = cls.OPTIONS["td_str"]
+
+                data: bytes
+                data = b"".join([ formatter.format_instant(cls.instant(value), td_str).encode("utf-8")[:width].ljust(width, b"\0") for value in values ])
+
+                shm.buf[start * width:(start + len(values)) * width] = data
+
+            return (start, start + len(values), "")
+
+        except Exception as e:
+
+            ##* the chunk fails alone, others keep going
+            return (start, start + len(values), f"{e.__class__.__name__}: {e}")
+
+        finally:
+
+            shm.close()
+
+    @classmethod
+    def check(cls: ParallelWorker, op: str, unit: str) -> None:
+
+        if op not in ("instant", "str"):
+
+            raise ParallelInitError(f"Invalid op {op}")
+
+        if unit not in cls.UNITS:
+
+            raise ParallelInitError(f"Invalid unit {unit}")
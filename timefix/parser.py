@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+
+import array
+import datetime as dt
+import re
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar
+from .kernel import CalendarKernel
+from .singletons import AbbreviationIndexInitError, CSVTimeZoneLoaderInitError, CSVTimeZoneLoaderType, DateTimeInitError, DateTimeType, ParserInitError, ParserType
+
+
+Parser: Any
+Parser = TypeVar('Parser', bound='Parser')
+
+class Parser(ParserType):
+
+    ##* same directives as Formatter, read the other way around
+    ##* %a %A %j are matched but not used, the date wins
+
+    PRESETS: Dict[str, str]
+    PRESETS = {
+        "iso": "%Y-%m-%dT%H:%M:%S%#Z",
+        "iso_fraction": "%Y-%m-%dT%H:%M:%S%.f%#Z",
+        "iso_offset": "%Y-%m-%dT%H:%M:%S%.f%:z",
+        "clf": "%d/%b/%Y:%H:%M:%S %z",
+        "rfc2822": "%a, %d %b %Y %H:%M:%S %z",
+        "syslog": "%b %e %H:%M:%S",
+    }
+
+    ##* directive -> (regex, expression of g)
+    DIRECTIVES: Dict[str, Tuple[str, str]]
+    DIRECTIVES = {
+        "Y": (r"(\d{4})", "int(g)"),
+        "m": (r"(\d{2})", "int(g)"),
+        "d": (r"(\d{2})", "int(g)"),
+        "e": (r"( \d|\d{2})", "int(g)"),
+        "H": (r"(\d{2})", "int(g)"),
+        "M": (r"(\d{2})", "int(g)"),
+        "S": (r"(\d{2})", "int(g)"),
+        "f": (r"(\d{1,9})", "int(g.ljust(9, \"0\")) // DIV"),
+        "6f": (r"(\d{6})", "int(g) * 1000 // DIV"),
+        "3f": (r"(\d{3})", "int(g) * 1000000 // DIV"),
+        "9f": (r"(\d{9})", "int(g) // DIV"),
+        ".f": (r"(?:\.(\d{1,9}))?", "(int(g.ljust(9, \"0\")) // DIV if g else 0)"),
+        "z": (r"([+-]\d{2}:?\d{2}|Z)", "resolve(g)"),
+        ":z": (r"([+-]\d{2}:?\d{2}|Z)", "resolve(g)"),
+        "Z": (r"([A-Za-z]{1,6})", "resolve(g)"),
+        "#Z": (r"(Z?)", "(\"+0000,UTC\" if g else TD)"),
+        "b": (r"([A-Za-z]{3})", "MN[g.lower()]"),
+        "B": (r"([A-Za-z]{3,9})", "MF[g.lower()]"),
+        "a": (r"([A-Za-z]{3})", ""),
+        "A": (r"([A-Za-z]{6,9})", ""),
+        "j": (r"(\d{3})", ""),
+    }
+
+    ##* directive -> field it fills, in the order of parse_fields
+    TARGETS: Dict[str, int]
+    TARGETS = { "Y": 0, "m": 1, "b": 1, "B": 1, "d": 2, "e": 2, "H": 3, "M": 4, "S": 5, "f": 6, "6f": 6, "3f": 6, "9f": 6, ".f": 6, "z": 7, ":z": 7, "Z": 7, "#Z": 7 }
+
+    PATTERN: str
+    YEARS: int
+
+    ##* "us" or "ns", fractions and instants are in these ticks
+    PRECISION: str
+
+    CTZ: CSVTimeZoneLoaderType
+
+    ##* country code or region, picks between zones sharing a name like "CST"
+    HINT: str
+
+    def __init__(self: Parser, pattern: str, ctz: CSVTimeZoneLoaderType, create: Callable[[int, str], DateTimeType], month_names: List[str], month_fullnames: List[str], weekday_names: List[str], weekday_fullnames: List[str], years: int = 0, precision: str = "us", hint: str = "") -> None:
+
+        if precision not in CalendarKernel.TICKS:
+
+            raise ParserInitError(f"Invalid precision {precision}")
+
+        self.PATTERN = self.PRESETS.get(pattern, pattern)
+        self.PRECISION = precision
+        self.CTZ = ctz
+        self.HINT = hint
+
+        ##* like syslog, no year in the pattern means this year
+        self.YEARS = years if years else dt.date.today().year
+
+        regex: str
+        regex = ""
+
+        ##* defaults for fields the pattern does not have
+        targets: List[str]
+        targets = [ str(self.YEARS), "1", "1", "0", "0", "0", "0", "TD" ]
+
+        groups: int
+        groups = 0
+
+        for token in self.tokenize(self.PATTERN):
+
+            if not token.startswith("%"):
+
+                regex += re.escape(token)
+                continue
+
+            key: str
+            key = token[1:]
+
+            expression: str
+            regex_part: str
+            regex_part, expression = self.DIRECTIVES[key]
+
+            if key == "b":
+
+                regex_part = "(" + "|".join(month_names) + ")"
+
+            if key == "B":
+
+                regex_part = "(" + "|".join(month_fullnames) + ")"
+
+            if key == "a":
+
+                regex_part = "(?:" + "|".join(weekday_names) + ")"
+
+            if key == "A":
+
+                regex_part = "(?:" + "|".join(weekday_fullnames) + ")"
+
+            if not expression:
+
+                ##* matched, not captured
+                regex += regex_part if regex_part.startswith("(?:") else "(?:" + regex_part[1:]
+                continue
+
+            regex += regex_part
+
+            targets[self.TARGETS[key]] = re.sub(r"\bg\b", f"g[{groups}]", expression)
+            groups += 1
+
+        self.__regex = re.compile(regex, re.IGNORECASE)
+
+        scope: Dict[str, Any]
+        scope = {
+            "MN": { name.lower(): i + 1 for i, name in enumerate(month_names) },
+            "MF": { name.lower(): i + 1 for i, name in enumerate(month_fullnames) },
+            "TD": "+0000,UTC",
+            "DIV": 1000000000 // CalendarKernel.TICKS[precision],
+            "resolve": self.resolve,
+        }
+
+        ##* specialised once, per pattern
+        source: str
+        source = "def build(g):\n    return (" + ", ".join(targets) + ")\n"
+
+        exec(source, scope)
+
+        self.__build = scope["build"]
+        self.__create = create
+        self.__ticks = CalendarKernel.TICKS[precision]
+        self.__zones = { "Z": "+0000,UTC", "z": "+0000,UTC" }
+
+    def __repr__(self: Parser) -> str:
+
+        return f"<Parser bound pattern(\"{self.PATTERN}\") at {hex(id(self))}>"
+
+    def __call__(self: Parser, context: str) -> DateTimeType:
+
+        return self.parse(context)
+
+    def tokenize(self: Parser, pattern: str) -> List[str]:
+
+        tokens: List[str]
+        tokens = []
+
+        literal: str
+        literal = ""
+
+        i: int
+        i = 0
+
+        while i < len(pattern):
+
+            if pattern[i] != "%":
+
+                literal += pattern[i]
+                i += 1
+                continue
+
+            ##* longest directive first
+            for k in (2, 1):
+
+                key: str
+                key = pattern[i + 1:i + 1 + k]
+
+                if len(key) == k and (key in self.DIRECTIVES or key == "%"):
+
+                    break
+
+            else:
+
+                raise ParserInitError(f"Invalid directive at {i} in {pattern}")
+
+            if key == "%":
+
+                literal += "%"
+
+            else:
+
+                if literal:
+
+                    tokens.append(literal)
+                    literal = ""
+
+                tokens.append("%" + key)
+
+            i += 1 + len(key)
+
+        if literal:
+
+            tokens.append(literal)
+
+        return tokens
+
+    def resolve(self: Parser, z: str) -> str:
+
+        """resolve(\"+0700\" | \"+07:00\" | \"WIB\") -> \"+0700,WIB\""""
+
+        td_str: Any
+        td_str = self.__zones.get(z)
+
+        if td_str is not None:
+
+            return td_str
+
+        if z[0] in "+-":
+
+            timedelta: str
+            timedelta = z.replace(":", "")
+
+            ##* offsets are named by the tz table, unknown ones by themselves
+            td_str = self.CTZ.get_td(timedelta=timedelta) or timedelta + "," + timedelta
+
+        else:
+
+            if self.HINT and z.upper() != "UTC":
+
+                ##* not memoized, so every ambiguous hit is counted
+                try:
+
+                    return self.CTZ.abbreviations().resolve(z, self.HINT)
+
+                except AbbreviationIndexInitError:
+
+                    raise CSVTimeZoneLoaderInitError(f"No timezone found for {z}.")
+
+            td_str = self.CTZ.get_td(tzname=z) if z.upper() != "UTC" else "+0000,UTC"
+
+            if not td_str:
+
+                raise CSVTimeZoneLoaderInitError(f"No timezone found for {z}.")
+
+        self.__zones[z] = td_str
+
+        return td_str
+
+    def parse_fields(self: Parser, context: str) -> Tuple[int, int, int, int, int, int, int, str]:
+
+        """fields(years, month, days, hours, minutes, seconds, fraction(ticks), td_str)"""
+
+        match: Any
+        match = self.__regex.fullmatch(context)
+
+        if match is None:
+
+            raise DateTimeInitError(f"Invalid datetime string.")
+
+        return self.__build(match.groups())
+
+    def parse_instant(self: Parser, context: str) -> Tuple[int, str]:
+
+        Y: int
+        m: int
+        d: int
+        H: int
+        M: int
+        S: int
+        f: int
+        td_str: str
+        Y, m, d, H, M, S, f, td_str = self.parse_fields(context)
+
+        if not 0 < m < 13 or not 0 < d <= CalendarKernel.days_in_month(Y, m) or H > 23 or M > 59 or S > 59:
+
+            raise DateTimeInitError(f"Invalid datetime string.")
+
+        return (CalendarKernel.instant(Y, m, d, H, M, S, f, CalendarKernel.offset(td_str), self.__ticks), td_str)
+
+    def parse(self: Parser, context: str) -> DateTimeType:
+
+        instant: int
+        td_str: str
+        instant, td_str = self.parse_instant(context)
+
+        return self.__create(instant, td_str)
+
+    def parse_many(self: Parser, values: Iterable[str]) -> array.array:
+
+        """instants(ticks since epoch), zones are folded in"""
+
+        parse_instant: Callable[[str], Tuple[int, str]]
+        parse_instant = self.parse_instant
+
+        return array.array("q", [ parse_instant(context)[0] for context in values ])
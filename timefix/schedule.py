@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+
+import bisect
+import heapq
+
+from typing import Any, Callable, Iterable, Iterator, List, Tuple, TypeVar, Union
+from .kernel import CalendarKernel
+from .singletons import DateTimeType, RuleType, ScheduleInitError, ScheduleType
+
+
+Rule: Any
+Rule = TypeVar('Rule', bound='Rule')
+
+class Rule(RuleType):
+
+    ##* every given field must match, an empty one matches all
+    ##* days may be negative, -1 is the last day of the month
+    ##* weekdays(0, 6), monday is zero
+
+    ##* cron "minute hour day month weekday", sunday is 0 or 7 there
+    CRON_WEEKDAYS: List[str]
+    CRON_WEEKDAYS = [ "sun", "mon", "tue", "wed", "thu", "fri", "sat" ]
+
+    CRON_MONTHS: List[str]
+    CRON_MONTHS = [ "", "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec" ]
+
+    TIMEDELTA: str
+    OFFSET: int
+
+    MONTH: Tuple[int, ...]
+    DAYS: Tuple[int, ...]
+    WEEKDAYS: Tuple[int, ...]
+
+    ##* seconds of the day it fires at, sorted
+    TIMES: Tuple[int, ...]
+
+    def __init__(self: Rule, td_str: str = "+0000,UTC", hours: Iterable[int] = (0,), minutes: Iterable[int] = (0,), seconds: Iterable[int] = (0,), days: Iterable[int] = (), weekdays: Iterable[int] = (), month: Iterable[int] = ()) -> None:
+
+        self.TIMEDELTA = td_str
+        self.OFFSET = CalendarKernel.offset(td_str)
+
+        self.MONTH = tuple(sorted(set(month)))
+        self.DAYS = tuple(sorted(set(days)))
+        self.WEEKDAYS = tuple(sorted(set(weekdays)))
+
+        H: Tuple[int, ...]
+        H = tuple(sorted(set(hours)))
+
+        M: Tuple[int, ...]
+        M = tuple(sorted(set(minutes)))
+
+        S: Tuple[int, ...]
+        S = tuple(sorted(set(seconds)))
+
+        checks: List[Tuple[str, Tuple[int, ...], int, int]]
+        checks = [ ("hours", H, 0, 23), ("minutes", M, 0, 59), ("seconds", S, 0, 59), ("month", self.MONTH, 1, 12), ("weekdays", self.WEEKDAYS, 0, 6), ("days", self.DAYS, -31, 31) ]
+
+        for name, values, lo, hi in checks:
+
+            if any(value < lo or value > hi for value in values) or 0 in values and name == "days":
+
+                raise ScheduleInitError(f"Invalid {name} {values}")
+
+        if not H or not M or not S:
+
+            raise ScheduleInitError("No time of day given.")
+
+        self.TIMES = tuple(h * 3600 + m * 60 + s for h in H for m in M for s in S)
+
+        ##* (years, month) -> matching days
+        self.__months = {}
+
+    def __repr__(self: Rule) -> str:
+
+        return f"<Rule bound times({len(self.TIMES)}) days({self.DAYS}) weekdays({self.WEEKDAYS}) month({self.MONTH}) timedelta(\"{self.TIMEDELTA}\") at {hex(id(self))}>"
+
+    @classmethod
+    def field(cls: Rule, context: str, lo: int, hi: int, names: Union[List[str], None] = None) -> List[int]:
+
+        ##* "*", "*/15", "1-5", "1,15", "mon-fri", "L"
+        out: List[int]
+        out = []
+
+        for part in context.lower().split(","):
+
+            step: int
+            step = 1
+
+            start: int
+            stop: int
+
+            if "/" in part:
+
+                k: str
+                part, k = part.split("/", 1)
+                step = int(k)
+
+            if part == "*":
+
+                start, stop = lo, hi
+
+            elif part == "l":
+
+                out.append(-1)
+                continue
+
+            else:
+
+                bounds: List[int]
+                bounds = [ names.index(value) if names is not None and value in names else int(value) for value in part.split("-", 1) ]
+
+                start, stop = bounds[0], bounds[-1] if len(bounds) > 1 or step == 1 else hi
+
+            if start < lo or stop > hi:
+
+                raise ValueError(f"{part} out of {lo}-{hi}")
+
+            ##* "sat-sun", "20-10", "nov-feb" wrap around past hi
+            span: int
+            span = hi - lo + 1
+
+            out.extend(lo + (start - lo + k) % span for k in range(0, (stop - start) % span + 1, step))
+
+        return out
+
+    @classmethod
+    def from_cron(cls: Rule, context: str, td_str: str = "+0000,UTC") -> RuleType:
+
+        """from_cron(\"0 9 * * mon\", \"+0700,WIB\"), \"L\" in the day field is the last day, day and weekday must both match"""
+
+        parts: List[str]
+        parts = context.split()
+
+        if len(parts) != 5:
+
+            raise ScheduleInitError(f"Invalid cron string {context}")
+
+        try:
+
+            minutes: List[int]
+            minutes = cls.field(parts[0], 0, 59)
+
+            hours: List[int]
+            hours = cls.field(parts[1], 0, 23)
+
+            days: List[int]
+            days = [] if parts[2] == "*" else cls.field(parts[2], 1, 31)
+
+            month: List[int]
+            month = [] if parts[3] == "*" else cls.field(parts[3], 1, 12, cls.CRON_MONTHS)
+
+            weekdays: List[int]
+            weekdays = [] if parts[4] == "*" else [ (k + 6) % 7 for k in cls.field(parts[4], 0, 7, cls.CRON_WEEKDAYS) ]
+
+        except ValueError:
+
+            raise ScheduleInitError(f"Invalid cron string {context}")
+
+        ##* an empty list would match everything
+        if not minutes or not hours or parts[2] != "*" and not days or parts[3] != "*" and not month or parts[4] != "*" and not weekdays:
+
+            raise ScheduleInitError(f"Invalid cron string {context}")
+
+        return cls(td_str=td_str, hours=hours, minutes=minutes, days=days, weekdays=weekdays, month=month)
+
+    def days(self: Rule, years: int, month: int) -> Tuple[int, ...]:
+
+        """days(years, month) -> matching days of that month"""
+
+        key: Tuple[int, int]
+        key = (years, month)
+
+        out: Union[Tuple[int, ...], None]
+        out = self.__months.get(key)
+
+        if out is not None:
+
+            return out
+
+        if self.MONTH and month not in self.MONTH:
+
+            out = ()
+
+        else:
+
+            n: int
+            n = CalendarKernel.days_in_month(years, month)
+
+            ##* weekday of the 1st, the rest follow from it
+            w: int
+            w = CalendarKernel.weekday(CalendarKernel.days_from_civil(years, month, 1))
+
+            DAYS: Tuple[int, ...]
+            DAYS = self.DAYS
+
+            WEEKDAYS: Tuple[int, ...]
+            WEEKDAYS = self.WEEKDAYS
+
+            out = tuple(d for d in range(1, n + 1) if (not DAYS or d in DAYS or d - n - 1 in DAYS) and (not WEEKDAYS or (w + d - 1) % 7 in WEEKDAYS))
+
+        self.__months[key] = out
+
+        return out
+
+    def next(self: Rule, instant: int) -> Union[int, None]:
+
+        """next(instant) -> first occurrence at or after it, None if it never fires"""
+
+        o: int
+        o = self.OFFSET * 1000000
+
+        z: int
+        t: int
+        z, t = divmod(instant + o, CalendarKernel.US_PER_DAY)
+
+        Y: int
+        m: int
+        d: int
+        Y, m, d = CalendarKernel.civil_from_days(z)
+
+        TIMES: Tuple[int, ...]
+        TIMES = self.TIMES
+
+        days: Tuple[int, ...]
+        days = self.days(Y, m)
+
+        ##* later today
+        k: int
+        k = bisect.bisect_left(days, d)
+
+        if k < len(days) and days[k] == d:
+
+            i: int
+            i = bisect.bisect_left(TIMES, -(-t // 1000000))
+
+            if i < len(TIMES):
+
+                return (z * 86400 + TIMES[i]) * 1000000 - o
+
+        ##* then month by month, a whole gregorian cycle at most
+        for _ in range(4801):
+
+            k = bisect.bisect_right(days, d)
+
+            if k < len(days):
+
+                return (CalendarKernel.days_from_civil(Y, m, days[k]) * 86400 + TIMES[0]) * 1000000 - o
+
+            Y, m, d = (Y + 1, 1, 0) if m == 12 else (Y, m + 1, 0)
+
+            days = self.days(Y, m)
+
+        return None
+
+    def occurrences(self: Rule, start: int, stop: Union[int, None] = None) -> Iterator[int]:
+
+        """occurrences(start, stop) -> instants, start <= instant < stop, lazily"""
+
+        instant: Union[int, None]
+        instant = self.next(start)
+
+        while instant is not None and (stop is None or instant < stop):
+
+            yield instant
+
+            instant = self.next(instant + 1)
+
+
+Schedule: Any
+Schedule = TypeVar('Schedule', bound='Schedule')
+
+class Schedule(ScheduleType):
+
+    ##* many rules, occurrences merged in time order
+
+    RULES: List[RuleType]
+
+    def __init__(self: Schedule, rules: Iterable[RuleType] = (), create: Union[Callable[[int, str], DateTimeType], None] = None) -> None:
+
+        self.RULES = list(rules)
+
+        self.__create = create
+
+    def __repr__(self: Schedule) -> str:
+
+        return f"<Schedule bound rules({len(self.RULES)}) at {hex(id(self))}>"
+
+    def __len__(self: Schedule) -> int:
+
+        return len(self.RULES)
+
+    def add(self: Schedule, rule: RuleType) -> int:
+
+        """add(rule) -> rule id"""
+
+        self.RULES.append(rule)
+
+        return len(self.RULES) - 1
+
+    def expand(self: Schedule, start: int, stop: Union[int, None] = None) -> Iterator[Tuple[int, int]]:
+
+        """expand(start, stop) -> (instant, rule id) in time order, ties by rule id, lazily"""
+
+        RULES: List[RuleType]
+        RULES = self.RULES
+
+        ##* one pending occurrence per rule
+        heap: List[Tuple[int, int]]
+        heap = []
+
+        for i, rule in enumerate(RULES):
+
+            instant: Union[int, None]
+            instant = rule.next(start)
+
+            if instant is not None:
+
+                heap.append((instant, i))
+
+        heapq.heapify(heap)
+
+        while heap:
+
+            instant, i = heap[0]
+
+            if stop is not None and instant >= stop:
+
+                return
+
+            yield (instant, i)
+
+            instant = RULES[i].next(instant + 1)
+
+            if instant is None:
+
+                heapq.heappop(heap)
+
+            else:
+
+                heapq.heapreplace(heap, (instant, i))
+
+    def occurrences(self: Schedule, start: int, stop: Union[int, None] = None) -> Iterator[Tuple[Any, int]]:
+
+        """occurrences(start, stop) -> (DateTime in the rule zone, rule id), instants if no create was given"""
+
+        if self.__create is None:
+
+            yield from self.expand(start, stop)
+            return
+
+        for instant, i in self.expand(start, stop):
+
+            yield (self.__create(instant, self.RULES[i].TIMEDELTA), i)
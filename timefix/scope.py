@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+import contextvars
+import datetime as dt
+import functools
+import inspect
+
+from typing import Any, Callable, Tuple, TypeVar, Union
+from .kernel import CalendarKernel
+from .singletons import DateTimeInitError, ZoneScopeInitError, ZoneScopeType
+
+
+##* per thread, copied into each asyncio task
+CURRENT_ZONE: contextvars.ContextVar
+CURRENT_ZONE = contextvars.ContextVar("CURRENT_ZONE", default=None)
+
+##* tokens of the scopes entered in this context, innermost last
+ZONE_TOKENS: contextvars.ContextVar
+ZONE_TOKENS = contextvars.ContextVar("ZONE_TOKENS", default=())
+
+
+ZoneScope: Any
+ZoneScope = TypeVar('ZoneScope', bound='ZoneScope')
+
+class ZoneScope(ZoneScopeType):
+
+    ##* a zone resolved once, the default of create_dt, to_dt, to_str and the formatters while entered
+
+    TZ_NAME: str
+    TZ_INFO: str
+    TIMEDELTA: str
+    OFFSET: int
+    TIMEZONE: dt.timezone
+    DELTA: dt.timedelta
+
+    def __init__(self: ZoneScope, td_str: str, tzinfo: str = "") -> None:
+
+        try:
+
+            self.OFFSET = CalendarKernel.offset(td_str)
+
+        except DateTimeInitError:
+
+            raise ZoneScopeInitError(f"Invalid timezone string {td_str}")
+
+        self.TIMEDELTA = td_str
+        self.TZ_NAME = td_str.split(",", 1)[1] if "," in td_str else ""
+        self.TZ_INFO = tzinfo
+        self.DELTA = dt.timedelta(seconds=self.OFFSET)
+        self.TIMEZONE = dt.timezone(offset=self.DELTA, name=self.TZ_NAME) if self.TZ_NAME else dt.timezone(offset=self.DELTA)
+
+    def __repr__(self: ZoneScope) -> str:
+
+        return f"<ZoneScope bound timedelta(\"{self.TIMEDELTA}\") tzinfo(\"{self.TZ_INFO}\") at {hex(id(self))}>"
+
+    def __enter__(self: ZoneScope) -> ZoneScope:
+
+        token: contextvars.Token
+        token = CURRENT_ZONE.set(self)
+
+        ZONE_TOKENS.set(ZONE_TOKENS.get() + (token,))
+
+        return self
+
+    def __exit__(self: ZoneScope, *args: Any) -> None:
+
+        tokens: Tuple[contextvars.Token, ...]
+        tokens = ZONE_TOKENS.get()
+
+        if not tokens:
+
+            raise ZoneScopeInitError("No zone scope entered.")
+
+        CURRENT_ZONE.reset(tokens[-1])
+        ZONE_TOKENS.set(tokens[:-1])
+
+    def __call__(self: ZoneScope, func: Callable[..., Any]) -> Callable[..., Any]:
+
+        """decorator, each call runs inside the scope"""
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def scoped(*args: Any, **kwargs: Any) -> Any:
+
+                with self:
+
+                    return await func(*args, **kwargs)
+
+            return scoped
+
+        @functools.wraps(func)
+        def scoped(*args: Any, **kwargs: Any) -> Any:
+
+            with self:
+
+                return func(*args, **kwargs)
+
+        return scoped
+
+    @classmethod
+    def current(cls: ZoneScope) -> Union[ZoneScopeType, None]:
+
+        return CURRENT_ZONE.get()
@@ -1,17 +1,96 @@
 #!/usr/bin/env python
 
+import array
 import datetime as dt
 import io
 import tempfile
 import time
 
 from abc import ABC, abstractclassmethod, abstractmethod
-from typing import Any, Dict, List, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, TypeVar, Union
 
 
 class DateInitError(Exception): pass
 class CSVTimeZoneLoaderInitError(Exception): pass
 
+CSVTimeZoneRowsType: Any
+CSVTimeZoneRowsType = TypeVar('CSVTimeZoneRowsType', bound='CSVTimeZoneRowsType')
+
+class CSVTimeZoneRowsType(ABC):
+
+    TABLE: Any
+
+    @abstractmethod
+    def __len__(self: CSVTimeZoneRowsType) -> int: pass
+
+    @abstractmethod
+    def __getitem__(self: CSVTimeZoneRowsType, i: Union[int, slice]) -> Any: pass
+
+    @abstractmethod
+    def __iter__(self: CSVTimeZoneRowsType) -> Iterator[Dict[str, str]]: pass
+
+CSVTimeZoneTableType: Any
+CSVTimeZoneTableType = TypeVar('CSVTimeZoneTableType', bound='CSVTimeZoneTableType')
+
+class CSVTimeZoneTableType(ABC):
+
+    FIELD_NAMES: List[str]
+
+    COUNTRY_CODE: List[str]
+    TZNAME: List[str]
+    TZINFO: List[str]
+    TIMEDELTA: List[str]
+
+    OFFSETS: array.array
+
+    DATA: CSVTimeZoneRowsType
+    INDEX: Dict[str, Dict[str, Tuple[int, ...]]]
+
+    ZONES: Dict[str, Tuple[dt.timezone, str, str]]
+
+    @abstractmethod
+    def __init__(self: CSVTimeZoneTableType, rows: Iterable[Dict[str, str]]) -> None: pass
+
+    @abstractmethod
+    def minutes(self: CSVTimeZoneTableType, timedelta: str) -> int: pass
+
+    @abstractmethod
+    def row(self: CSVTimeZoneTableType, i: int) -> Dict[str, str]: pass
+
+    @abstractmethod
+    def column(self: CSVTimeZoneTableType, key: str) -> List[str]: pass
+
+    @abstractmethod
+    def find(self: CSVTimeZoneTableType, fieldnames: List[str], checker: List[str]) -> int: pass
+
+class AbbreviationIndexInitError(Exception): pass
+
+AbbreviationIndexType: Any
+AbbreviationIndexType = TypeVar('AbbreviationIndexType', bound='AbbreviationIndexType')
+
+class AbbreviationIndexType(ABC):
+
+    TABLE: CSVTimeZoneTableType
+    PREFER: Tuple[str, ...]
+
+    RESOLVED: Dict[Tuple[str, str], Tuple[str, bool]]
+    AMBIGUOUS: Dict[str, int]
+
+    @abstractmethod
+    def __init__(self: AbbreviationIndexType, table: CSVTimeZoneTableType, prefer: Iterable[str] = ()) -> None: pass
+
+    @abstractmethod
+    def candidates(self: AbbreviationIndexType, tzname: str) -> List[Tuple[str, str, str]]: pass
+
+    @abstractmethod
+    def offsets(self: AbbreviationIndexType, tzname: str) -> List[str]: pass
+
+    @abstractmethod
+    def is_ambiguous(self: AbbreviationIndexType, tzname: str) -> bool: pass
+
+    @abstractmethod
+    def resolve(self: AbbreviationIndexType, tzname: str, hint: str = "") -> str: pass
+
 CSVTimeZoneLoaderType: Any
 CSVTimeZoneLoaderType = TypeVar('CSVTimeZoneLoaderType', bound='CSVTimeZoneLoaderType')
 
@@ -21,8 +100,10 @@ class CSVTimeZoneLoaderType(ABC):
 
     TZ_FILE_PATH: str
     TZ_FILE_STREAM: Union[io.TextIOWrapper, io.BytesIO, io.StringIO, tempfile._TemporaryFileWrapper, None]
+    TZ_FILE_KEY: Tuple[int, ...]
 
-    TZ_TABLE_DATA: List[Dict[str, str]]
+    TZ_TABLE: CSVTimeZoneTableType
+    TZ_TABLE_DATA: CSVTimeZoneRowsType
     
     @abstractmethod
     def __init__(self: CSVTimeZoneLoaderType, tzfile: Union[str, io.TextIOWrapper, io.BytesIO, io.StringIO, tempfile._TemporaryFileWrapper]) -> None: pass
@@ -30,6 +111,18 @@ class CSVTimeZoneLoaderType(ABC):
     @abstractmethod
     def init(self: CSVTimeZoneLoaderType) -> None: pass
 
+    @abstractmethod
+    def load(self: CSVTimeZoneLoaderType) -> CSVTimeZoneTableType: pass
+
+    @abstractmethod
+    def file_key(self: CSVTimeZoneLoaderType) -> Tuple[int, ...]: pass
+
+    @abstractmethod
+    def reload(self: CSVTimeZoneLoaderType) -> bool: pass
+
+    @abstractmethod
+    def zone(self: CSVTimeZoneLoaderType, td_str: str) -> Tuple[dt.timezone, str, str]: pass
+
     @abstractmethod
     def timezone(self: CSVTimeZoneLoaderType, td_str: str) -> dt.timezone: pass
 
@@ -45,6 +138,81 @@ class CSVTimeZoneLoaderType(ABC):
     @abstractmethod
     def get_tzinfo(self: CSVTimeZoneLoaderType, country_code: str = "", tzname: str = "") -> str: pass
 
+    @abstractmethod
+    def abbreviations(self: CSVTimeZoneLoaderType, prefer: Iterable[str] = ()) -> AbbreviationIndexType: pass
+
+CSVTimeZoneLoaderRegistryType: Any
+CSVTimeZoneLoaderRegistryType = TypeVar('CSVTimeZoneLoaderRegistryType', bound='CSVTimeZoneLoaderRegistryType')
+
+class CSVTimeZoneLoaderRegistryType(ABC):
+
+    LOADERS: Dict[str, CSVTimeZoneLoaderType]
+
+    @abstractclassmethod
+    def get(cls: CSVTimeZoneLoaderRegistryType, path: str) -> CSVTimeZoneLoaderType: pass
+
+    @abstractclassmethod
+    def reload(cls: CSVTimeZoneLoaderRegistryType, path: str = "") -> int: pass
+
+    @abstractclassmethod
+    def clear(cls: CSVTimeZoneLoaderRegistryType) -> None: pass
+
+CalendarKernelType: Any
+CalendarKernelType = TypeVar('CalendarKernelType', bound='CalendarKernelType')
+
+class CalendarKernelType(ABC):
+
+    DIGITS2: List[str]
+    DIGITS3: List[str]
+    DIGITS4: List[str]
+
+    YEARDAYS: List[int]
+    MONTHDAYS: List[int]
+
+    US_PER_DAY: int
+    ONE_SECOND: dt.timedelta
+
+    OFFSETS: Dict[str, int]
+
+    TICKS: Dict[str, int]
+
+    UNITS: Dict[str, Tuple[int, int]]
+
+    POLICIES: List[str]
+
+    @abstractclassmethod
+    def is_leap(cls: CalendarKernelType, years: int) -> bool: pass
+
+    @abstractclassmethod
+    def days_in_month(cls: CalendarKernelType, years: int, month: int) -> int: pass
+
+    @abstractclassmethod
+    def days_from_civil(cls: CalendarKernelType, years: int, month: int, days: int) -> int: pass
+
+    @abstractclassmethod
+    def civil_from_days(cls: CalendarKernelType, z: int) -> Tuple[int, int, int]: pass
+
+    @abstractclassmethod
+    def weekday(cls: CalendarKernelType, z: int) -> int: pass
+
+    @abstractclassmethod
+    def yearday(cls: CalendarKernelType, years: int, month: int, days: int) -> int: pass
+
+    @abstractclassmethod
+    def offset(cls: CalendarKernelType, td_str: str) -> int: pass
+
+    @abstractclassmethod
+    def instant(cls: CalendarKernelType, years: int, month: int, days: int, hours: int = 0, minutes: int = 0, seconds: int = 0, microseconds: int = 0, offset: int = 0, ticks: int = 1000000) -> int: pass
+
+    @abstractclassmethod
+    def fields(cls: CalendarKernelType, instant: int, offset: int = 0, ticks: int = 1000000) -> Tuple[int, ...]: pass
+
+    @abstractclassmethod
+    def shift_months(cls: CalendarKernelType, years: int, month: int, days: int, months: int, policy: str = "clamp") -> Tuple[int, int, int]: pass
+
+    @abstractclassmethod
+    def shift_instant(cls: CalendarKernelType, instant: int, months: int, offset: int = 0, policy: str = "clamp", ticks: int = 1000000) -> int: pass
+
 class DateTimeInitError(Exception): pass
 
 DateTimeType: Any
@@ -62,6 +230,9 @@ class DateTimeType(ABC):
     TIMEDELTA: str
     # TIMESTAMP: int
 
+    ##* below the microsecond of DATETIME, 0 to 999
+    NANOSECONDS: int
+
     CTZ: CSVTimeZoneLoaderType
 
     @abstractmethod
@@ -73,6 +244,42 @@ class DateTimeType(ABC):
     @abstractmethod
     def __str__(self: DateTimeType) -> str: pass
 
+    @abstractmethod
+    def __hash__(self: DateTimeType) -> int: pass
+
+    @abstractmethod
+    def __eq__(self: DateTimeType, other: Any) -> bool: pass
+
+    @abstractmethod
+    def __lt__(self: DateTimeType, other: Any) -> bool: pass
+
+    @abstractmethod
+    def __add__(self: DateTimeType, other: Any) -> DateTimeType: pass
+
+    @abstractmethod
+    def __sub__(self: DateTimeType, other: Any) -> Any: pass
+
+    @abstractmethod
+    def copy(self: DateTimeType) -> DateTimeType: pass
+
+    @abstractmethod
+    def diff(self: DateTimeType, other: DateTimeType) -> int: pass
+
+    @abstractmethod
+    def diff_ns(self: DateTimeType, other: DateTimeType) -> int: pass
+
+    @abstractmethod
+    def shift_months(self: DateTimeType, months: int, policy: str = "clamp") -> dt.datetime: pass
+
+    @abstractmethod
+    def shift_years(self: DateTimeType, years: int, policy: str = "clamp") -> dt.datetime: pass
+
+    @abstractmethod
+    def get_instant(self: DateTimeType) -> int: pass
+
+    @abstractmethod
+    def get_instant_ns(self: DateTimeType) -> int: pass
+
     @abstractmethod
     def init(self: DateTimeType) -> None: pass
 
@@ -95,7 +302,7 @@ class DateTimeType(ABC):
     def ch_dt_from(self: DateTimeType, dt: dt.datetime) -> None: pass
 
     @abstractmethod
-    def to_str(self: DateTimeType, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0, milliseconds: int = 0, microseconds: int = 0) -> str: pass
+    def to_str(self: DateTimeType, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0, milliseconds: int = 0, microseconds: int = 0, nanoseconds: int = 0) -> str: pass
 
     @abstractmethod
     def date_fix(self: DateTimeType, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0, milliseconds: int = 0, microseconds: int = 0) -> Tuple[int, ...]: pass
@@ -110,7 +317,25 @@ class DateTimeType(ABC):
     def enhance_tm_us(self: DateTimeType, us: int) -> DateTimeType: pass
 
     @abstractmethod
-    def enhance_tm_auto(self: DateTimeType, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, sec: int = 0, ms: int = 0, us: int = 0) -> DateTimeType: pass
+    def enhance_tm_ns(self: DateTimeType, ns: int) -> DateTimeType: pass
+
+    @abstractmethod
+    def enhance_tm_auto(self: DateTimeType, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, sec: int = 0, ms: int = 0, us: int = 0, ns: int = 0) -> DateTimeType: pass
+
+    @abstractmethod
+    def advance_sec(self: DateTimeType, sec: int) -> DateTimeType: pass
+
+    @abstractmethod
+    def advance_ms(self: DateTimeType, ms: int) -> DateTimeType: pass
+
+    @abstractmethod
+    def advance_us(self: DateTimeType, us: int) -> DateTimeType: pass
+
+    @abstractmethod
+    def advance_ns(self: DateTimeType, ns: int) -> DateTimeType: pass
+
+    @abstractmethod
+    def advance(self: DateTimeType, days: int = 0, hours: int = 0, minutes: int = 0, sec: int = 0, ms: int = 0, us: int = 0, ns: int = 0) -> DateTimeType: pass
 
     @abstractmethod
     def get_struct_tm(self: DateTimeType, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0, weekdays: int = 0, yeardays: int = 0, is_dst: int = -1) -> time.struct_time: pass
@@ -155,44 +380,810 @@ class DateTimeType(ABC):
     def is_dst(self: DateTimeType) -> int: pass
 
 
-TimeFixType: Any
-TimeFixType = TypeVar('TimeFixType', bound='TimeFixType')
+LazyDateTimeType: Any
+LazyDateTimeType = TypeVar("LazyDateTimeType", bound="LazyDateTimeType")
 
+class LazyDateTimeType(DateTimeType):
 
-class TimeFixType(ABC):
+    RAW: Union[str, bytes, memoryview]
 
-    MONTH_FULLNAMES: List[str]
+    @abstractmethod
+    def text(self: LazyDateTimeType) -> str: pass
 
-    MONTH_NAMES: List[str]
+    @abstractmethod
+    def loaded(self: LazyDateTimeType) -> bool: pass
 
-    WEEKDAY_FULLNAMES: str
+    @abstractmethod
+    def load(self: LazyDateTimeType) -> None: pass
 
-    WEEKDAY_NAMES: str
+class FormatterInitError(Exception): pass
 
-    TZ_DATA_BUFFER: io.BytesIO
+FormatterType: Any
+FormatterType = TypeVar('FormatterType', bound='FormatterType')
+
+class FormatterType(ABC):
+
+    PRESETS: Dict[str, str]
+    DIRECTIVES: Dict[str, Tuple[str, int]]
+
+    PATTERN: str
+    WIDTH: int
+    NAMED: bool
+    PRECISION: str
+
+    CTZ: Union[CSVTimeZoneLoaderType, None]
+
+    @abstractmethod
+    def __init__(self: FormatterType, pattern: str, ctz: Union[CSVTimeZoneLoaderType, None] = None, month_names: Union[List[str], None] = None, month_fullnames: Union[List[str], None] = None, weekday_names: Union[List[str], None] = None, weekday_fullnames: Union[List[str], None] = None, precision: str = "us") -> None: pass
+
+    @abstractmethod
+    def __call__(self: FormatterType, value: Union[DateTimeType, int], td_str: str = "+0000,UTC") -> str: pass
+
+    @abstractmethod
+    def tokenize(self: FormatterType, pattern: str) -> List[str]: pass
+
+    @abstractmethod
+    def format(self: FormatterType, d: DateTimeType) -> str: pass
+
+    @abstractmethod
+    def format_instant(self: FormatterType, instant: int, td_str: str = "") -> str: pass
+
+    @abstractmethod
+    def format_fields(self: FormatterType, fields: Tuple[int, ...], o: int = 0, n: str = "", x: int = 0) -> str: pass
+
+    @abstractmethod
+    def format_many(self: FormatterType, values: Iterable[Union[DateTimeType, int]], td_str: str = "", sep: str = "\n", out: Union[bytearray, None] = None) -> bytearray: pass
+
+class ParserInitError(Exception): pass
+
+ParserType: Any
+ParserType = TypeVar('ParserType', bound='ParserType')
+
+class ParserType(ABC):
+
+    PRESETS: Dict[str, str]
+    DIRECTIVES: Dict[str, Tuple[str, str]]
+
+    PATTERN: str
+    YEARS: int
+    PRECISION: str
 
     CTZ: CSVTimeZoneLoaderType
+    HINT: str
 
     @abstractmethod
-    def __init__(self: TimeFixType, tzfile: Union[str, io.TextIOWrapper, io.BytesIO, io.StringIO, tempfile._TemporaryFileWrapper, None] = None) -> None: pass
+    def __init__(self: ParserType, pattern: str, ctz: CSVTimeZoneLoaderType, create: Callable[[int, str], DateTimeType], month_names: List[str], month_fullnames: List[str], weekday_names: List[str], weekday_fullnames: List[str], years: int = 0, precision: str = "us", hint: str = "") -> None: pass
 
-    @abstractclassmethod
-    def create_dt(cls: TimeFixType, dt: Union[int, float, str, dt.datetime, None] = None, tzname: str = "", tzinfo: str = "") -> DateTimeType: pass
+    @abstractmethod
+    def __call__(self: ParserType, context: str) -> DateTimeType: pass
 
-    @abstractclassmethod
-    def get_month(cls: TimeFixType, dt: DateTimeType) -> Tuple[int, str, str]: pass
+    @abstractmethod
+    def resolve(self: ParserType, z: str) -> str: pass
 
-    @abstractclassmethod
-    def get_weekdays(cls: TimeFixType, dt: DateTimeType) -> Tuple[int, str, str]: pass
+    @abstractmethod
+    def parse_fields(self: ParserType, context: str) -> Tuple[int, int, int, int, int, int, int, str]: pass
 
-    @abstractclassmethod
-    def enhance_tm_sec(cls: TimeFixType, dt: DateTimeType, sec: int) -> DateTimeType: pass
+    @abstractmethod
+    def parse_instant(self: ParserType, context: str) -> Tuple[int, str]: pass
 
-    @abstractclassmethod
-    def enhance_tm_ms(cls: TimeFixType, dt: DateTimeType, ms: int) -> DateTimeType: pass
+    @abstractmethod
+    def parse(self: ParserType, context: str) -> DateTimeType: pass
 
-    @abstractclassmethod
-    def enhance_tm_us(cls: TimeFixType, dt: DateTimeType, us: int) -> DateTimeType: pass
+    @abstractmethod
+    def parse_many(self: ParserType, values: Iterable[str]) -> array.array: pass
+
+class ClockInitError(Exception): pass
+
+ClockType: Any
+ClockType = TypeVar('ClockType', bound='ClockType')
+
+class ClockType(ABC):
+
+    SOURCES: List[str]
+
+    TIMEDELTA: str
+
+    GRANULARITY: int
+    SOURCE: str
+
+    @abstractmethod
+    def __init__(self: ClockType, td_str: str, create: Callable[[int, str], DateTimeType], formatter: FormatterType, granularity: int = 1000000, source: str = "wall") -> None: pass
+
+    @abstractmethod
+    def __repr__(self: ClockType) -> str: pass
+
+    @abstractmethod
+    def now_instant(self: ClockType) -> int: pass
+
+    @abstractmethod
+    def now(self: ClockType) -> DateTimeType: pass
+
+    @abstractmethod
+    def now_str(self: ClockType) -> str: pass
+
+DateTimeColumnType: Any
+DateTimeColumnType = TypeVar('DateTimeColumnType', bound='DateTimeColumnType')
+
+class DateTimeColumnType(ABC):
+
+    INSTANTS: array.array
+
+    TIMEDELTA: str
+
+    PRECISION: str
+
+    @abstractmethod
+    def __init__(self: DateTimeColumnType, instants: Iterable[int], td_str: str = "+0000,UTC", create: Union[Callable[[int, str], DateTimeType], None] = None, precision: str = "us") -> None: pass
 
     @abstractclassmethod
-    def to_str(cls: TimeFixType, dt: DateTimeType) -> DateTimeType: pass
+    def from_epoch(cls: DateTimeColumnType, values: Any, unit: str = "s", td_str: str = "+0000,UTC", create: Union[Callable[[int, str], DateTimeType], None] = None, precision: str = "us") -> DateTimeColumnType: pass
+
+    @abstractmethod
+    def __len__(self: DateTimeColumnType) -> int: pass
+
+    @abstractmethod
+    def __getitem__(self: DateTimeColumnType, i: Union[int, slice]) -> Any: pass
+
+    @abstractmethod
+    def __iter__(self: DateTimeColumnType) -> Iterator[Any]: pass
+
+    @abstractmethod
+    def get_instant(self: DateTimeColumnType, i: int) -> int: pass
+
+    @abstractmethod
+    def fields(self: DateTimeColumnType) -> Tuple[array.array, ...]: pass
+
+    @abstractmethod
+    def to_str(self: DateTimeColumnType, formatter: FormatterType) -> List[str]: pass
+
+    @abstractmethod
+    def format_many(self: DateTimeColumnType, formatter: FormatterType, sep: str = "\n", out: Union[bytearray, None] = None) -> bytearray: pass
+
+    @abstractmethod
+    def shift_months(self: DateTimeColumnType, months: Union[int, Iterable[int]], policy: str = "clamp") -> DateTimeColumnType: pass
+
+    @abstractmethod
+    def shift_years(self: DateTimeColumnType, years: Union[int, Iterable[int]], policy: str = "clamp") -> DateTimeColumnType: pass
+
+    @abstractmethod
+    def days(self: DateTimeColumnType) -> array.array: pass
+
+    @abstractmethod
+    def shift_days(self: DateTimeColumnType, days: Union[int, Iterable[int]]) -> DateTimeColumnType: pass
+
+TimeIndexType: Any
+TimeIndexType = TypeVar('TimeIndexType', bound='TimeIndexType')
+
+class TimeIndexType(ABC):
+
+    KEYS: array.array
+    ROWS: array.array
+
+    TIMEDELTA: str
+    PRECISION: str
+
+    @abstractmethod
+    def __init__(self: TimeIndexType, instants: Iterable[Any] = (), td_str: str = "+0000,UTC", create: Union[Callable[[int, str], DateTimeType], None] = None, parse: Union[Callable[[str], dt.datetime], None] = None, precision: str = "us") -> None: pass
+
+    @abstractmethod
+    def __len__(self: TimeIndexType) -> int: pass
+
+    @abstractmethod
+    def __getitem__(self: TimeIndexType, i: int) -> Any: pass
+
+    @abstractmethod
+    def key(self: TimeIndexType, value: Any) -> int: pass
+
+    @abstractmethod
+    def append(self: TimeIndexType, value: Any, row: int = -1) -> int: pass
+
+    @abstractmethod
+    def extend(self: TimeIndexType, values: Iterable[Any]) -> None: pass
+
+    @abstractmethod
+    def between(self: TimeIndexType, start: Any = None, stop: Any = None) -> slice: pass
+
+    @abstractmethod
+    def rows(self: TimeIndexType, start: Any = None, stop: Any = None) -> memoryview: pass
+
+    @abstractmethod
+    def instants(self: TimeIndexType, start: Any = None, stop: Any = None) -> memoryview: pass
+
+    @abstractmethod
+    def select(self: TimeIndexType, start: Any = None, stop: Any = None) -> DateTimeColumnType: pass
+
+class TimestampFileInitError(Exception): pass
+
+TimestampFileType: Any
+TimestampFileType = TypeVar('TimestampFileType', bound='TimestampFileType')
+
+class TimestampFileType(ABC):
+
+    PATH: str
+    UNIT: str
+    TIMEDELTA: str
+    PRECISION: str
+
+    @abstractmethod
+    def __init__(self: TimestampFileType, path: str, create: Union[Callable[[int, str], DateTimeType], None] = None, precision: str = "us") -> None: pass
+
+    @abstractmethod
+    def __len__(self: TimestampFileType) -> int: pass
+
+    @abstractmethod
+    def __getitem__(self: TimestampFileType, i: Union[int, slice]) -> Any: pass
+
+    @abstractmethod
+    def __iter__(self: TimestampFileType) -> Iterator[Any]: pass
+
+    @abstractmethod
+    def get_instant(self: TimestampFileType, i: int) -> int: pass
+
+    @abstractmethod
+    def column(self: TimestampFileType, start: int = 0, stop: int = -1) -> DateTimeColumnType: pass
+
+    @abstractmethod
+    def chunks(self: TimestampFileType, size: int = 65536) -> Iterator[DateTimeColumnType]: pass
+
+    @abstractmethod
+    def close(self: TimestampFileType) -> None: pass
+
+TimestampFileWriterType: Any
+TimestampFileWriterType = TypeVar('TimestampFileWriterType', bound='TimestampFileWriterType')
+
+class TimestampFileWriterType(ABC):
+
+    PATH: str
+    UNIT: str
+    TIMEDELTA: str
+
+    @abstractmethod
+    def __init__(self: TimestampFileWriterType, path: str, unit: str = "us", td_str: str = "+0000,UTC") -> None: pass
+
+    @abstractmethod
+    def write(self: TimestampFileWriterType, values: Union[DateTimeColumnType, Iterable[int]]) -> int: pass
+
+    @abstractmethod
+    def flush(self: TimestampFileWriterType) -> None: pass
+
+    @abstractmethod
+    def close(self: TimestampFileWriterType) -> None: pass
+
+class WorldClockInitError(Exception): pass
+
+WorldClockType: Any
+WorldClockType = TypeVar('WorldClockType', bound='WorldClockType')
+
+class WorldClockType(ABC):
+
+    ZONES: List[str]
+    OFFSETS: List[int]
+    GROUPS: Dict[int, List[int]]
+
+    @abstractmethod
+    def __init__(self: WorldClockType, zones: Iterable[str], formatter: Union[FormatterType, None] = None) -> None: pass
+
+    @abstractmethod
+    def __len__(self: WorldClockType) -> int: pass
+
+    @abstractmethod
+    def fields(self: WorldClockType, value: Union[DateTimeType, int]) -> List[Tuple[int, ...]]: pass
+
+    @abstractmethod
+    def to_str(self: WorldClockType, value: Union[DateTimeType, int]) -> List[str]: pass
+
+    @abstractmethod
+    def fields_many(self: WorldClockType, values: Union[DateTimeColumnType, Iterable[int]]) -> List[Tuple[array.array, ...]]: pass
+
+    @abstractmethod
+    def to_str_many(self: WorldClockType, values: Union[DateTimeColumnType, Iterable[int]]) -> List[List[str]]: pass
+
+class StreamInitError(Exception): pass
+
+StreamNormalizerType: Any
+StreamNormalizerType = TypeVar('StreamNormalizerType', bound='StreamNormalizerType')
+
+class StreamNormalizerType(ABC):
+
+    FIELDS: List[str]
+    TIMEDELTA: str
+    UNIT: str
+    BATCH_SIZE: int
+    QUEUE_SIZE: int
+    INLINE_BELOW: int
+    SLICE_SIZE: int
+    ERRORS: int
+
+    @abstractmethod
+    def __init__(self: StreamNormalizerType, fields: Iterable[str], parse: Callable[[str], int], formatter: FormatterType, td_str: str = "+0000,UTC", unit: str = "s", batch_size: int = 4096, queue_size: int = 4, inline_below: int = 256, slice_size: int = 128, executor: Any = None) -> None: pass
+
+    @abstractmethod
+    def normalize(self: StreamNormalizerType, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]: pass
+
+    @abstractmethod
+    def run(self: StreamNormalizerType, source: Any) -> Any: pass
+
+class IntervalInitError(Exception): pass
+
+IntervalType: Any
+IntervalType = TypeVar('IntervalType', bound='IntervalType')
+
+class IntervalType(ABC):
+
+    START: int
+    STOP: int
+
+    @abstractmethod
+    def __init__(self: IntervalType, start: Union[int, DateTimeType], stop: Union[int, DateTimeType]) -> None: pass
+
+    @abstractmethod
+    def __contains__(self: IntervalType, value: Any) -> bool: pass
+
+    @abstractmethod
+    def length(self: IntervalType) -> int: pass
+
+    @abstractmethod
+    def overlaps(self: IntervalType, other: IntervalType) -> bool: pass
+
+    @abstractmethod
+    def intersection(self: IntervalType, other: IntervalType) -> Union[IntervalType, None]: pass
+
+    @abstractmethod
+    def union(self: IntervalType, other: IntervalType) -> Union[IntervalType, None]: pass
+
+    @abstractmethod
+    def gap(self: IntervalType, other: IntervalType) -> Union[IntervalType, None]: pass
+
+    @abstractclassmethod
+    def coalesce(cls: IntervalType, intervals: Iterable[Union[IntervalType, Tuple[int, int]]], adjacent: bool = True) -> Iterator[IntervalType]: pass
+
+IntervalIndexType: Any
+IntervalIndexType = TypeVar('IntervalIndexType', bound='IntervalIndexType')
+
+class IntervalIndexType(ABC):
+
+    STARTS: array.array
+    STOPS: array.array
+    ROWS: array.array
+    ENDS: array.array
+
+    @abstractmethod
+    def __init__(self: IntervalIndexType, intervals: Iterable[Union[IntervalType, Tuple[int, int]]] = ()) -> None: pass
+
+    @abstractmethod
+    def __len__(self: IntervalIndexType) -> int: pass
+
+    @abstractmethod
+    def overlap(self: IntervalIndexType, start: Any, stop: Any) -> array.array: pass
+
+    @abstractmethod
+    def stab(self: IntervalIndexType, instant: Any) -> array.array: pass
+
+    @abstractmethod
+    def count(self: IntervalIndexType, start: Any, stop: Any) -> int: pass
+
+    @abstractmethod
+    def count_many(self: IntervalIndexType, windows: Iterable[Union[IntervalType, Tuple[int, int]]]) -> array.array: pass
+
+    @abstractmethod
+    def overlap_many(self: IntervalIndexType, windows: Iterable[Union[IntervalType, Tuple[int, int]]]) -> List[array.array]: pass
+
+    @abstractmethod
+    def coalesce(self: IntervalIndexType, adjacent: bool = True) -> List[IntervalType]: pass
+
+class BusinessCalendarInitError(Exception): pass
+
+BusinessCalendarType: Any
+BusinessCalendarType = TypeVar('BusinessCalendarType', bound='BusinessCalendarType')
+
+class BusinessCalendarType(ABC):
+
+    COUNTRY_CODE: str
+    WEEKEND: Tuple[int, ...]
+    HOLIDAYS: Dict[int, str]
+
+    @abstractmethod
+    def __init__(self: BusinessCalendarType, country_code: str = "", holidays: Union[Dict[Any, str], Iterable[Any]] = (), weekend: Iterable[int] = (5, 6)) -> None: pass
+
+    @abstractclassmethod
+    def from_csv(cls: BusinessCalendarType, tzfile: Union[str, io.TextIOWrapper, io.StringIO], weekend: Iterable[int] = (5, 6)) -> Dict[str, BusinessCalendarType]: pass
+
+    @abstractmethod
+    def rank(self: BusinessCalendarType, z: int) -> int: pass
+
+    @abstractmethod
+    def unrank(self: BusinessCalendarType, r: int) -> int: pass
+
+    @abstractmethod
+    def is_business(self: BusinessCalendarType, value: Any) -> bool: pass
+
+    @abstractmethod
+    def add(self: BusinessCalendarType, value: Any, n: int) -> Any: pass
+
+    @abstractmethod
+    def sub(self: BusinessCalendarType, value: Any, n: int) -> Any: pass
+
+    @abstractmethod
+    def count(self: BusinessCalendarType, start: Any, stop: Any) -> int: pass
+
+    @abstractmethod
+    def add_many(self: BusinessCalendarType, values: Union[DateTimeColumnType, Iterable[int]], n: Union[int, Iterable[int]]) -> Union[DateTimeColumnType, array.array]: pass
+
+    @abstractmethod
+    def count_many(self: BusinessCalendarType, start: Union[DateTimeColumnType, Iterable[int]], stop: Union[DateTimeColumnType, Iterable[int]]) -> array.array: pass
+
+class ScheduleInitError(Exception): pass
+
+RuleType: Any
+RuleType = TypeVar('RuleType', bound='RuleType')
+
+class RuleType(ABC):
+
+    TIMEDELTA: str
+    OFFSET: int
+    MONTH: Tuple[int, ...]
+    DAYS: Tuple[int, ...]
+    WEEKDAYS: Tuple[int, ...]
+    TIMES: Tuple[int, ...]
+
+    @abstractmethod
+    def __init__(self: RuleType, td_str: str = "+0000,UTC", hours: Iterable[int] = (0,), minutes: Iterable[int] = (0,), seconds: Iterable[int] = (0,), days: Iterable[int] = (), weekdays: Iterable[int] = (), month: Iterable[int] = ()) -> None: pass
+
+    @abstractclassmethod
+    def from_cron(cls: RuleType, context: str, td_str: str = "+0000,UTC") -> RuleType: pass
+
+    @abstractmethod
+    def days(self: RuleType, years: int, month: int) -> Tuple[int, ...]: pass
+
+    @abstractmethod
+    def next(self: RuleType, instant: int) -> Union[int, None]: pass
+
+    @abstractmethod
+    def occurrences(self: RuleType, start: int, stop: Union[int, None] = None) -> Iterator[int]: pass
+
+ScheduleType: Any
+ScheduleType = TypeVar('ScheduleType', bound='ScheduleType')
+
+class ScheduleType(ABC):
+
+    RULES: List[RuleType]
+
+    @abstractmethod
+    def __init__(self: ScheduleType, rules: Iterable[RuleType] = (), create: Union[Callable[[int, str], DateTimeType], None] = None) -> None: pass
+
+    @abstractmethod
+    def __len__(self: ScheduleType) -> int: pass
+
+    @abstractmethod
+    def add(self: ScheduleType, rule: RuleType) -> int: pass
+
+    @abstractmethod
+    def expand(self: ScheduleType, start: int, stop: Union[int, None] = None) -> Iterator[Tuple[int, int]]: pass
+
+    @abstractmethod
+    def occurrences(self: ScheduleType, start: int, stop: Union[int, None] = None) -> Iterator[Tuple[Any, int]]: pass
+
+class ZoneScopeInitError(Exception): pass
+
+ZoneScopeType: Any
+ZoneScopeType = TypeVar('ZoneScopeType', bound='ZoneScopeType')
+
+class ZoneScopeType(ABC):
+
+    TZ_NAME: str
+    TZ_INFO: str
+    TIMEDELTA: str
+    OFFSET: int
+    TIMEZONE: dt.timezone
+    DELTA: dt.timedelta
+
+    @abstractmethod
+    def __init__(self: ZoneScopeType, td_str: str, tzinfo: str = "") -> None: pass
+
+    @abstractmethod
+    def __enter__(self: ZoneScopeType) -> ZoneScopeType: pass
+
+    @abstractmethod
+    def __exit__(self: ZoneScopeType, *args: Any) -> None: pass
+
+    @abstractmethod
+    def __call__(self: ZoneScopeType, func: Callable[..., Any]) -> Callable[..., Any]: pass
+
+    @abstractclassmethod
+    def current(cls: ZoneScopeType) -> Union[ZoneScopeType, None]: pass
+
+class ParallelInitError(Exception): pass
+
+ParallelResultType: Any
+ParallelResultType = TypeVar('ParallelResultType', bound='ParallelResultType')
+
+class ParallelResultType(ABC):
+
+    VALUES: Union[DateTimeColumnType, List[str]]
+    VALID: bytearray
+    ERRORS: List[Tuple[int, int, str]]
+
+    @abstractmethod
+    def __init__(self: ParallelResultType, values: Union[DateTimeColumnType, List[str]], valid: bytearray, errors: List[Tuple[int, int, str]]) -> None: pass
+
+    @abstractmethod
+    def __len__(self: ParallelResultType) -> int: pass
+
+ParallelWorkerType: Any
+ParallelWorkerType = TypeVar('ParallelWorkerType', bound='ParallelWorkerType')
+
+class ParallelWorkerType(ABC):
+
+    UNITS: Dict[str, Tuple[int, int]]
+    OPTIONS: Dict[str, Any]
+
+    @abstractclassmethod
+    def init(cls: ParallelWorkerType, options: Dict[str, Any]) -> None: pass
+
+    @abstractclassmethod
+    def instant(cls: ParallelWorkerType, value: Any) -> int: pass
+
+    @abstractclassmethod
+    def run(cls: ParallelWorkerType, job: Tuple[int, List[Any]]) -> Tuple[int, int, str]: pass
+
+    @abstractclassmethod
+    def check(cls: ParallelWorkerType, op: str, unit: str) -> None: pass
+
+class DurationInitError(Exception): pass
+
+DurationType: Any
+DurationType = TypeVar('DurationType', bound='DurationType')
+
+class DurationType(ABC):
+
+    MONTHS: int
+
+    MICROSECONDS: int
+
+    NANOSECONDS: int
+
+    @abstractmethod
+    def __init__(self: DurationType, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, sec: int = 0, ms: int = 0, us: int = 0, ns: int = 0) -> None: pass
+
+    @abstractmethod
+    def __repr__(self: DurationType) -> str: pass
+
+    @abstractmethod
+    def __str__(self: DurationType) -> str: pass
+
+    @abstractmethod
+    def __neg__(self: DurationType) -> DurationType: pass
+
+    @abstractmethod
+    def __add__(self: DurationType, other: Any) -> DurationType: pass
+
+    @abstractmethod
+    def __sub__(self: DurationType, other: Any) -> DurationType: pass
+
+    @abstractmethod
+    def get_months(self: DurationType) -> int: pass
+
+    @abstractmethod
+    def get_microseconds(self: DurationType) -> int: pass
+
+    @abstractmethod
+    def get_nanoseconds(self: DurationType) -> int: pass
+
+    @abstractmethod
+    def to_timedelta(self: DurationType) -> dt.timedelta: pass
+
+class AccumulatorInitError(Exception): pass
+
+AccumulatorType: Any
+AccumulatorType = TypeVar('AccumulatorType', bound='AccumulatorType')
+
+class AccumulatorType(ABC):
+
+    INSTANT: int
+    TIMEDELTA: str
+    PRECISION: str
+    OFFSET: int
+    STEP: int
+
+    @abstractmethod
+    def __init__(self: AccumulatorType, start: Union[int, DateTimeType] = 0, step: Union[int, DurationType] = 1, td_str: str = "", precision: str = "us", create: Union[Callable[[int, str], DateTimeType], None] = None) -> None: pass
+
+    @abstractmethod
+    def advance(self: AccumulatorType, n: int = 1) -> int: pass
+
+    @abstractmethod
+    def fields(self: AccumulatorType) -> Tuple[int, ...]: pass
+
+    @abstractmethod
+    def value(self: AccumulatorType) -> DateTimeType: pass
+
+    @abstractmethod
+    def write(self: AccumulatorType, d: DateTimeType) -> DateTimeType: pass
+
+
+
+TimeFixType: Any
+TimeFixType = TypeVar('TimeFixType', bound='TimeFixType')
+
+
+class TimeFixType(ABC):
+
+    MONTH_FULLNAMES: List[str]
+
+    MONTH_NAMES: List[str]
+
+    WEEKDAY_FULLNAMES: str
+
+    WEEKDAY_NAMES: str
+
+    TZ_DATA_BUFFER: io.BytesIO
+
+    CTZ: CSVTimeZoneLoaderType
+
+    @abstractmethod
+    def __init__(self: TimeFixType, tzfile: Union[str, io.TextIOWrapper, io.BytesIO, io.StringIO, tempfile._TemporaryFileWrapper, None] = None) -> None: pass
+
+    @abstractclassmethod
+    def create_dt(cls: TimeFixType, dt: Union[int, float, str, dt.datetime, None] = None, tzname: str = "", tzinfo: str = "") -> DateTimeType: pass
+
+    @abstractclassmethod
+    def zone(cls: TimeFixType, tzname: str = "", tzinfo: str = "", country_code: str = "") -> ZoneScopeType: pass
+
+    @abstractclassmethod
+    def create_lazy_dt(cls: TimeFixType, context: Union[str, bytes, memoryview], tzname: str = "", tzinfo: str = "") -> LazyDateTimeType: pass
+
+    @abstractclassmethod
+    def merge(cls: TimeFixType, *iterables: Iterable[Any], key: Union[Callable[[Any], int], None] = None) -> Iterator[Any]: pass
+
+    @abstractclassmethod
+    def diff(cls: TimeFixType, start: DateTimeType, end: DateTimeType) -> int: pass
+
+    @abstractclassmethod
+    def diff_many(cls: TimeFixType, start: Iterable[int], end: Iterable[int]) -> array.array: pass
+
+    @abstractclassmethod
+    def to_dt_many(cls: TimeFixType, values: List[DateTimeType], td_str: Union[str, Iterable[str]]) -> List[dt.datetime]: pass
+
+    @abstractclassmethod
+    def from_instant(cls: TimeFixType, instant: int, td_str: str = "+0000,UTC", precision: str = "us") -> DateTimeType: pass
+
+    @abstractclassmethod
+    def create_clock(cls: TimeFixType, tzname: str = "", tzinfo: str = "", granularity: int = 1000000, source: str = "wall") -> ClockType: pass
+
+    @abstractclassmethod
+    def create_column(cls: TimeFixType, instants: Iterable[int], td_str: str = "+0000,UTC", precision: str = "us") -> DateTimeColumnType: pass
+
+    @abstractclassmethod
+    def create_column_from_epoch(cls: TimeFixType, values: Any, unit: str = "s", td_str: str = "+0000,UTC", precision: str = "us") -> DateTimeColumnType: pass
+
+    @abstractclassmethod
+    def create_index(cls: TimeFixType, instants: Iterable[Any] = (), td_str: str = "+0000,UTC", precision: str = "us") -> TimeIndexType: pass
+
+    @abstractclassmethod
+    def open_timestamps(cls: TimeFixType, path: str, precision: str = "us") -> TimestampFileType: pass
+
+    @abstractclassmethod
+    def create_timestamp_writer(cls: TimeFixType, path: str, unit: str = "us", td_str: str = "+0000,UTC") -> TimestampFileWriterType: pass
+
+    @abstractclassmethod
+    def resolve_td(cls: TimeFixType, zone: str) -> str: pass
+
+    @abstractclassmethod
+    def create_rule(cls: TimeFixType, context: str = "", zone: str = "UTC", **fields: Iterable[int]) -> RuleType: pass
+
+    @abstractclassmethod
+    def create_stream(cls: TimeFixType, fields: Iterable[str], pattern: str = "iso_offset_us", parser: str = "", td_str: str = "+0000,UTC", unit: str = "s", batch_size: int = 4096, queue_size: int = 4, executor: Any = None) -> StreamNormalizerType: pass
+
+    @abstractclassmethod
+    def create_interval(cls: TimeFixType, start: Union[int, DateTimeType], stop: Union[int, DateTimeType]) -> IntervalType: pass
+
+    @abstractclassmethod
+    def create_interval_index(cls: TimeFixType, intervals: Iterable[Any]) -> IntervalIndexType: pass
+
+    @abstractclassmethod
+    def load_business_calendars(cls: TimeFixType, tzfile: Union[str, io.TextIOWrapper, io.StringIO], weekend: Iterable[int] = (5, 6)) -> Dict[str, BusinessCalendarType]: pass
+
+    @abstractclassmethod
+    def create_schedule(cls: TimeFixType, rules: Iterable[RuleType] = ()) -> ScheduleType: pass
+
+    @abstractclassmethod
+    def create_world_clock(cls: TimeFixType, zones: Iterable[str], pattern: str = "iso_offset") -> WorldClockType: pass
+
+    @abstractclassmethod
+    def map_parallel(cls: TimeFixType, values: List[Any], op: str = "instant", workers: int = 0, chunksize: int = 65536, unit: str = "s", td_str: str = "+0000,UTC", pattern: str = "iso_fraction", parser: str = "") -> ParallelResultType: pass
+
+    @abstractclassmethod
+    def compile_format(cls: TimeFixType, pattern: str, precision: str = "us") -> FormatterType: pass
+
+    @abstractclassmethod
+    def compile_parser(cls: TimeFixType, pattern: str, years: int = 0, precision: str = "us", hint: str = "") -> ParserType: pass
+
+    @abstractclassmethod
+    def create_accumulator(cls: TimeFixType, start: Union[int, DateTimeType, None] = None, step: Union[int, DurationType] = 1, td_str: str = "", precision: str = "us") -> AccumulatorType: pass
+
+    @abstractclassmethod
+    def create_abbreviation_index(cls: TimeFixType, prefer: Iterable[str] = ()) -> AbbreviationIndexType: pass
+
+    @abstractclassmethod
+    def get_month(cls: TimeFixType, dt: DateTimeType) -> Tuple[int, str, str]: pass
+
+    @abstractclassmethod
+    def get_weekdays(cls: TimeFixType, dt: DateTimeType) -> Tuple[int, str, str]: pass
+
+    @abstractclassmethod
+    def enhance_tm_month(cls: TimeFixType, dt: DateTimeType, month: int, policy: str = "clamp") -> DateTimeType: pass
+
+    @abstractclassmethod
+    def enhance_tm_years(cls: TimeFixType, dt: DateTimeType, years: int, policy: str = "clamp") -> DateTimeType: pass
+
+    @abstractclassmethod
+    def enhance_tm_sec(cls: TimeFixType, dt: DateTimeType, sec: int) -> DateTimeType: pass
+
+    @abstractclassmethod
+    def enhance_tm_ms(cls: TimeFixType, dt: DateTimeType, ms: int) -> DateTimeType: pass
+
+    @abstractclassmethod
+    def enhance_tm_us(cls: TimeFixType, dt: DateTimeType, us: int) -> DateTimeType: pass
+
+    @abstractclassmethod
+    def enhance_tm_ns(cls: TimeFixType, dt: DateTimeType, ns: int) -> DateTimeType: pass
+
+    @abstractclassmethod
+    def to_str(cls: TimeFixType, dt: DateTimeType) -> DateTimeType: pass
+
+
+class OracleInitError(Exception): pass
+
+OracleCheckType: Any
+OracleCheckType = TypeVar('OracleCheckType', bound='OracleCheckType')
+
+
+class OracleCheckType(ABC):
+
+    NAME: str
+
+    MINIMAL: Tuple[Any, ...]
+
+    @abstractmethod
+    def call(self: OracleCheckType, fn: Callable[..., Any], value: Tuple[Any, ...]) -> Any: pass
+
+    @abstractmethod
+    def differs(self: OracleCheckType, value: Tuple[Any, ...], reference: Callable[..., Any]) -> bool: pass
+
+    @abstractmethod
+    def shrink(self: OracleCheckType, value: Tuple[Any, ...], reference: Callable[..., Any]) -> Tuple[Any, ...]: pass
+
+
+OracleReportType: Any
+OracleReportType = TypeVar('OracleReportType', bound='OracleReportType')
+
+
+class OracleReportType(ABC):
+
+    NAME: str
+
+    SAMPLES: int
+
+    MISMATCHES: Dict[str, int]
+
+    REPRODUCERS: Dict[str, List[Tuple[Any, ...]]]
+
+    TIMINGS: Dict[str, float]
+
+    @abstractmethod
+    def passed(self: OracleReportType, against: str = "stdlib") -> bool: pass
+
+
+OracleType: Any
+OracleType = TypeVar('OracleType', bound='OracleType')
+
+
+class OracleType(ABC):
+
+    CHECKS: Dict[str, OracleCheckType]
+
+    @abstractmethod
+    def run(self: OracleType, names: Union[List[str], None] = None, samples: int = 100000, seed: int = 0) -> List[OracleReportType]: pass
+
+    @abstractmethod
+    def gate(self: OracleType, name: str, samples: int = 100000, seed: int = 0) -> bool: pass
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+
+import array
+import math
+import mmap
+import os
+import struct
+import sys
+
+from typing import Any, Callable, Iterable, Iterator, Tuple, TypeVar, Union
+from .columns import DateTimeColumn
+from .kernel import CalendarKernel
+from .singletons import DateTimeColumnType, DateTimeType, TimestampFileInitError, TimestampFileType, TimestampFileWriterType
+
+
+TimestampFile: Any
+TimestampFile = TypeVar('TimestampFile', bound='TimestampFile')
+
+class TimestampFile(TimestampFileType):
+
+    ##* read only, values are decoded on access, never all at once
+
+    ##* magic(8) unit(8) zone id(48), then int64 little endian values
+    HEADER: struct.Struct
+    HEADER = struct.Struct("<8s8s48s")
+
+    MAGIC: bytes
+    MAGIC = b"TFXTS\x00\x01\x00"
+
+    PATH: str
+    UNIT: str
+    TIMEDELTA: str
+    PRECISION: str
+
+    def __init__(self: TimestampFile, path: str, create: Union[Callable[[int, str], DateTimeType], None] = None, precision: str = "us") -> None:
+
+        if precision not in CalendarKernel.TICKS:
+
+            raise TimestampFileInitError(f"Invalid precision {precision}")
+
+        self.PATH = path
+        self.PRECISION = precision
+
+        self.__file = open(path, "rb")
+
+        try:
+
+            self.UNIT, self.TIMEDELTA = self.read_header(self.__file.read(self.HEADER.size), path)
+
+            size: int
+            size = os.fstat(self.__file.fileno()).st_size
+
+            ##* a torn last value is left out
+            self.__n = (size - self.HEADER.size) // 8
+
+            self.__mm = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ) if self.__n else None
+
+        except Exception:
+
+            self.__file.close()
+            raise
+
+        self.__view = memoryview(self.__mm)[self.HEADER.size:self.HEADER.size + self.__n * 8].cast("q") if self.__mm is not None else memoryview(array.array("q"))
+
+        mul: int
+        div: int
+        mul, div = CalendarKernel.UNITS[self.UNIT]
+
+        mul = mul * CalendarKernel.TICKS[precision] // 1000000
+
+        g: int
+        g = math.gcd(mul, div)
+
+        self.__mul = mul // g
+        self.__div = div // g
+        self.__create = create
+
+    @classmethod
+    def read_header(cls: TimestampFile, data: bytes, path: str) -> Tuple[str, str]:
+
+        """read_header(bytes) -> (unit, td_str)"""
+
+        if len(data) < cls.HEADER.size:
+
+            raise TimestampFileInitError(f"{path} has no header")
+
+        magic: bytes
+        unit: bytes
+        zone: bytes
+        magic, unit, zone = cls.HEADER.unpack(data)
+
+        if magic != cls.MAGIC:
+
+            raise TimestampFileInitError(f"{path} is not a timestamp file")
+
+        return (unit.rstrip(b"\0").decode("ascii"), zone.rstrip(b"\0").decode("utf-8"))
+
+    def __repr__(self: TimestampFile) -> str:
+
+        return f"<TimestampFile bound path(\"{self.PATH}\") rows({self.__n}) unit(\"{self.UNIT}\") timedelta(\"{self.TIMEDELTA}\") at {hex(id(self))}>"
+
+    def __enter__(self: TimestampFile) -> TimestampFile:
+
+        return self
+
+    def __exit__(self: TimestampFile, *args: Any) -> None:
+
+        self.close()
+
+    def __len__(self: TimestampFile) -> int:
+
+        return self.__n
+
+    def __getitem__(self: TimestampFile, i: Union[int, slice]) -> Any:
+
+        if isinstance(i, slice):
+
+            return self.column(*i.indices(self.__n)[:2]) if i.step in (None, 1) else DateTimeColumn(instants=[ self.get_instant(k) for k in range(*i.indices(self.__n)) ], td_str=self.TIMEDELTA, create=self.__create, precision=self.PRECISION)
+
+        instant: int
+        instant = self.get_instant(i)
+
+        ##* materialized only on access
+        if self.__create is None:
+
+            return instant
+
+        return self.__create(instant, self.TIMEDELTA)
+
+    def __iter__(self: TimestampFile) -> Iterator[Any]:
+
+        for column in self.chunks():
+
+            yield from column
+
+    def get_instant(self: TimestampFile, i: int) -> int:
+
+        """instant(ticks of the precision) of row i"""
+
+        value: int
+        value = self.__view[i]
+
+        if sys.byteorder != "little":
+
+            value = int.from_bytes(value.to_bytes(8, sys.byteorder, signed=True), "little", signed=True)
+
+        return value * self.__mul // self.__div
+
+    def column(self: TimestampFile, start: int = 0, stop: int = -1) -> DateTimeColumnType:
+
+        """column(start, stop) -> DateTimeColumn of the rows, only those rows are read"""
+
+        if stop < 0:
+
+            stop = self.__n
+
+        view: memoryview
+        view = self.__view[start:max(start, stop)]
+
+        if sys.byteorder != "little":
+
+            values: array.array
+            values = array.array("q", view.tobytes())
+            values.byteswap()
+
+            return DateTimeColumn.from_epoch(values=values, unit=self.UNIT, td_str=self.TIMEDELTA, create=self.__create, precision=self.PRECISION)
+
+        return DateTimeColumn.from_epoch(values=view, unit=self.UNIT, td_str=self.TIMEDELTA, create=self.__create, precision=self.PRECISION)
+
+    def chunks(self: TimestampFile, size: int = 65536) -> Iterator[DateTimeColumnType]:
+
+        """chunks(rows) -> DateTimeColumn per chunk, for fields() and format_many()"""
+
+        for start in range(0, self.__n, size):
+
+            yield self.column(start, min(start + size, self.__n))
+
+    def close(self: TimestampFile) -> None:
+
+        self.__view.release()
+
+        if self.__mm is not None:
+
+            self.__mm.close()
+
+        self.__file.close()
+
+
+TimestampFileWriter: Any
+TimestampFileWriter = TypeVar('TimestampFileWriter', bound='TimestampFileWriter')
+
+class TimestampFileWriter(TimestampFileWriterType):
+
+    ##* appends, an existing file must agree on unit and zone
+
+    PATH: str
+    UNIT: str
+    TIMEDELTA: str
+
+    def __init__(self: TimestampFileWriter, path: str, unit: str = "us", td_str: str = "+0000,UTC") -> None:
+
+        if unit not in CalendarKernel.UNITS:
+
+            raise TimestampFileInitError(f"Invalid unit {unit}")
+
+        if len(td_str.encode("utf-8")) > 48:
+
+            raise TimestampFileInitError(f"Invalid zone id {td_str}")
+
+        self.PATH = path
+        self.UNIT = unit
+        self.TIMEDELTA = td_str
+
+        header: bytes
+        header = TimestampFile.HEADER.pack(TimestampFile.MAGIC, unit.encode("ascii"), td_str.encode("utf-8"))
+
+        self.__file = open(path, "ab")
+
+        if self.__file.tell() == 0:
+
+            self.__file.write(header)
+
+        else:
+
+            with open(path, "rb") as f:
+
+                found: Tuple[str, str]
+                found = TimestampFile.read_header(f.read(TimestampFile.HEADER.size), path)
+
+            if found != (unit, td_str):
+
+                self.__file.close()
+
+                raise TimestampFileInitError(f"{path} holds {found[0]} in {found[1]}, not {unit} in {td_str}")
+
+            ##* drop a torn last value before appending
+            size: int
+            size = self.__file.tell()
+
+            if (size - TimestampFile.HEADER.size) % 8:
+
+                self.__file.truncate(size - (size - TimestampFile.HEADER.size) % 8)
+                self.__file.seek(0, os.SEEK_END)
+
+    def __repr__(self: TimestampFileWriter) -> str:
+
+        return f"<TimestampFileWriter bound path(\"{self.PATH}\") unit(\"{self.UNIT}\") timedelta(\"{self.TIMEDELTA}\") at {hex(id(self))}>"
+
+    def __enter__(self: TimestampFileWriter) -> TimestampFileWriter:
+
+        return self
+
+    def __exit__(self: TimestampFileWriter, *args: Any) -> None:
+
+        self.close()
+
+    def write(self: TimestampFileWriter, values: Union[DateTimeColumnType, Iterable[int]]) -> int:
+
+        """write(DateTimeColumn, or array/memoryview/iterable of values in the file unit) -> rows written"""
+
+        out: array.array
+
+        if isinstance(values, DateTimeColumnType):
+
+            mul: int
+            div: int
+            mul, div = CalendarKernel.UNITS[self.UNIT]
+
+            ##* column ticks -> file unit, a straight copy when they agree
+            mul = mul * CalendarKernel.TICKS[values.PRECISION] // 1000000
+
+            g: int
+            g = math.gcd(mul, div)
+
+            mul, div = mul // g, div // g
+
+            out = values.INSTANTS if mul == div == 1 else array.array("q", [ instant * div // mul for instant in values.INSTANTS ])
+
+        elif isinstance(values, array.array) and values.typecode == "q":
+
+            out = values
+
+        else:
+
+            out = array.array("q", values)
+
+        if sys.byteorder != "little":
+
+            out = array.array("q", out)
+            out.byteswap()
+
+        out.tofile(self.__file)
+
+        return len(out)
+
+    def flush(self: TimestampFileWriter) -> None:
+
+        self.__file.flush()
+
+    def close(self: TimestampFileWriter) -> None:
+
+        self.__file.close()
+
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+
+import asyncio
+import concurrent.futures
+import time
+
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, TypeVar, Union
+from .columns import DateTimeColumn
+from .kernel import CalendarKernel
+from .singletons import FormatterType, StreamInitError, StreamNormalizerType
+
+
+StreamNormalizer: Any
+StreamNormalizer = TypeVar('StreamNormalizer', bound='StreamNormalizer')
+
+class StreamNormalizer(StreamNormalizerType):
+
+    ##* records are dicts, the timestamp fields are rewritten in place
+    ##* strings go through parse, numbers are epoch values in UNIT
+
+    FIELDS: List[str]
+    TIMEDELTA: str
+    UNIT: str
+
+    ##* records per batch, batches waiting in the queue
+    BATCH_SIZE: int
+    QUEUE_SIZE: int
+
+    ##* smaller batches run on the loop, larger ones in the executor
+    INLINE_BELOW: int
+
+    ##* records the executor thread runs before handing the GIL back to the loop
+    SLICE_SIZE: int
+
+    ##* values left as they were, they did not parse
+    ERRORS: int
+
+    def __init__(self: StreamNormalizer, fields: Iterable[str], parse: Callable[[str], int], formatter: FormatterType, td_str: str = "+0000,UTC", unit: str = "s", batch_size: int = 4096, queue_size: int = 4, inline_below: int = 256, slice_size: int = 128, executor: Union[concurrent.futures.Executor, None] = None) -> None:
+
+        if unit not in CalendarKernel.UNITS:
+
+            raise StreamInitError(f"Invalid unit {unit}")
+
+        if batch_size < 1 or queue_size < 1 or slice_size < 1:
+
+            raise StreamInitError(f"Invalid batch size {batch_size}, queue size {queue_size} or slice size {slice_size}")
+
+        self.FIELDS = list(fields)
+        self.TIMEDELTA = td_str
+        self.UNIT = unit
+        self.BATCH_SIZE = batch_size
+        self.QUEUE_SIZE = queue_size
+        self.INLINE_BELOW = inline_below
+        self.SLICE_SIZE = slice_size
+        self.ERRORS = 0
+
+        self.__parse = parse
+        self.__formatter = formatter
+        self.__executor = executor
+
+    def __repr__(self: StreamNormalizer) -> str:
+
+        return f"<StreamNormalizer bound fields({self.FIELDS}) batch_size({self.BATCH_SIZE}) queue_size({self.QUEUE_SIZE}) at {hex(id(self))}>"
+
+    def instant(self: StreamNormalizer, value: Any) -> int:
+
+        if isinstance(value, str):
+
+            return self.__parse(value)
+
+        mul: int
+        div: int
+        mul, div = CalendarKernel.UNITS[self.UNIT]
+
+        return int(value * mul) // div if isinstance(value, float) else value * mul // div
+
+    def normalize(self: StreamNormalizer, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+        """normalize(records) -> the same records, each field parsed then formatted as one column"""
+
+        instant: Callable[[Any], int]
+        instant = self.instant
+
+        for field in self.FIELDS:
+
+            rows: List[int]
+            rows = []
+
+            instants: List[int]
+            instants = []
+
+            for i, record in enumerate(batch):
+
+                value: Any
+                value = record.get(field)
+
+                if value is None:
+
+                    continue
+
+                try:
+
+                    instants.append(instant(value))
+                    rows.append(i)
+
+                except Exception:
+
+                    self.ERRORS += 1
+
+            ##* the columnar fast path, no DateTime per value
+            texts: List[str]
+            texts = DateTimeColumn(instants=instants, td_str=self.TIMEDELTA).to_str(self.__formatter)
+
+            for i, text in zip(rows, texts):
+
+                batch[i][field] = text
+
+        return batch
+
+    def normalize_slices(self: StreamNormalizer, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+        """normalize in slices, for executor threads"""
+
+        for i in range(0, len(batch), self.SLICE_SIZE):
+
+            self.normalize(batch[i:i + self.SLICE_SIZE])
+
+            ##* a thread holding the GIL stalls the loop for whole switch intervals, hand it over now
+            time.sleep(0)
+
+        return batch
+
+    async def batches(self: StreamNormalizer, source: AsyncIterable[Dict[str, Any]], queue: asyncio.Queue) -> None:
+
+        batch: List[Dict[str, Any]]
+        batch = []
+
+        try:
+
+            async for record in source:
+
+                batch.append(record)
+
+                if len(batch) >= self.BATCH_SIZE:
+
+                    ##* blocks while the queue is full, the source is not read meanwhile
+                    await queue.put((batch, None))
+
+                    batch = []
+
+                    ##* a source that never waits would hold the loop until the queue fills
+                    await asyncio.sleep(0)
+
+            if batch:
+
+                await queue.put((batch, None))
+
+            await queue.put((None, None))
+
+        except asyncio.CancelledError:
+
+            raise
+
+        except Exception as error:
+
+            await queue.put((None, error))
+
+    async def run(self: StreamNormalizer, source: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+
+        """async for record in run(source): normalized records in source order"""
+
+        loop: asyncio.AbstractEventLoop
+        loop = asyncio.get_running_loop()
+
+        queue: asyncio.Queue
+        queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+
+        producer: asyncio.Task
+        producer = loop.create_task(self.batches(source, queue))
+
+        try:
+
+            while True:
+
+                batch: Union[List[Dict[str, Any]], None]
+                error: Union[Exception, None]
+                batch, error = await queue.get()
+
+                if error is not None:
+
+                    raise error
+
+                if batch is None:
+
+                    break
+
+                if len(batch) < self.INLINE_BELOW:
+
+                    self.normalize(batch)
+
+                else:
+
+                    ##* the next batch is read while this one runs
+                    await loop.run_in_executor(self.__executor, self.normalize_slices, batch)
+
+                for record in batch:
+
+                    yield record
+
+                ##* other tasks run between batches
+                await asyncio.sleep(0)
+
+        finally:
+
+            producer.cancel()
@@ -1,14 +1,40 @@
 #!/usr/bin/env python
 
+import array
+import copy
 import csv
+import functools
 import io
 import os
+import re
+import sys
 import datetime as dt
+import heapq
+import multiprocessing
+import operator
 import tempfile
+import threading
 import time
 
-from typing import Any, Dict, List, Tuple, TypeVar, Union
-from .singletons import CSVTimeZoneLoaderInitError, CSVTimeZoneLoaderType, DateTimeInitError, DateTimeType, TimeFixType
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, TypeVar, Union
+from .abbreviations import AbbreviationIndex
+from .accumulator import Accumulator
+from .business import BusinessCalendar
+from .clock import Clock
+from .columns import DateTimeColumn
+from .formatter import Formatter
+from .index import TimeIndex
+from .interval import Interval, IntervalIndex
+from .kernel import CalendarKernel
+from .parallel import ParallelResult, ParallelWorker
+from .parser import Parser
+from .schedule import Rule, Schedule
+from .scope import ZoneScope
+from .storage import TimestampFile, TimestampFileWriter
+from .stream import StreamNormalizer
+from .worldclock import WorldClock
+from .singletons import AbbreviationIndexType, AccumulatorType, BusinessCalendarType, ClockType, CSVTimeZoneLoaderInitError, CSVTimeZoneLoaderRegistryType, CSVTimeZoneLoaderType, CSVTimeZoneRowsType, CSVTimeZoneTableType, DateTimeColumnType, DateTimeInitError, DateTimeType, DurationInitError, DurationType, FormatterType, IntervalIndexType, IntervalType, LazyDateTimeType, ParallelResultType, ParserType, RuleType, ScheduleType, StreamNormalizerType, TimeFixType, TimeIndexType, TimestampFileType, TimestampFileWriterType, WorldClockType, ZoneScopeType
 
 
 CSVTimeZoneLoader: Any
@@ -17,6 +43,172 @@ CSVTimeZoneLoader = TypeVar('CSVTimeZoneLoader', bound='CSVTimeZoneLoader')
 # ZERO: dt.timedelta
 # ZERO = dt.timedelta(0)
 
+CSVTimeZoneRows: Any
+CSVTimeZoneRows = TypeVar('CSVTimeZoneRows', bound='CSVTimeZoneRows')
+
+class CSVTimeZoneRows(CSVTimeZoneRowsType):
+
+    ##* read-only view, looks like the old list of dicts
+
+    TABLE: CSVTimeZoneTableType
+
+    def __init__(self: CSVTimeZoneRows, table: CSVTimeZoneTableType) -> None:
+
+        self.TABLE = table
+
+    def __repr__(self: CSVTimeZoneRows) -> str:
+
+        return f"<CSVTimeZoneRows bound rows({len(self)}) at {hex(id(self))}>"
+
+    def __len__(self: CSVTimeZoneRows) -> int:
+
+        return len(self.TABLE.TZNAME)
+
+    def __getitem__(self: CSVTimeZoneRows, i: Union[int, slice]) -> Any:
+
+        if isinstance(i, slice):
+
+            return [ self.TABLE.row(k) for k in range(*i.indices(len(self))) ]
+
+        if i < 0:
+
+            i += len(self)
+
+        if not 0 <= i < len(self):
+
+            raise IndexError("row index out of range")
+
+        return self.TABLE.row(i)
+
+    def __iter__(self: CSVTimeZoneRows) -> Iterator[Dict[str, str]]:
+
+        for i in range(len(self)):
+
+            yield self.TABLE.row(i)
+
+    def __eq__(self: CSVTimeZoneRows, other: Any) -> bool:
+
+        return list(self) == list(other)
+
+
+CSVTimeZoneTable: Any
+CSVTimeZoneTable = TypeVar('CSVTimeZoneTable', bound='CSVTimeZoneTable')
+
+class CSVTimeZoneTable(CSVTimeZoneTableType):
+
+    FIELD_NAMES: List[str]
+    FIELD_NAMES = ["country_code", "tzname", "tzinfo", "timedelta"]
+
+    ##* one column per field, row ids are positions
+    COUNTRY_CODE: List[str]
+    TZNAME: List[str]
+    TZINFO: List[str]
+    TIMEDELTA: List[str]
+
+    ##* offset minutes, zero where timedelta is empty
+    OFFSETS: array.array
+
+    ##* field -> lowered value -> row ids
+    INDEX: Dict[str, Dict[str, Tuple[int, ...]]]
+
+    ##* td_str -> (dt.timezone, tzinfo, tzname), memo only
+    ZONES: Dict[str, Tuple[dt.timezone, str, str]]
+
+    def __init__(self: CSVTimeZoneTable, rows: Iterable[Dict[str, str]]) -> None:
+
+        ##* fully built before anyone can see it, the columns and INDEX are never mutated afterwards
+        ##* only the ZONES memo grows, filled lazily by CSVTimeZoneLoader.zone
+        self.COUNTRY_CODE = []
+        self.TZNAME = []
+        self.TZINFO = []
+        self.TIMEDELTA = []
+        self.OFFSETS = array.array("i")
+        self.ZONES = {}
+
+        columns: List[List[str]]
+        columns = [ self.COUNTRY_CODE, self.TZNAME, self.TZINFO, self.TIMEDELTA ]
+
+        index: Dict[str, Dict[str, List[int]]]
+        index = { key: {} for key in self.FIELD_NAMES }
+
+        i: int
+        i = 0
+
+        for i, row in enumerate(rows):
+
+            for key, column in zip(self.FIELD_NAMES, columns):
+
+                value: str
+                value = sys.intern(row.get(key) or "")
+
+                column.append(value)
+                index[key].setdefault(sys.intern(value.lower()), []).append(i)
+
+            self.OFFSETS.append(self.minutes(self.TIMEDELTA[i]))
+
+        self.INDEX = { key: { value: tuple(ids) for value, ids in values.items() } for key, values in index.items() }
+
+    def minutes(self: CSVTimeZoneTable, timedelta: str) -> int:
+
+        ##* lenient like CSVTimeZoneLoader.timedelta, "-0700 MST" is -420
+        try:
+
+            return CalendarKernel.offset(timedelta[:5]) // 60 if timedelta else 0
+
+        except DateTimeInitError:
+
+            return 0
+
+    @property
+    def DATA(self: CSVTimeZoneTable) -> CSVTimeZoneRowsType:
+
+        return CSVTimeZoneRows(table=self)
+
+    def row(self: CSVTimeZoneTable, i: int) -> Dict[str, str]:
+
+        return {
+            "country_code": self.COUNTRY_CODE[i],
+            "tzname": self.TZNAME[i],
+            "tzinfo": self.TZINFO[i],
+            "timedelta": self.TIMEDELTA[i],
+        }
+
+    def column(self: CSVTimeZoneTable, key: str) -> List[str]:
+
+        return (self.COUNTRY_CODE, self.TZNAME, self.TZINFO, self.TIMEDELTA)[self.FIELD_NAMES.index(key)]
+
+    def find(self: CSVTimeZoneTable, fieldnames: List[str], checker: List[str]) -> int:
+
+        ##* candidates from the first field, same order as a full scan
+        rows: Tuple[int, ...]
+        rows = self.INDEX[fieldnames[0]].get(checker[0].lower(), ())
+
+        if len(fieldnames) == 1:
+
+            return rows[0] if rows else -1
+
+        columns: List[List[str]]
+        columns = [ self.column(key) for key in fieldnames ]
+
+        for i in rows:
+
+            passing: bool
+            passing = True
+
+            for k in range(1, len(fieldnames)):
+
+                if columns[k][i].lower() != checker[k].lower():
+
+                    passing = False
+                    break
+
+            if passing:
+
+                return i
+
+        return -1
+
+
 class CSVTimeZoneLoader(CSVTimeZoneLoaderType):
 
     DIGITS: str
@@ -24,8 +216,9 @@ class CSVTimeZoneLoader(CSVTimeZoneLoaderType):
 
     TZ_FILE_PATH: str
     TZ_FILE_STREAM: Union[io.TextIOWrapper, io.BytesIO, io.StringIO, tempfile._TemporaryFileWrapper, None]
+    TZ_FILE_KEY: Tuple[int, ...]
 
-    TZ_TABLE_DATA: List[Dict[str, str]]
+    TZ_TABLE: CSVTimeZoneTableType
 
     def __init__(self: CSVTimeZoneLoader, tzfile: Union[str, io.TextIOWrapper, io.BytesIO, io.StringIO, tempfile._TemporaryFileWrapper]) -> None:
         
@@ -39,10 +232,25 @@ class CSVTimeZoneLoader(CSVTimeZoneLoaderType):
             self.TZ_FILE_STREAM = tzfile
             self.TZ_FILE_PATH = ""
 
+        self.TZ_FILE_KEY = ()
+
+        ##* prefer -> AbbreviationIndex, for the table they were built from
+        self.__abbreviations = {}
+
         self.init()
 
+    @property
+    def TZ_TABLE_DATA(self: CSVTimeZoneLoader) -> CSVTimeZoneRowsType:
+
+        return self.TZ_TABLE.DATA
+
     def init(self: CSVTimeZoneLoader) -> None:
 
+        self.TZ_FILE_KEY = self.file_key()
+        self.TZ_TABLE = self.load()
+
+    def load(self: CSVTimeZoneLoader) -> CSVTimeZoneTableType:
+
         text_stream: Union[io.TextIOWrapper, io.BytesIO, io.StringIO, tempfile._TemporaryFileWrapper, None]
         text_stream = None
 
@@ -84,11 +292,66 @@ class CSVTimeZoneLoader(CSVTimeZoneLoaderType):
                 )
 
                 ##* normalize the data
-                self.TZ_TABLE_DATA = [ row for row in datz ]
+                return CSVTimeZoneTable(rows=[ row for row in datz ])
         else:
 
             raise CSVTimeZoneLoaderInitError(f"No timezone file specified.")
 
+    def file_key(self: CSVTimeZoneLoader) -> Tuple[int, ...]:
+
+        ##* streams have no identity on disk
+        if not self.TZ_FILE_PATH or not os.path.exists(self.TZ_FILE_PATH):
+
+            return ()
+
+        st: os.stat_result
+        st = os.stat(self.TZ_FILE_PATH)
+
+        return (st.st_mtime_ns, st.st_size)
+
+    def reload(self: CSVTimeZoneLoader) -> bool:
+
+        if not self.TZ_FILE_PATH:
+
+            raise CSVTimeZoneLoaderInitError(f"Only path based loaders can be reloaded.")
+
+        key: Tuple[int, ...]
+        key = self.file_key()
+
+        ##* build off to the side, then swap in one assignment
+        table: CSVTimeZoneTableType
+        table = self.load()
+
+        self.TZ_TABLE = table
+        self.TZ_FILE_KEY = key
+
+        return True
+
+    def zone(self: CSVTimeZoneLoader, td_str: str) -> Tuple[dt.timezone, str, str]:
+
+        table: CSVTimeZoneTableType
+        table = self.TZ_TABLE
+
+        zone: Union[Tuple[dt.timezone, str, str], None]
+        zone = table.ZONES.get(td_str)
+
+        if zone is None:
+
+            tzname: str
+            tzname = self.get_tzname(td_str=td_str)
+
+            if tzname == "UTC":
+
+                zone = (dt.timezone.utc, "Etc/Universal", tzname)
+
+            else:
+
+                zone = (dt.timezone(offset=self.timedelta(td_str=td_str), name=tzname), self.get_tzinfo(tzname=tzname), tzname)
+
+            table.ZONES[td_str] = zone
+
+        return zone
+
     def timezone(self: CSVTimeZoneLoader, td_str: str) -> dt.timezone:
 
         if not td_str:
@@ -156,7 +419,7 @@ class CSVTimeZoneLoader(CSVTimeZoneLoaderType):
 
     def get_td(self: CSVTimeZoneLoader, country_code: str = "", tzname: str = "", tzinfo: str = "", timedelta: str = "") -> str:
 
-        if hasattr(self, "TZ_TABLE_DATA"):
+        if hasattr(self, "TZ_TABLE"):
 
             fieldnames: List[str, Any, Any]
             fieldnames = []
@@ -184,64 +447,39 @@ class CSVTimeZoneLoader(CSVTimeZoneLoaderType):
                 fieldnames.append("timedelta")
                 checker.append(timedelta)
 
-            fieldnum: int
-            fieldnum = len(fieldnames)
-
-            checknum: int
-            checknum = len(checker)
-
-            if checknum == 0:
+            if not checker:
 
                 raise CSVTimeZoneLoaderInitError(f"No country_code, tzname, or tzinfo specified.")
 
-            for row in self.TZ_TABLE_DATA:
-
-                passing: bool
-                passing = True
-
-                ##* checker is a list of strings
-                for i in range(fieldnum):
-
-                    if i < checknum:
-
-                        key: str
-                        value: str
+            table: CSVTimeZoneTableType
+            table = self.TZ_TABLE
 
-                        key = fieldnames[i]
-                        value = checker[i]
+            i: int
+            i = table.find(fieldnames=fieldnames, checker=checker)
 
-                        if row[key].lower() != value.lower():
+            if i >= 0:
 
-                            passing = False
-                            break
+                if table.TIMEDELTA[i] == "":
 
-                    else:
-
-                        break
-
-                if passing:
-
-                    if row["timedelta"] == "":
+                    raise CSVTimeZoneLoaderInitError(f"No timedelta found!")
 
-                        raise CSVTimeZoneLoaderInitError(f"No timedelta found!")
+                if table.TZNAME[i] == "":
 
-                    if row["tzname"] == "":
+                    raise CSVTimeZoneLoaderInitError(f"No timezone name found!")
 
-                        raise CSVTimeZoneLoaderInitError(f"No timezone name found!")
+                return table.TIMEDELTA[i] + "," + table.TZNAME[i]
 
-                    return row["timedelta"] + "," + row["tzname"]
+                # if not tzname:
 
-                    # if not tzname:
+                #     if row["tzname"] == "":
 
-                    #     if row["tzname"] == "":
+                #         raise CSVTimeZoneLoaderInitError(f"No timezone name found!")
 
-                    #         raise CSVTimeZoneLoaderInitError(f"No timezone name found!")
+                #     return row["timedelta"] + "," + row["tzname"]
 
-                    #     return row["timedelta"] + "," + row["tzname"]
+                # else:
 
-                    # else:
-
-                    #     return row["timedelta"] + "," + tzname
+                #     return row["timedelta"] + "," + tzname
 
         else:
 
@@ -251,7 +489,7 @@ class CSVTimeZoneLoader(CSVTimeZoneLoaderType):
 
     def get_tzinfo(self: CSVTimeZoneLoader, country_code: str = "", tzname: str = "") -> str:
 
-        if hasattr(self, "TZ_TABLE_DATA"):
+        if hasattr(self, "TZ_TABLE"):
 
             fieldnames: List[str, Any, Any]
             fieldnames = []
@@ -269,54 +507,112 @@ class CSVTimeZoneLoader(CSVTimeZoneLoaderType):
                 fieldnames.append("tzname")
                 checker.append(tzname)
 
-            fieldnum: int
-            fieldnum = len(fieldnames)
+            if not checker:
+
+                raise CSVTimeZoneLoaderInitError(f"No country_code, tzname, or tzinfo specified.")
 
-            checknum: int
-            checknum = len(checker)
+            table: CSVTimeZoneTableType
+            table = self.TZ_TABLE
 
-            if checknum == 0:
+            i: int
+            i = table.find(fieldnames=fieldnames, checker=checker)
 
-                raise CSVTimeZoneLoaderInitError(f"No country_code, tzname, or tzinfo specified.")
+            if i >= 0:
 
-            for row in self.TZ_TABLE_DATA:
+                if table.TZINFO[i] == "":
 
-                passing: bool
-                passing = True
+                    raise CSVTimeZoneLoaderInitError(f"No timezone info found!")
 
-                ##* checker is a list of strings
-                for i in range(fieldnum):
+                return table.TZINFO[i]
 
-                    if i < checknum:
+        else:
 
-                        key: str
-                        value: str
+            raise CSVTimeZoneLoaderInitError(f"CSVTimeZoneLoader has not been initialized.")
 
-                        key = fieldnames[i]
-                        value = checker[i]
+        return ""
 
-                        if row[key].lower() != value.lower():
+    def abbreviations(self: CSVTimeZoneLoader, prefer: Iterable[str] = ()) -> AbbreviationIndexType:
 
-                            passing = False
-                            break
+        """abbreviations(prefer regions) -> AbbreviationIndex over the current table, built once per table"""
 
-                    else:
+        key: Tuple[str, ...]
+        key = tuple(prefer)
 
-                        break
+        index: Union[AbbreviationIndexType, None]
+        index = self.__abbreviations.get(key)
 
-                if passing:
+        ##* a reload swaps the table, the old index is stale then
+        if index is None or index.TABLE is not self.TZ_TABLE:
 
-                    if row["tzinfo"] == "":
+            index = AbbreviationIndex(table=self.TZ_TABLE, prefer=key)
+            self.__abbreviations[key] = index
 
-                        raise CSVTimeZoneLoaderInitError(f"No timezone info found!")
+        return index
 
-                    return row["tzinfo"]
 
-        else:
+CSVTimeZoneLoaderRegistry: Any
+CSVTimeZoneLoaderRegistry = TypeVar('CSVTimeZoneLoaderRegistry', bound='CSVTimeZoneLoaderRegistry')
 
-            raise CSVTimeZoneLoaderInitError(f"CSVTimeZoneLoader has not been initialized.")
-        
-        return ""
+class CSVTimeZoneLoaderRegistry(CSVTimeZoneLoaderRegistryType):
+
+    ##* abspath -> shared loader, key checked against (mtime, size)
+    LOADERS: Dict[str, CSVTimeZoneLoaderType]
+    LOADERS = {}
+
+    LOCK: threading.Lock
+    LOCK = threading.Lock()
+
+    @classmethod
+    def get(cls: CSVTimeZoneLoaderRegistry, path: str) -> CSVTimeZoneLoaderType:
+
+        path = os.path.abspath(path)
+
+        ctz: Union[CSVTimeZoneLoaderType, None]
+        ctz = cls.LOADERS.get(path)
+
+        ##* fast path, no lock
+        if ctz is not None and ctz.TZ_FILE_KEY == ctz.file_key():
+
+            return ctz
+
+        with cls.LOCK:
+
+            ctz = cls.LOADERS.get(path)
+
+            if ctz is None:
+
+                ctz = CSVTimeZoneLoader(tzfile=path)
+                cls.LOADERS[path] = ctz
+
+            elif ctz.TZ_FILE_KEY != ctz.file_key():
+
+                ctz.reload()
+
+            return ctz
+
+    @classmethod
+    def reload(cls: CSVTimeZoneLoaderRegistry, path: str = "") -> int:
+
+        n: int
+        n = 0
+
+        with cls.LOCK:
+
+            for key, ctz in list(cls.LOADERS.items()):
+
+                if not path or key == os.path.abspath(path):
+
+                    ctz.reload()
+                    n += 1
+
+        return n
+
+    @classmethod
+    def clear(cls: CSVTimeZoneLoaderRegistry) -> None:
+
+        with cls.LOCK:
+
+            cls.LOADERS = {}
 
 
 DateTime: Any
@@ -336,6 +632,26 @@ class DateTime(DateTimeType):
 
     CTZ: CSVTimeZoneLoaderType
 
+    EPOCH: dt.datetime
+    EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+    EPOCH_NAIVE: dt.datetime
+    EPOCH_NAIVE = dt.datetime(1970, 1, 1)
+
+    ONE_US: dt.timedelta
+    ONE_US = dt.timedelta(microseconds=1)
+
+    ##* below the microsecond of DATETIME, 0 to 999
+    NANOSECONDS: int
+    NANOSECONDS = 0
+
+    ##* a fraction with more digits than microseconds
+    FRACTION_NS: re.Pattern
+    FRACTION_NS = re.compile(r"(?<=\d)\.(\d{7,9})(?!\d)")
+
+    STR_FORMATTER: FormatterType
+    STR_FORMATTER = Formatter(pattern="iso")
+
     def __init__(self: DateTime) -> None:
 
         self.init()
@@ -346,16 +662,174 @@ class DateTime(DateTimeType):
 
     def __str__(self: DateTime) -> str:
 
-        return self.to_str(
-            years=self.get_year(),
-            month=self.get_month(),
-            days=self.get_day(),
-            hours=self.get_hours(),
-            minutes=self.get_minutes(),
-            seconds=self.get_seconds(),
-            milliseconds=0,
-            microseconds=0,
-        )
+        ##* fields are already normalized, no date_fix needed
+        return self.STR_FORMATTER.format(self)
+
+    def __hash__(self: DateTime) -> int:
+
+        return hash(self.get_instant())
+
+    def __eq__(self: DateTime, other: Any) -> bool:
+
+        if not isinstance(other, DateTimeType):
+
+            return NotImplemented
+
+        return self.get_instant_ns() == other.get_instant_ns()
+
+    def __ne__(self: DateTime, other: Any) -> bool:
+
+        if not isinstance(other, DateTimeType):
+
+            return NotImplemented
+
+        return self.get_instant_ns() != other.get_instant_ns()
+
+    def __lt__(self: DateTime, other: Any) -> bool:
+
+        if not isinstance(other, DateTimeType):
+
+            return NotImplemented
+
+        return self.get_instant_ns() < other.get_instant_ns()
+
+    def __le__(self: DateTime, other: Any) -> bool:
+
+        if not isinstance(other, DateTimeType):
+
+            return NotImplemented
+
+        return self.get_instant_ns() <= other.get_instant_ns()
+
+    def __gt__(self: DateTime, other: Any) -> bool:
+
+        if not isinstance(other, DateTimeType):
+
+            return NotImplemented
+
+        return self.get_instant_ns() > other.get_instant_ns()
+
+    def __ge__(self: DateTime, other: Any) -> bool:
+
+        if not isinstance(other, DateTimeType):
+
+            return NotImplemented
+
+        return self.get_instant_ns() >= other.get_instant_ns()
+
+    def __add__(self: DateTime, other: Any) -> DateTimeType:
+
+        if not isinstance(other, DurationType):
+
+            return NotImplemented
+
+        d: DateTimeType
+        d = self.copy()
+
+        if other.MONTHS:
+
+            d.DATETIME = d.shift_months(months=other.MONTHS)
+
+        d.DATETIME = d.DATETIME + dt.timedelta(microseconds=other.MICROSECONDS)
+
+        if other.NANOSECONDS:
+
+            d.advance_ns(other.NANOSECONDS)
+
+        return d
+
+    def __radd__(self: DateTime, other: Any) -> DateTimeType:
+
+        return self.__add__(other)
+
+    def __sub__(self: DateTime, other: Any) -> Any:
+
+        if isinstance(other, DateTimeType):
+
+            ##* exact to the nanosecond, sub-microsecond digits land in Duration.NANOSECONDS
+            return Duration(ns=self.diff_ns(other))
+
+        if isinstance(other, DurationType):
+
+            return self.__add__(-other)
+
+        return NotImplemented
+
+    def copy(self: DateTime) -> DateTimeType:
+
+        return copy.copy(self)
+
+    def diff(self: DateTime, other: DateTimeType) -> int:
+
+        """diff(microseconds, exact, any zones)"""
+
+        return self.get_instant() - other.get_instant()
+
+    def diff_ns(self: DateTime, other: DateTimeType) -> int:
+
+        """diff(nanoseconds, exact, any zones)"""
+
+        return self.get_instant_ns() - other.get_instant_ns()
+
+    def shift_months(self: DateTime, months: int, policy: str = "clamp") -> dt.datetime:
+
+        """shift_months(months), 31 jan + 1 month is 28/29 feb (clamp) or 2/3 mar (overflow)"""
+
+        DATETIME: dt.datetime
+        DATETIME = self.DATETIME
+
+        Y: int
+        m: int
+        d: int
+        Y, m, d = CalendarKernel.shift_months(DATETIME.year, DATETIME.month, DATETIME.day, months, policy)
+
+        return DATETIME.replace(year=Y, month=m, day=d)
+
+    def shift_years(self: DateTime, years: int, policy: str = "clamp") -> dt.datetime:
+
+        """shift_years(years), 29 feb + 1 year is 28 feb (clamp) or 1 mar (overflow)"""
+
+        return self.shift_months(years * 12, policy)
+
+    def get_instant_ns(self: DateTime) -> int:
+
+        """instant(nanoseconds since 1970-01-01T00:00:00Z)"""
+
+        return self.get_instant() * 1000 + self.NANOSECONDS
+
+    def get_instant(self: DateTime) -> int:
+
+        """instant(microseconds since 1970-01-01T00:00:00Z)"""
+
+        DATETIME: dt.datetime
+        DATETIME = self.DATETIME
+
+        ##* cached per DATETIME object, any reassignment invalidates it
+        cache: Union[Tuple[dt.datetime, str, int], None]
+        cache = getattr(self, "_DateTime__instant", None)
+
+        if cache is not None and cache[0] is DATETIME and cache[1] == self.TIMEDELTA:
+
+            return cache[2]
+
+        key: int
+
+        if DATETIME.tzinfo is not None:
+
+            key = (DATETIME - self.EPOCH) // self.ONE_US
+
+        else:
+
+            ##* naive means local fields in TIMEDELTA
+            key = (DATETIME - self.EPOCH_NAIVE) // self.ONE_US
+
+            if hasattr(self, "CTZ"):
+
+                key -= self.CTZ.timedelta(td_str=self.TIMEDELTA) // self.ONE_US
+
+        self.__instant = (DATETIME, self.TIMEDELTA, key)
+
+        return key
 
     def init(self: DateTime) -> None:
 
@@ -503,8 +977,30 @@ class DateTime(DateTimeType):
 
         return True if country_code or tzinfo or tzname else False
 
+    def split_ns(self: DateTime, context: str) -> Tuple[str, int]:
+
+        """split_ns(\"2002-07-07T10:00:00.123456789Z\") -> (\"2002-07-07T10:00:00.123456Z\", 789)"""
+
+        ##* any layout, the first fraction of 7 to 9 digits after a digit
+        if "." not in context:
+
+            return (context, 0)
+
+        match: Union[re.Match, None]
+        match = self.FRACTION_NS.search(context)
+
+        if match is None:
+
+            return (context, 0)
+
+        ##* the ones past 6 are nanoseconds
+        return (context[:match.start(1) + 6] + context[match.end(1):], int(match.group(1)[6:].ljust(3, "0")))
+
     def str_to_dt(self: DateTime, context: str, tz: Union[dt.timezone, None] = None) -> dt.datetime:
 
+        ##* nanoseconds are truncated, datetime holds microseconds
+        context = self.split_ns(context)[0]
+
         n: int
         n = len(context)
 
@@ -626,6 +1122,17 @@ class DateTime(DateTimeType):
 
     def to_dt(self: DateTime, td_str: str = "") -> dt.datetime:
 
+        if not td_str:
+
+            scope: Union[ZoneScopeType, None]
+            scope = ZoneScope.current()
+
+            if scope is not None and scope.TIMEDELTA != self.TIMEDELTA:
+
+                return self.DATETIME.replace(tzinfo=scope.TIMEZONE) \
+                    + scope.DELTA \
+                        - dt.timedelta(seconds=CalendarKernel.offset(self.TIMEDELTA))
+
         if td_str:
 
             ## todos: CTZ maybe is None
@@ -652,6 +1159,9 @@ class DateTime(DateTimeType):
 
             self.DATETIME = dt
 
+            ##* a new instant, nothing below its microsecond
+            self.NANOSECONDS = 0
+
             self.TZ_INFO = self.CTZ.get_tzinfo(tzname=tzname)
             self.TZ_NAME = tzname
 
@@ -677,6 +1187,8 @@ class DateTime(DateTimeType):
                 + self.CTZ.timedelta(td_str=self.TIMEDELTA) \
                     - self.CTZ.timedelta(td_str=td)
 
+            self.NANOSECONDS = 0
+
             # self.TZ_INFO = self.CTZ.get_tzname(td_str=td)
             # self.TZ_NAME = tzname
 
@@ -686,7 +1198,11 @@ class DateTime(DateTimeType):
 
             raise DateTimeInitError(f"No timezone specified.")
 
-    def to_str(self: DateTime, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0, milliseconds: int = 0, microseconds: int = 0) -> str:
+    def to_str(self: DateTime, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0, milliseconds: int = 0, microseconds: int = 0, nanoseconds: int = 0) -> str:
+
+        ##* the fields are given explicitly, a zone scope does not apply to them
+        microseconds += nanoseconds // 1000
+        nanoseconds = nanoseconds % 1000
 
         _Y: int
         _m: int
@@ -709,45 +1225,22 @@ class DateTime(DateTimeType):
             microseconds=microseconds
         )
 
-        Y: str
-        Y = str(_Y).zfill(4)
+        D2: List[str]
+        D2 = CalendarKernel.DIGITS2
 
-        m: str
-        m = str(_m).zfill(2)
-        
-        d: str
-        d = str(_d).zfill(2)
-
-        H: str
-        H = str(_H).zfill(2)
-        
-        M: str
-        M = str(_M).zfill(2)
-
-        S: str
-        S = str(_S).zfill(2)
-
-        s: str
-        s = str(_s).zfill(3)
-
-        f: str
-        f = str(_f).zfill(3)
+        D3: List[str]
+        D3 = CalendarKernel.DIGITS3
 
         context: str
+        context = (CalendarKernel.DIGITS4[_Y] if 0 <= _Y < 10000 else str(_Y).zfill(4)) + "-" + D2[_m] + "-" + D2[_d] + "T" + D2[_H] + ":" + D2[_M] + ":" + D2[_S]
 
-        if s != "000":
-
-            if f != "000":
-                
-                context = f"{Y}-{m}-{d}T{H}:{M}:{S}.{s}{f}"
-
-            else:
+        if nanoseconds:
 
-                context = f"{Y}-{m}-{d}T{H}:{M}:{S}.{s}"
+            context = context + "." + D3[_s] + D3[_f] + D3[nanoseconds]
 
-        else:
+        elif _s:
 
-            context = f"{Y}-{m}-{d}T{H}:{M}:{S}"
+            context = context + "." + D3[_s] + D3[_f] if _f else context + "." + D3[_s]
 
         context = context + "Z" if self.TZ_NAME == "UTC" else context
 
@@ -850,17 +1343,21 @@ class DateTime(DateTimeType):
 
     def enhance_tm_sec(self: DateTime, sec: int) -> DateTimeType:
 
-        return self.enhance_tm_auto(sec=sec)
+        return self.copy().advance_sec(sec)
 
     def enhance_tm_ms(self: DateTime, ms: int) -> DateTimeType:
 
-        return self.enhance_tm_auto(ms=ms)
+        return self.copy().advance_ms(ms)
 
     def enhance_tm_us(self: DateTime, us: int) -> DateTimeType:
 
-        return self.enhance_tm_auto(us=us)
+        return self.copy().advance_us(us)
+
+    def enhance_tm_ns(self: DateTime, ns: int) -> DateTimeType:
 
-    def enhance_tm_auto(self: DateTime, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, sec: int = 0, ms: int = 0, us: int = 0) -> DateTimeType:
+        return self.copy().advance_ns(ns)
+
+    def enhance_tm_auto(self: DateTime, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, sec: int = 0, ms: int = 0, us: int = 0, ns: int = 0) -> DateTimeType:
 
         if not hasattr(self, "CTZ"):
 
@@ -884,6 +1381,13 @@ class DateTime(DateTimeType):
         s = ms
         f = us
 
+        ##* nanoseconds carry into microseconds, the rest stays below
+        x: int
+        x = self.NANOSECONDS + ns
+
+        f += x // 1000
+        x = x % 1000
+
         ##* date normalize to stringify
         # context: str
         # context = self.to_str(
@@ -955,6 +1459,7 @@ class DateTime(DateTimeType):
         d.TZ_NAME = self.TZ_NAME
         d.TIMEDELTA = self.TIMEDELTA
         d.CTZ = self.CTZ
+        d.NANOSECONDS = x
         
         # if hasattr(self, "CTZ"):
 
@@ -966,6 +1471,56 @@ class DateTime(DateTimeType):
 
         return d
 
+    ##* enhance_tm_* and + return a new DateTime, this one is left alone
+    ##* enhance_tm_sec/ms/us/ns are copy().advance_*, both halves give the same instant
+    ##* advance_* change this one in place and return it, nothing else is built
+    ##* TimeFix.enhance_tm_* change the given one in place too, through advance_*
+
+    def advance_sec(self: DateTime, sec: int) -> DateTimeType:
+
+        return self.advance_us(sec * 1000000)
+
+    def advance_ms(self: DateTime, ms: int) -> DateTimeType:
+
+        return self.advance_us(ms * 1000)
+
+    def advance_us(self: DateTime, us: int) -> DateTimeType:
+
+        """advance_us(us) -> self, moved in place by whole microseconds"""
+
+        instant: int
+        instant = self.get_instant() + us
+
+        ##* fixed offsets, the local fields move by exactly as much as the instant
+        self.DATETIME = self.DATETIME + dt.timedelta(microseconds=us)
+        self.__instant = (self.DATETIME, self.TIMEDELTA, instant)
+
+        return self
+
+    def advance_ns(self: DateTime, ns: int) -> DateTimeType:
+
+        """advance_ns(ns) -> self, moved in place, carrying into microseconds"""
+
+        us: int
+        x: int
+        us, x = divmod(self.NANOSECONDS + ns, 1000)
+
+        self.NANOSECONDS = x
+
+        return self.advance_us(us) if us else self
+
+    def advance(self: DateTime, days: int = 0, hours: int = 0, minutes: int = 0, sec: int = 0, ms: int = 0, us: int = 0, ns: int = 0) -> DateTimeType:
+
+        """advance(days, hours, minutes, sec, ms, us, ns) -> self, in place, months and years go through shift_months"""
+
+        us += ((((days * 24 + hours) * 60 + minutes) * 60 + sec) * 1000 + ms) * 1000
+
+        if ns:
+
+            return self.advance_ns(us * 1000 + ns)
+
+        return self.advance_us(us) if us else self
+
     def get_struct_tm(self: DateTime, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0, weekdays: int = 0, yeardays: int = 0, is_dst: int = -1) -> time.struct_time:
         
         years = self.get_year() if years == 0 else years
@@ -1189,6 +1744,271 @@ class DateTime(DateTimeType):
         return 0
 
 
+LazyDateTime: Any
+LazyDateTime = TypeVar('LazyDateTime', bound='LazyDateTime')
+
+class LazyDateTime(DateTime, LazyDateTimeType):
+
+    ##* holds the text, parses on the first field access
+
+    STATE: Tuple[str, ...]
+    STATE = ("COUNTRY_CODE", "DATETIME", "TZ_NAME", "TZ_INFO", "TIMEDELTA", "CTZ")
+
+    RAW: Union[str, bytes, memoryview]
+
+    ##* 0 raw text, 1 parsed, 2 changed since, one int instead of two flags per object
+    RAW_STATE: int
+    RAW_STATE = 0
+
+    PARSED_STATE: int
+    PARSED_STATE = 1
+
+    DIRTY_STATE: int
+    DIRTY_STATE = 2
+
+    def __init__(self: LazyDateTime, context: Union[str, bytes, memoryview, None] = None, create: Union[Callable[[str], DateTimeType], None] = None) -> None:
+
+        self.__dict__["RAW"] = "" if context is None else context
+        self.__dict__["_LazyDateTime__create"] = create
+        self.__dict__["_LazyDateTime__state"] = self.RAW_STATE if context is not None else self.DIRTY_STATE
+
+        ##* no text, a plain DateTime, as enhance_tm_auto makes them
+        if context is None:
+
+            super().__init__()
+
+    def __repr__(self: LazyDateTime) -> str:
+
+        if self.__state == self.RAW_STATE:
+
+            return f"<LazyDateTime bound raw(\"{self.text()}\") at {hex(id(self))}>"
+
+        return f"<LazyDateTime bound dt.datetime(\"{self.DATETIME}\") at {hex(id(self))}>"
+
+    def __str__(self: LazyDateTime) -> str:
+
+        if self.__state != self.DIRTY_STATE:
+
+            return self.text()
+
+        return super().__str__()
+
+    def __getattr__(self: LazyDateTime, name: str) -> Any:
+
+        ##* only called for what is not there yet
+        if name not in self.STATE or self.__state != self.RAW_STATE:
+
+            raise AttributeError(f"{self.__class__.__name__} object has no attribute {name}")
+
+        self.load()
+
+        return self.__dict__[name]
+
+    def __setattr__(self: LazyDateTime, name: str, value: Any) -> None:
+
+        if name in self.STATE or name == "NANOSECONDS":
+
+            ##* set after parsing, or parsing would overwrite it
+            self.load()
+            self.__dict__["_LazyDateTime__state"] = self.DIRTY_STATE
+
+        self.__dict__[name] = value
+
+    @property
+    def NANOSECONDS(self: LazyDateTime) -> int:
+
+        self.load()
+
+        return self.__dict__.get("NANOSECONDS", 0)
+
+    def text(self: LazyDateTime) -> str:
+
+        RAW: Union[str, bytes, memoryview]
+        RAW = self.RAW
+
+        return RAW if isinstance(RAW, str) else bytes(RAW).decode("ascii")
+
+    def loaded(self: LazyDateTime) -> bool:
+
+        return self.__state != self.RAW_STATE
+
+    def load(self: LazyDateTime) -> None:
+
+        if self.__state != self.RAW_STATE:
+
+            return
+
+        ##* first, so lookups during parsing do not come back here
+        self.__dict__["_LazyDateTime__state"] = self.PARSED_STATE
+
+        try:
+
+            d: DateTimeType
+            d = self.__create(self.text())
+
+        except Exception:
+
+            self.__dict__["_LazyDateTime__state"] = self.RAW_STATE
+            raise
+
+        self.__dict__.update(d.__dict__)
+
+    def to_str(self: LazyDateTime, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0, milliseconds: int = 0, microseconds: int = 0, nanoseconds: int = 0) -> str:
+
+        if self.__state != self.DIRTY_STATE and not (years or month or days or hours or minutes or seconds or milliseconds or microseconds or nanoseconds):
+
+            return self.text()
+
+        return super().to_str(years, month, days, hours, minutes, seconds, milliseconds, microseconds, nanoseconds)
+
+
+Duration: Any
+Duration = TypeVar("Duration", bound="Duration")
+
+class Duration(DurationType):
+
+    ##* calendar part, only exact once applied to a DateTime
+    MONTHS: int
+
+    ##* exact part, floored to microseconds
+    MICROSECONDS: int
+
+    ##* sub-microsecond digits of the exact part, 0-999 like DateTime.NANOSECONDS
+    NANOSECONDS: int
+
+    def __init__(self: Duration, years: int = 0, month: int = 0, days: int = 0, hours: int = 0, minutes: int = 0, sec: int = 0, ms: int = 0, us: int = 0, ns: int = 0) -> None:
+
+        self.MONTHS = years * 12 + month
+        self.MICROSECONDS, self.NANOSECONDS = divmod((((((days * 24 + hours) * 60 + minutes) * 60 + sec) * 1000 + ms) * 1000 + us) * 1000 + ns, 1000)
+
+    def __repr__(self: Duration) -> str:
+
+        return f"<Duration bound months({self.MONTHS}) microseconds({self.MICROSECONDS}) nanoseconds({self.NANOSECONDS}) at {hex(id(self))}>"
+
+    def __str__(self: Duration) -> str:
+
+        ##* ISO 8601, P1Y2M3DT4H5M6.000007S, up to nine fraction digits
+        ##* one leading sign when both parts agree, else each part signed on its own, P-1M3D
+        exact: int
+        exact = self.get_nanoseconds()
+
+        mixed: bool
+        mixed = self.MONTHS * exact < 0
+
+        sign: str
+        sign = "-" if not mixed and (self.MONTHS < 0 or exact < 0) else ""
+
+        a: str
+        a = "-" if mixed and self.MONTHS < 0 else ""
+
+        b: str
+        b = "-" if mixed and exact < 0 else ""
+
+        Y: int
+        m: int
+        Y, m = divmod(abs(self.MONTHS), 12)
+
+        d: int
+        f: int
+        d, f = divmod(abs(exact), 86400000000000)
+
+        H: int
+        M: int
+        S: int
+        H, f = divmod(f, 3600000000000)
+        M, f = divmod(f, 60000000000)
+        S, f = divmod(f, 1000000000)
+
+        context: str
+        context = sign + "P"
+        context += f"{a}{Y}Y" if Y else ""
+        context += f"{a}{m}M" if m else ""
+        context += f"{b}{d}D" if d else ""
+
+        if H or M or S or f:
+
+            context += "T"
+            context += f"{b}{H}H" if H else ""
+            context += f"{b}{M}M" if M else ""
+
+            if f:
+
+                context += f"{b}{S}.{str(f).zfill(9).rstrip('0')}S"
+
+            elif S:
+
+                context += f"{b}{S}S"
+
+        return context if context != "P" else "PT0S"
+
+    def __hash__(self: Duration) -> int:
+
+        return hash((self.MONTHS, self.MICROSECONDS, self.NANOSECONDS))
+
+    def __eq__(self: Duration, other: Any) -> bool:
+
+        if not isinstance(other, DurationType):
+
+            return NotImplemented
+
+        return self.MONTHS == other.MONTHS and self.MICROSECONDS == other.MICROSECONDS and self.NANOSECONDS == other.NANOSECONDS
+
+    def __neg__(self: Duration) -> DurationType:
+
+        return Duration(month=-self.MONTHS, ns=-self.get_nanoseconds())
+
+    def __add__(self: Duration, other: Any) -> DurationType:
+
+        if not isinstance(other, DurationType):
+
+            return NotImplemented
+
+        return Duration(month=self.MONTHS + other.MONTHS, ns=self.get_nanoseconds() + other.get_nanoseconds())
+
+    def __sub__(self: Duration, other: Any) -> DurationType:
+
+        if not isinstance(other, DurationType):
+
+            return NotImplemented
+
+        return Duration(month=self.MONTHS - other.MONTHS, ns=self.get_nanoseconds() - other.get_nanoseconds())
+
+    def __mul__(self: Duration, other: Any) -> DurationType:
+
+        if not isinstance(other, int):
+
+            return NotImplemented
+
+        return Duration(month=self.MONTHS * other, ns=self.get_nanoseconds() * other)
+
+    def __rmul__(self: Duration, other: Any) -> DurationType:
+
+        return self.__mul__(other)
+
+    def get_months(self: Duration) -> int:
+
+        return self.MONTHS
+
+    def get_microseconds(self: Duration) -> int:
+
+        return self.MICROSECONDS
+
+    def get_nanoseconds(self: Duration) -> int:
+
+        """get_nanoseconds() -> the exact part in nanoseconds"""
+
+        return self.MICROSECONDS * 1000 + self.NANOSECONDS
+
+    def to_timedelta(self: Duration) -> dt.timedelta:
+
+        ##* timedelta stops at microseconds, NANOSECONDS is dropped like get_instant does
+        if self.MONTHS:
+
+            raise DurationInitError(f"Calendar months have no fixed length.")
+
+        return dt.timedelta(microseconds=self.MICROSECONDS)
+
+
 class TimeFix(TimeFixType):
 
     MONTH_FULLNAMES: List[str]
@@ -1212,9 +2032,18 @@ class TimeFix(TimeFixType):
     __dt_datetime: type
     __dt_datetime = dt.datetime
 
+    ##* (cls, tzname, tzinfo) -> create_dt partial, shared by every LazyDateTime of that zone
+    __lazy_create: Dict[Tuple[type, str, str], Callable[[str], DateTimeType]]
+    __lazy_create = {}
+
     def __init__(self: TimeFixType, tzfile: Union[str, io.TextIOWrapper, io.BytesIO, io.StringIO, tempfile._TemporaryFileWrapper, None] = None) -> None:
 
-        if tzfile:
+        if isinstance(tzfile, str):
+
+            ##* shared, read-only
+            self.CTZ = CSVTimeZoneLoaderRegistry.get(path=tzfile)
+
+        elif tzfile:
 
             self.CTZ = CSVTimeZoneLoader(tzfile=tzfile)
 
@@ -1232,7 +2061,11 @@ class TimeFix(TimeFixType):
 
         elif isinstance(dt, str):
 
-            d.DATETIME = d.str_to_dt(dt)
+            ##* digits past the microsecond are kept aside
+            context: str
+            context, d.NANOSECONDS = d.split_ns(dt)
+
+            d.DATETIME = d.str_to_dt(context)
 
         elif isinstance(dt, cls.__dt_datetime):
 
@@ -1242,6 +2075,21 @@ class TimeFix(TimeFixType):
 
             pass
 
+        scope: Union[ZoneScopeType, None]
+        scope = None if tzname or tzinfo else ZoneScope.current()
+
+        ##* the zone was resolved when the scope was made, no lookups here
+        if scope is not None and (dt is None or d.DATETIME.tzinfo is None):
+
+            ##* same shift init() makes from the UTC default
+            d.DATETIME = d.DATETIME.replace(tzinfo=scope.TIMEZONE) + scope.DELTA
+
+            d.TZ_NAME = scope.TZ_NAME
+            d.TZ_INFO = scope.TZ_INFO
+            d.TIMEDELTA = scope.TIMEDELTA
+
+            return d
+
         #************************************************************************************************#
         #* re-initialized                                                                               *#
         #************************************************************************************************#
@@ -1263,6 +2111,513 @@ class TimeFix(TimeFixType):
 
         return d
 
+    @classmethod
+    def zone(cls: TimeFixType, tzname: str = "", tzinfo: str = "", country_code: str = "") -> ZoneScopeType:
+
+        """zone(tzname | tzinfo | country_code) -> ZoneScope, resolved once, use as "with" or a decorator"""
+
+        if tzname == "UTC" or tzinfo == "Etc/Universal":
+
+            return ZoneScope(td_str="+0000,UTC", tzinfo="Etc/Universal")
+
+        td_str: str
+        td_str = cls.CTZ.get_td(country_code=country_code, tzname=tzname, tzinfo=tzinfo)
+
+        if not td_str:
+
+            raise CSVTimeZoneLoaderInitError(f"No timezone found for {tzname or tzinfo or country_code}.")
+
+        if not tzinfo:
+
+            tzinfo = cls.CTZ.get_tzinfo(country_code=country_code, tzname=tzname)
+
+        return ZoneScope(td_str=td_str, tzinfo=tzinfo)
+
+    @classmethod
+    def create_lazy_dt(cls: TimeFixType, context: Union[str, bytes, memoryview], tzname: str = "", tzinfo: str = "") -> LazyDateTimeType:
+
+        """like create_dt(str), parsed on first access, str() gives the text back until changed"""
+
+        key: Tuple[type, str, str]
+        key = (cls, tzname, tzinfo)
+
+        create: Union[Callable[[str], DateTimeType], None]
+        create = cls.__lazy_create.get(key)
+
+        if create is None:
+
+            create = cls.__lazy_create[key] = functools.partial(cls.create_dt, tzname=tzname, tzinfo=tzinfo)
+
+        return LazyDateTime(context=context, create=create)
+
+    @classmethod
+    def merge(cls: TimeFixType, *iterables: Iterable[Any], key: Union[Callable[[Any], int], None] = None) -> Iterator[Any]:
+
+        ##* streams must already be sorted, ties keep stream order
+        key = DateTime.get_instant_ns if key is None else key
+
+        heap: List[List[Any]]
+        heap = []
+
+        for i, it in enumerate(iterables):
+
+            stream: Iterator[Any]
+            stream = iter(it)
+
+            try:
+
+                value: Any
+                value = next(stream)
+
+            except StopIteration:
+
+                continue
+
+            heap.append([key(value), i, value, stream])
+
+        heapq.heapify(heap)
+
+        while len(heap) > 1:
+
+            while True:
+
+                top: List[Any]
+                top = heap[0]
+
+                yield top[2]
+
+                try:
+
+                    value = next(top[3])
+
+                except StopIteration:
+
+                    heapq.heappop(heap)
+                    break
+
+                top[0] = key(value)
+                top[2] = value
+
+                heapq.heapreplace(heap, top)
+
+        ##* last stream, no heap needed
+        if heap:
+
+            top = heap[0]
+
+            yield top[2]
+            yield from top[3]
+
+    @classmethod
+    def diff(cls: TimeFixType, start: DateTimeType, end: DateTimeType) -> int:
+
+        return end.get_instant() - start.get_instant()
+
+    @classmethod
+    def diff_many(cls: TimeFixType, start: Iterable[int], end: Iterable[int]) -> array.array:
+
+        ##* same unit in, same unit out, lengths checked up front, map would stop at the shorter
+        start = start if hasattr(start, "__len__") else list(start)
+        end = end if hasattr(end, "__len__") else list(end)
+
+        if len(start) != len(end):
+
+            raise DurationInitError(f"Columns have different lengths.")
+
+        return array.array("q", map(operator.sub, end, start))
+
+    @classmethod
+    def to_dt_many(cls: TimeFixType, values: List[DateTimeType], td_str: Union[str, Iterable[str]]) -> List[dt.datetime]:
+
+        """to_dt_many(DateTimes, td_str or one td_str per item) -> [ value.to_dt(td_str) ], in input order"""
+
+        targets: List[str]
+        targets = [ td_str ] * len(values) if isinstance(td_str, str) else list(td_str)
+
+        if len(targets) != len(values):
+
+            raise DateTimeInitError(f"Got {len(targets)} zones for {len(values)} values.")
+
+        ##* (source, target) -> positions
+        groups: Dict[Tuple[str, str], List[int]]
+        groups = {}
+
+        for i, (value, target) in enumerate(zip(values, targets)):
+
+            key: Tuple[str, str]
+            key = (value.TIMEDELTA, target)
+
+            group: Union[List[int], None]
+            group = groups.get(key)
+
+            if group is None:
+
+                groups[key] = [ i ]
+
+            else:
+
+                group.append(i)
+
+        out: List[Any]
+        out = [ None ] * len(values)
+
+        ctz: CSVTimeZoneLoaderType
+        ctz = cls.CTZ
+
+        ##* an empty target is the zone scope, like to_dt
+        scope: Union[ZoneScopeType, None]
+        scope = ZoneScope.current()
+
+        for (source, target), group in groups.items():
+
+            if not target and (scope is None or scope.TIMEDELTA == source):
+
+                for i in group:
+
+                    out[i] = values[i].DATETIME
+
+                continue
+
+            ##* once per pair, same arithmetic as to_dt
+            tz: dt.timezone
+            delta: dt.timedelta
+
+            if not target:
+
+                tz = scope.TIMEZONE
+                delta = scope.DELTA - dt.timedelta(seconds=CalendarKernel.offset(source))
+
+            else:
+
+                tz = ctz.timezone(td_str=target)
+                delta = ctz.timedelta(td_str=target) - ctz.timedelta(td_str=source)
+
+            for i in group:
+
+                out[i] = values[i].DATETIME.replace(tzinfo=tz) + delta
+
+        return out
+
+    @classmethod
+    def from_instant(cls: TimeFixType, instant: int, td_str: str = "+0000,UTC", precision: str = "us") -> DateTimeType:
+
+        x: int
+        x = 0
+
+        if precision == "ns":
+
+            instant, x = divmod(instant, 1000)
+
+        elif precision != "us":
+
+            raise DateTimeInitError(f"Invalid precision {precision}")
+
+        tz: dt.timezone
+        tzinfo: str
+        tzname: str
+        tz, tzinfo, tzname = cls.CTZ.zone(td_str=td_str)
+
+        ##* fields are known, skip init() and its lookups
+        d: DateTimeType
+        d = DateTime.__new__(DateTime)
+        d.CTZ = cls.CTZ
+        d.COUNTRY_CODE = ""
+        d.TZ_INFO = tzinfo
+        d.TZ_NAME = tzname
+        d.TIMEDELTA = td_str
+        d.DATETIME = (DateTime.EPOCH + dt.timedelta(microseconds=instant)).astimezone(tz)
+
+        if x:
+
+            d.NANOSECONDS = x
+
+        return d
+
+    @classmethod
+    def compile_parser(cls: TimeFixType, pattern: str, years: int = 0, precision: str = "us", hint: str = "") -> ParserType:
+
+        return Parser(
+            pattern=pattern,
+            ctz=cls.CTZ,
+            create=functools.partial(cls.from_instant, precision=precision),
+            month_names=cls.MONTH_NAMES,
+            month_fullnames=cls.MONTH_FULLNAMES,
+            weekday_names=cls.WEEKDAY_NAMES,
+            weekday_fullnames=cls.WEEKDAY_FULLNAMES,
+            years=years,
+            precision=precision,
+            hint=hint
+        )
+
+    @classmethod
+    def create_accumulator(cls: TimeFixType, start: Union[int, DateTimeType, None] = None, step: Union[int, DurationType] = 1, td_str: str = "", precision: str = "us") -> AccumulatorType:
+
+        """create_accumulator(DateTime | instant | now, step ticks | Duration) -> Accumulator"""
+
+        return Accumulator(
+            start=cls.create_dt(tzname="UTC").get_instant() * (CalendarKernel.TICKS[precision] // 1000000) if start is None else start,
+            step=step,
+            td_str=td_str,
+            precision=precision,
+            create=functools.partial(cls.from_instant, precision=precision)
+        )
+
+    @classmethod
+    def create_abbreviation_index(cls: TimeFixType, prefer: Iterable[str] = ()) -> AbbreviationIndexType:
+
+        return cls.CTZ.abbreviations(prefer=prefer)
+
+    @classmethod
+    def create_clock(cls: TimeFixType, tzname: str = "", tzinfo: str = "", granularity: int = 1000000, source: str = "wall") -> ClockType:
+
+        td_str: str
+
+        if tzname:
+
+            td_str = "+0000,UTC" if tzname == "UTC" else cls.CTZ.get_td(tzname=tzname)
+
+        elif tzinfo:
+
+            td_str = "+0000,UTC" if tzinfo == "Etc/Universal" else cls.CTZ.get_td(tzinfo=tzinfo)
+
+        else:
+
+            td_str = "+0000,UTC"
+
+        if not td_str:
+
+            raise CSVTimeZoneLoaderInitError(f"No timezone found for {tzname or tzinfo}.")
+
+        return Clock(
+            td_str=td_str,
+            create=cls.from_instant,
+            formatter=Formatter(pattern="%Y-%m-%dT%H:%M:%S", ctz=cls.CTZ),
+            granularity=granularity,
+            source=source
+        )
+
+    @classmethod
+    def create_column(cls: TimeFixType, instants: Iterable[int], td_str: str = "+0000,UTC", precision: str = "us") -> DateTimeColumnType:
+
+        return DateTimeColumn(instants=instants, td_str=td_str, create=functools.partial(cls.from_instant, precision=precision), precision=precision)
+
+    @classmethod
+    def create_column_from_epoch(cls: TimeFixType, values: Any, unit: str = "s", td_str: str = "+0000,UTC", precision: str = "us") -> DateTimeColumnType:
+
+        """like create_dt(int|float) for a whole array, in td_str, not the host zone"""
+
+        return DateTimeColumn.from_epoch(values=values, unit=unit, td_str=td_str, create=functools.partial(cls.from_instant, precision=precision), precision=precision)
+
+    @classmethod
+    def create_index(cls: TimeFixType, instants: Iterable[Any] = (), td_str: str = "+0000,UTC", precision: str = "us") -> TimeIndexType:
+
+        """bounds and values as instants, DateTime, strings or local (years, month, days, ...) in td_str"""
+
+        d: DateTimeType
+        d = DateTime()
+        d.set_ctz(cls.CTZ)
+
+        return TimeIndex(instants=instants, td_str=td_str, create=functools.partial(cls.from_instant, precision=precision), parse=d.str_to_dt, precision=precision)
+
+    @classmethod
+    def open_timestamps(cls: TimeFixType, path: str, precision: str = "us") -> TimestampFileType:
+
+        """open_timestamps(path) -> lazy, mmap backed sequence of DateTime"""
+
+        return TimestampFile(path=path, create=functools.partial(cls.from_instant, precision=precision), precision=precision)
+
+    @classmethod
+    def create_timestamp_writer(cls: TimeFixType, path: str, unit: str = "us", td_str: str = "+0000,UTC") -> TimestampFileWriterType:
+
+        return TimestampFileWriter(path=path, unit=unit, td_str=td_str)
+
+    @classmethod
+    def create_world_clock(cls: TimeFixType, zones: Iterable[str], pattern: str = "iso_offset") -> WorldClockType:
+
+        """zones as tznames (\"WIB\"), tzinfos (\"Asia/Jakarta\") or td_str (\"+0700,WIB\")"""
+
+        ##* resolved once, here, not per event
+        return WorldClock(zones=[ cls.resolve_td(zone) for zone in zones ], formatter=cls.compile_format(pattern) if pattern else None)
+
+    @classmethod
+    def resolve_td(cls: TimeFixType, zone: str) -> str:
+
+        """resolve_td(tzname | tzinfo | td_str) -> td_str"""
+
+        td_str: str
+
+        if zone.startswith(("+", "-")):
+
+            td_str = zone
+
+        elif zone in ("UTC", "Etc/Universal"):
+
+            td_str = "+0000,UTC"
+
+        else:
+
+            td_str = cls.CTZ.get_td(tzinfo=zone) if "/" in zone else cls.CTZ.get_td(tzname=zone)
+
+        if not td_str:
+
+            raise CSVTimeZoneLoaderInitError(f"No timezone found for {zone}.")
+
+        return td_str
+
+    @classmethod
+    def create_rule(cls: TimeFixType, context: str = "", zone: str = "UTC", **fields: Iterable[int]) -> RuleType:
+
+        """create_rule(\"0 9 * * mon\", \"WIB\") or create_rule(zone=\"CEST\", days=[-1], hours=[23])"""
+
+        td_str: str
+        td_str = cls.resolve_td(zone)
+
+        if context:
+
+            return Rule.from_cron(context, td_str=td_str)
+
+        return Rule(td_str=td_str, **fields)
+
+    @classmethod
+    def create_stream(cls: TimeFixType, fields: Iterable[str], pattern: str = "iso_offset_us", parser: str = "", td_str: str = "+0000,UTC", unit: str = "s", batch_size: int = 4096, queue_size: int = 4, executor: Any = None) -> StreamNormalizerType:
+
+        """create_stream([\"ts\", ...]), strings by the parser pattern or create_dt, numbers as epoch values in unit"""
+
+        parse: Callable[[str], int]
+
+        if parser:
+
+            parse_instant: Callable[[str], Tuple[int, str]]
+            parse_instant = cls.compile_parser(parser).parse_instant
+
+            parse = lambda context: parse_instant(context)[0]
+
+        else:
+
+            parse = lambda context: cls.create_dt(context).get_instant()
+
+        return StreamNormalizer(fields=fields, parse=parse, formatter=cls.compile_format(pattern), td_str=td_str, unit=unit, batch_size=batch_size, queue_size=queue_size, executor=executor)
+
+    @classmethod
+    def create_interval(cls: TimeFixType, start: Union[int, DateTimeType], stop: Union[int, DateTimeType]) -> IntervalType:
+
+        return Interval(start, stop)
+
+    @classmethod
+    def create_interval_index(cls: TimeFixType, intervals: Iterable[Any]) -> IntervalIndexType:
+
+        """intervals as Intervals, (start, stop) instants or (start, stop) DateTimes from any zones"""
+
+        return IntervalIndex(intervals=[ value if isinstance(value, IntervalType) else Interval(*value) for value in intervals ])
+
+    @classmethod
+    def load_business_calendars(cls: TimeFixType, tzfile: Union[str, io.TextIOWrapper, io.StringIO], weekend: Iterable[int] = (5, 6)) -> Dict[str, BusinessCalendarType]:
+
+        """load_business_calendars(\"country_code,YYYY-MM-DD[,name]\" csv) -> country_code -> BusinessCalendar"""
+
+        calendars: Dict[str, BusinessCalendarType]
+        calendars = BusinessCalendar.from_csv(tzfile, weekend=weekend)
+
+        ##* keyed like the timezone table
+        for country_code in calendars:
+
+            if cls.CTZ.TZ_TABLE.find(fieldnames=["country_code"], checker=[country_code]) < 0:
+
+                raise CSVTimeZoneLoaderInitError(f"Unknown country code {country_code}")
+
+        return calendars
+
+    @classmethod
+    def create_schedule(cls: TimeFixType, rules: Iterable[RuleType] = ()) -> ScheduleType:
+
+        return Schedule(rules=rules, create=cls.from_instant)
+
+    @classmethod
+    def map_parallel(cls: TimeFixType, values: List[Any], op: str = "instant", workers: int = 0, chunksize: int = 65536, unit: str = "s", td_str: str = "+0000,UTC", pattern: str = "iso_fraction", parser: str = "") -> ParallelResultType:
+
+        ParallelWorker.check(op=op, unit=unit)
+
+        n: int
+        n = len(values)
+
+        width: int
+        width = cls.compile_format(pattern).WIDTH if op == "str" else 8
+
+        ##* results land here, nothing per item is pickled back
+        shm: shared_memory.SharedMemory
+        shm = shared_memory.SharedMemory(create=True, size=max(1, n * width))
+
+        options: Dict[str, Any]
+        options = {
+            "op": op,
+            "unit": unit,
+            "td_str": td_str,
+            "pattern": pattern,
+            "parser": parser,
+            "width": width,
+            "shm": shm.name,
+            "tzfile": cls.CTZ.TZ_FILE_PATH,
+        }
+
+        jobs: List[Tuple[int, List[Any]]]
+        jobs = [ (i, values[i:i + chunksize]) for i in range(0, n, chunksize) ]
+
+        errors: List[Tuple[int, int, str]]
+        errors = []
+
+        valid: bytearray
+        valid = bytearray(b"\x01") * n
+
+        try:
+
+            with multiprocessing.Pool(processes=workers or os.cpu_count(), initializer=ParallelWorker.init, initargs=(options,)) as pool:
+
+                for start, stop, error in pool.imap_unordered(ParallelWorker.run, jobs):
+
+                    if error:
+
+                        errors.append((start, stop, error))
+                        valid[start:stop] = bytes(stop - start)
+
+            errors.sort()
+
+            result: Union[DateTimeColumnType, List[str]]
+
+            if op == "instant":
+
+                instants: array.array
+                instants = array.array("q")
+                instants.frombytes(shm.buf[:n * 8])
+
+                result = cls.create_column(instants=instants, td_str=td_str)
+
+            else:
+
+                data: bytes
+                data = bytes(shm.buf[:n * width])
+
+                result = [ data[i:i + width].rstrip(b"\0").decode("utf-8") for i in range(0, n * width, width) ]
+
+        finally:
+
+            shm.close()
+            shm.unlink()
+
+        return ParallelResult(values=result, valid=valid, errors=errors)
+
+    @classmethod
+    def compile_format(cls: TimeFixType, pattern: str, precision: str = "us") -> FormatterType:
+
+        return Formatter(
+            pattern=pattern,
+            ctz=cls.CTZ,
+            month_names=cls.MONTH_NAMES,
+            month_fullnames=cls.MONTH_FULLNAMES,
+            weekday_names=cls.WEEKDAY_NAMES,
+            weekday_fullnames=cls.WEEKDAY_FULLNAMES,
+            precision=precision
+        )
+
     @classmethod
     def get_month(cls: TimeFixType, dt: DateTimeType) -> Tuple[int, str, str]:
 
@@ -1283,25 +2638,38 @@ class TimeFix(TimeFixType):
         return (wday, cls.WEEKDAY_NAMES[wday], cls.WEEKDAY_FULLNAMES[wday])
 
     @classmethod
-    def enhance_tm_sec(cls: TimeFixType, dt: DateTimeType, sec: int) -> DateTimeType:
+    def enhance_tm_month(cls: TimeFixType, dt: DateTimeType, month: int, policy: str = "clamp") -> DateTimeType:
 
-        dt.DATETIME = dt.enhance_tm_sec(sec).DATETIME
+        dt.DATETIME = dt.shift_months(month, policy)
 
         return dt
 
     @classmethod
-    def enhance_tm_ms(cls: TimeFixType, dt: DateTimeType, ms: int) -> DateTimeType:
+    def enhance_tm_years(cls: TimeFixType, dt: DateTimeType, years: int, policy: str = "clamp") -> DateTimeType:
+
+        dt.DATETIME = dt.shift_years(years, policy)
 
-        dt.DATETIME = dt.enhance_tm_ms(ms).DATETIME
-        
         return dt
 
+    @classmethod
+    def enhance_tm_sec(cls: TimeFixType, dt: DateTimeType, sec: int) -> DateTimeType:
+
+        return dt.advance_sec(sec)
+
+    @classmethod
+    def enhance_tm_ms(cls: TimeFixType, dt: DateTimeType, ms: int) -> DateTimeType:
+
+        return dt.advance_ms(ms)
+
     @classmethod
     def enhance_tm_us(cls: TimeFixType, dt: DateTimeType, us: int) -> DateTimeType:
 
-        dt.DATETIME = dt.enhance_tm_us(us).DATETIME
-        
-        return dt
+        return dt.advance_us(us)
+
+    @classmethod
+    def enhance_tm_ns(cls: TimeFixType, dt: DateTimeType, ns: int) -> DateTimeType:
+
+        return dt.advance_ns(ns)
 
     @classmethod
     def to_str(cls: TimeFixType, dt: DateTimeType) -> DateTimeType:
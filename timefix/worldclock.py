@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+
+import array
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar, Union
+from .kernel import CalendarKernel
+from .singletons import DateTimeColumnType, DateTimeType, FormatterType, WorldClockInitError, WorldClockType
+
+
+WorldClock: Any
+WorldClock = TypeVar('WorldClock', bound='WorldClock')
+
+class WorldClock(WorldClockType):
+
+    ##* td_str per zone, in the order given
+    ZONES: List[str]
+
+    ##* offset(seconds) per zone
+    OFFSETS: List[int]
+
+    ##* offset(seconds) -> zones sharing it
+    GROUPS: Dict[int, List[int]]
+
+    def __init__(self: WorldClock, zones: Iterable[str], formatter: Union[FormatterType, None] = None) -> None:
+
+        self.ZONES = list(zones)
+
+        if not self.ZONES:
+
+            raise WorldClockInitError("No zones given.")
+
+        self.OFFSETS = [ CalendarKernel.offset(td_str) for td_str in self.ZONES ]
+        self.GROUPS = {}
+
+        for i, o in enumerate(self.OFFSETS):
+
+            self.GROUPS.setdefault(o, []).append(i)
+
+        ##* distinct offsets, and the one each zone reads from
+        self.__offsets = list(self.GROUPS)
+        self.__slots = [ self.__offsets.index(o) for o in self.OFFSETS ]
+
+        self.__formatter = formatter
+        self.__names = [ td_str.split(",", 1)[1] if "," in td_str else "" for td_str in self.ZONES ]
+
+    def __repr__(self: WorldClock) -> str:
+
+        return f"<WorldClock bound zones({len(self.ZONES)}) offsets({len(self.GROUPS)}) at {hex(id(self))}>"
+
+    def __len__(self: WorldClock) -> int:
+
+        return len(self.ZONES)
+
+    def instants(self: WorldClock, values: Union[DateTimeColumnType, Iterable[int]]) -> Iterable[int]:
+
+        return values.INSTANTS if isinstance(values, DateTimeColumnType) else values
+
+    def ticks(self: WorldClock, values: Union[DateTimeColumnType, Iterable[int]]) -> int:
+
+        ##* columns carry their precision, plain instants are microseconds
+        return CalendarKernel.TICKS[values.PRECISION] if isinstance(values, DateTimeColumnType) else 1000000
+
+    def groups(self: WorldClock, instant: int, days: Dict[int, Tuple[int, int, int, int, int]], ticks: int = 1000000) -> List[Tuple[int, ...]]:
+
+        ##* fields once per offset, civil date once per local day, the fraction in ticks
+        out: List[Tuple[int, ...]]
+        out = []
+
+        U: int
+        U = 86400 * ticks
+
+        for o in self.__offsets:
+
+            z: int
+            t: int
+            z, t = divmod(instant + o * ticks, U)
+
+            day: Any
+            day = days.get(z)
+
+            if day is None:
+
+                Y: int
+                m: int
+                d: int
+                Y, m, d = CalendarKernel.civil_from_days(z)
+
+                day = (Y, m, d, (z + 3) % 7, CalendarKernel.yearday(Y, m, d))
+                days[z] = day
+
+            S: int
+            f: int
+            S, f = divmod(t, ticks)
+
+            out.append((day[0], day[1], day[2], S // 3600, S // 60 % 60, S % 60, f, day[3], day[4]))
+
+        return out
+
+    def fields(self: WorldClock, value: Union[DateTimeType, int]) -> List[Tuple[int, ...]]:
+
+        """fields(years, month, days, hours, minutes, seconds, microseconds, weekday, yearday) per zone"""
+
+        instant: int
+        instant = value.get_instant() if isinstance(value, DateTimeType) else value
+
+        groups: List[Tuple[int, ...]]
+        groups = self.groups(instant, {})
+
+        return [ groups[k] for k in self.__slots ]
+
+    def to_str(self: WorldClock, value: Union[DateTimeType, int]) -> List[str]:
+
+        formatter: FormatterType
+        formatter = self.formatter()
+
+        instant: int
+        instant = value.get_instant() if isinstance(value, DateTimeType) else value
+
+        return self.format(formatter, self.groups(instant, {}))
+
+    def format(self: WorldClock, formatter: FormatterType, groups: List[Tuple[int, ...]], ticks: int = 1000000) -> List[str]:
+
+        format_fields: Callable[..., str]
+        format_fields = formatter.format_fields
+
+        ##* formatters take microseconds and the digits below them apart, whatever their precision
+        split: int
+        split = ticks // 1000000
+
+        parts: List[Tuple[Tuple[int, ...], int]]
+        parts = [ (fields[:6] + (fields[6] // split,) + fields[7:], fields[6] % split) for fields in groups ] if split > 1 else [ (fields, 0) for fields in groups ]
+
+        if formatter.NAMED:
+
+            return [ format_fields(parts[k][0], o, n, parts[k][1]) for k, o, n in zip(self.__slots, self.OFFSETS, self.__names) ]
+
+        ##* same offset, same text
+        texts: List[str]
+        texts = [ format_fields(fields, o, "", x) for (fields, x), o in zip(parts, self.__offsets) ]
+
+        return [ texts[k] for k in self.__slots ]
+
+    def fields_many(self: WorldClock, values: Union[DateTimeColumnType, Iterable[int]]) -> List[Tuple[array.array, ...]]:
+
+        """fields_many(instants) -> per zone (years, month, days, hours, minutes, seconds, fraction) columns, fractions in the column ticks"""
+
+        ticks: int
+        ticks = self.ticks(values)
+
+        columns: List[Tuple[array.array, ...]]
+        columns = [ tuple(array.array("q") for _ in range(7)) for _ in self.__offsets ]
+
+        days: Dict[int, Tuple[int, int, int, int, int]]
+        days = {}
+
+        for instant in self.instants(values):
+
+            for group, fields in zip(columns, self.groups(instant, days, ticks)):
+
+                for column, field in zip(group, fields):
+
+                    column.append(field)
+
+        ##* zones sharing an offset share the columns
+        return [ columns[k] for k in self.__slots ]
+
+    def to_str_many(self: WorldClock, values: Union[DateTimeColumnType, Iterable[int]]) -> List[List[str]]:
+
+        """to_str_many(instants) -> per zone list of strings"""
+
+        formatter: FormatterType
+        formatter = self.formatter()
+
+        out: List[List[str]]
+        out = [ [] for _ in self.ZONES ]
+
+        appends: List[Callable[[str], None]]
+        appends = [ texts.append for texts in out ]
+
+        days: Dict[int, Tuple[int, int, int, int, int]]
+        days = {}
+
+        ticks: int
+        ticks = self.ticks(values)
+
+        for instant in self.instants(values):
+
+            for append, text in zip(appends, self.format(formatter, self.groups(instant, days, ticks), ticks)):
+
+                append(text)
+
+        return out
+
+    def formatter(self: WorldClock) -> FormatterType:
+
+        if self.__formatter is None:
+
+            raise WorldClockInitError("No formatter given.")
+
+        return self.__formatter